@@ -0,0 +1,194 @@
+# answer_cache.py
+# Disk-backed cache for answers from remote sources (Wikipedia, DuckDuckGo, OpenAI).
+#
+# One SQLite file in WAL mode, so every Streamlit worker process on the host shares
+# the entries and the hit/miss counters, and both survive restarts.
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from functools import wraps
+from typing import Callable, Dict, Optional, Tuple
+
+CACHE_PATH = os.environ.get("ANSWER_CACHE_PATH", "answer_cache.sqlite3")
+
+# Seconds an answer stays fresh, per source
+DEFAULT_TTLS = {
+    "wikipedia": 7 * 24 * 3600,
+    "duckduckgo": 24 * 3600,
+    "openai": 30 * 24 * 3600,
+}
+# Misses are cached too, but briefly: an upstream may just have been down
+DEFAULT_NEGATIVE_TTL = 15 * 60
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    source TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT,
+    expires REAL NOT NULL,
+    last_access REAL NOT NULL,
+    PRIMARY KEY (source, key)
+);
+CREATE INDEX IF NOT EXISTS answers_last_access ON answers (last_access);
+CREATE TABLE IF NOT EXISTS stats (
+    source TEXT PRIMARY KEY,
+    hits INTEGER NOT NULL DEFAULT 0,
+    negative_hits INTEGER NOT NULL DEFAULT 0,
+    misses INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+def _is_word_char(ch: str) -> bool:
+    # Letters, combining marks (Devanagari vowel signs etc.) and digits of any script, plus c++/c#
+    return unicodedata.category(ch)[0] in "LMN" or ch in "_+#"
+
+
+def canonical_query(query: str) -> str:
+    """
+    Case, punctuation and spacing differences map to the same key. Words in
+    any script are kept intact; "" means the query is uncacheable.
+    """
+    text = unicodedata.normalize("NFKC", query).casefold()
+    words, current = [], []
+    for ch in text:
+        if _is_word_char(ch):
+            current.append(ch)
+        elif current:
+            words.append("".join(current))
+            current = []
+    if current:
+        words.append("".join(current))
+    return " ".join(words)
+
+
+class AnswerCache:
+    """
+    (source, canonical query) -> answer, with None stored for negative entries.
+    Each thread gets its own connection; writers on other processes are
+    serialized by SQLite and waited for up to `busy_timeout` seconds.
+    Once the table grows past `max_entries`, expired rows go first, then the
+    least recently used ones.
+    """
+
+    def __init__(self, path: str = CACHE_PATH, ttls: Optional[Dict[str, float]] = None,
+                 negative_ttl: float = DEFAULT_NEGATIVE_TTL, max_entries: int = 50000,
+                 busy_timeout: float = 5.0):
+        self.path = path
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._writes = 0
+        with self._conn() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _count(self, source: str, column: str) -> None:
+        self._conn().execute(
+            f"INSERT INTO stats (source, {column}) VALUES (?, 1) "
+            f"ON CONFLICT(source) DO UPDATE SET {column} = {column} + 1", (source,))
+
+    def get(self, source: str, query: str) -> Tuple[bool, Optional[str]]:
+        """(found, value); found with value None is a cached miss."""
+        key = canonical_query(query)
+        if not key:
+            return False, None
+        now = time.time()
+        conn = self._conn()
+        row = conn.execute("SELECT value, expires FROM answers WHERE source = ? AND key = ?",
+                           (source, key)).fetchone()
+        if row is None or row[1] < now:
+            self._count(source, "misses")
+            return False, None
+        conn.execute("UPDATE answers SET last_access = ? WHERE source = ? AND key = ?", (now, source, key))
+        self._count(source, "hits" if row[0] is not None else "negative_hits")
+        return True, row[0]
+
+    def get_stale(self, source: str, query: str) -> Optional[str]:
+        """Last stored answer even if expired (not yet evicted); not counted in the stats."""
+        key = canonical_query(query)
+        if not key:
+            return None
+        row = self._conn().execute("SELECT value FROM answers WHERE source = ? AND key = ?",
+                                   (source, key)).fetchone()
+        return row[0] if row else None
+
+    def set(self, source: str, query: str, value: Optional[str]) -> None:
+        key = canonical_query(query)
+        if not key:
+            return
+        now = time.time()
+        ttl = self.ttls.get(source, DEFAULT_NEGATIVE_TTL) if value is not None else self.negative_ttl
+        self._conn().execute(
+            "INSERT OR REPLACE INTO answers (source, key, value, expires, last_access) VALUES (?, ?, ?, ?, ?)",
+            (source, key, value, now + ttl, now))
+        self._writes += 1
+        if self._writes % 100 == 0:
+            self.evict()
+
+    def evict(self) -> int:
+        """Drop expired rows, then the least recently used ones beyond max_entries."""
+        conn = self._conn()
+        removed = conn.execute("DELETE FROM answers WHERE expires < ?", (time.time(),)).rowcount
+        excess = conn.execute("SELECT COUNT(*) FROM answers").fetchone()[0] - self.max_entries
+        if excess > 0:
+            removed += conn.execute(
+                "DELETE FROM answers WHERE rowid IN "
+                "(SELECT rowid FROM answers ORDER BY last_access LIMIT ?)", (excess,)).rowcount
+        return removed
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        rows = self._conn().execute("SELECT source, hits, negative_hits, misses FROM stats ORDER BY source")
+        return {source: {"hits": h, "negative_hits": n, "misses": m} for source, h, n, m in rows}
+
+    def clear(self) -> None:
+        conn = self._conn()
+        conn.execute("DELETE FROM answers")
+        conn.execute("DELETE FROM stats")
+
+    def cached(self, source: str, transient: Tuple[type, ...] = ()) -> Callable:
+        """
+        Decorator for fetch(query) -> Optional[str] functions. A None result is
+        cached as a miss; exceptions in `transient` (outages, timeouts, open
+        breakers) return None without caching anything.
+        """
+        def decorator(fetch: Callable[[str], Optional[str]]):
+            @wraps(fetch)
+            def wrapper(query: str) -> Optional[str]:
+                found, value = self.get(source, query)
+                if found:
+                    return value
+                try:
+                    value = fetch(query)
+                except transient:
+                    return None
+                self.set(source, query, value)
+                return value
+            wrapper.uncached = fetch
+            return wrapper
+        return decorator
+
+
+_cache: Optional[AnswerCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_answer_cache() -> AnswerCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = AnswerCache()
+    return _cache
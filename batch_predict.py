@@ -0,0 +1,51 @@
+# batch_predict.py
+from typing import Callable, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+
+class TopKResult(NamedTuple):
+    ids: np.ndarray      # (n_texts, k) int32 class indices, best first
+    scores: np.ndarray   # (n_texts, k) float32 probabilities
+    classes: np.ndarray  # class labels, indexed by `ids`
+
+    def labels(self) -> np.ndarray:
+        return self.classes[self.ids]
+
+
+def topk_rows(probs: np.ndarray, k: int):
+    """Top-k column indices and values per row, best first, without a full sort."""
+    n_classes = probs.shape[1]
+    k = max(1, min(k, n_classes))
+    if k < n_classes:
+        part = np.argpartition(probs, n_classes - k, axis=1)[:, n_classes - k:]
+    else:
+        part = np.tile(np.arange(n_classes), (probs.shape[0], 1))
+    part_scores = np.take_along_axis(probs, part, axis=1)
+    order = np.argsort(-part_scores, axis=1, kind="stable")
+    ids = np.take_along_axis(part, order, axis=1).astype(np.int32)
+    return ids, np.take_along_axis(part_scores, order, axis=1).astype(np.float32)
+
+
+def predict_topk_batch(texts: Sequence[str], k: int = 3, model=None, vectorizer=None,
+                       preprocess: Optional[Callable[[str], str]] = None) -> TopKResult:
+    """
+    Top-k career predictions for a whole list of texts: one vectorizer.transform,
+    one predict_proba over the sparse batch and one argpartition.
+    Defaults to career_model.pkl / vectorizer.pkl from the shared model registry.
+    """
+    if model is None or vectorizer is None:
+        from model_registry import get_registry
+        registry = get_registry()
+        model = model if model is not None else registry.get("career_model")
+        vectorizer = vectorizer if vectorizer is not None else registry.get("vectorizer")
+    texts = ["" if t is None else str(t) for t in texts]
+    if preprocess is not None:
+        texts = [preprocess(t) for t in texts]
+    classes = np.asarray(model.classes_)
+    if not texts:
+        empty = np.empty((0, max(1, min(k, len(classes)))))
+        return TopKResult(empty.astype(np.int32), empty.astype(np.float32), classes)
+    probs = model.predict_proba(vectorizer.transform(texts))
+    ids, scores = topk_rows(probs, k)
+    return TopKResult(ids, scores, classes)
@@ -0,0 +1,124 @@
+# bert_inference.py
+# Batched CPU inference for the fine-tuned BERT career classifier (career_bert_model).
+#
+#   python bert_inference.py --csv descriptions_to_predict.csv --threads 4   # throughput vs per-row loop
+import argparse
+import pickle
+import time
+from collections import OrderedDict
+from typing import List, Optional, Sequence
+
+import numpy as np
+import torch
+from transformers import BertForSequenceClassification, BertTokenizer
+
+
+class BertInferenceEngine:
+    """
+    Takes lists of descriptions, sorts them by token length into batches,
+    pads each batch only to its own longest sequence and runs one forward pass
+    per batch under torch.inference_mode(). Token ids for repeated strings are
+    served from an LRU cache. Sequences are truncated at the tokenizer's own
+    limit (512 for BERT), like the per-row loop; a smaller `max_length` is
+    faster on long descriptions but may change their predictions.
+    """
+
+    def __init__(self, model_dir: str = "career_bert_model", label_encoder_path: str = "label_encoder.pkl",
+                 batch_size: int = 32, max_length: Optional[int] = None, num_threads: Optional[int] = None,
+                 cache_size: int = 4096):
+        if num_threads:
+            torch.set_num_threads(num_threads)
+        self.tokenizer = BertTokenizer.from_pretrained(model_dir)
+        self.model = BertForSequenceClassification.from_pretrained(model_dir)
+        self.model.eval()
+        with open(label_encoder_path, "rb") as f:
+            self.label_encoder = pickle.load(f)
+        self.batch_size = batch_size
+        self.max_length = max_length or self.tokenizer.model_max_length
+        self.cache_size = cache_size
+        self._token_cache: "OrderedDict[str, List[int]]" = OrderedDict()
+
+    def _encode(self, text: str) -> List[int]:
+        ids = self._token_cache.get(text)
+        if ids is not None:
+            self._token_cache.move_to_end(text)
+            return ids
+        ids = self.tokenizer(text, truncation=True, max_length=self.max_length)["input_ids"]
+        self._token_cache[text] = ids
+        if len(self._token_cache) > self.cache_size:
+            self._token_cache.popitem(last=False)
+        return ids
+
+    def predict_ids(self, texts: Sequence[str]) -> np.ndarray:
+        """Class index per text, in input order."""
+        texts = ["" if t is None else str(t) for t in texts]
+        uniques = list(dict.fromkeys(texts))
+        encoded = [self._encode(t) for t in uniques]
+        order = sorted(range(len(uniques)), key=lambda i: len(encoded[i]))
+        preds = np.empty(len(uniques), dtype=np.int64)
+        with torch.inference_mode():
+            for start in range(0, len(order), self.batch_size):
+                batch_idx = order[start:start + self.batch_size]
+                batch = self.tokenizer.pad({"input_ids": [encoded[i] for i in batch_idx]},
+                                           padding="longest", return_tensors="pt")
+                logits = self.model(**batch).logits
+                preds[batch_idx] = logits.argmax(dim=1).numpy()
+        position = {t: i for i, t in enumerate(uniques)}
+        return preds[[position[t] for t in texts]]
+
+    def predict(self, texts: Sequence[str]) -> np.ndarray:
+        """Career label per text, in input order."""
+        if len(texts) == 0:
+            return np.array([], dtype=object)
+        return self.label_encoder.inverse_transform(self.predict_ids(texts))
+
+
+# --- Throughput benchmark ---
+def per_row_loop(engine: BertInferenceEngine, texts: Sequence[str]) -> List[str]:
+    """The previous predict.py behaviour: one tokenizer call and forward pass per text."""
+    out = []
+    for text in texts:
+        inputs = engine.tokenizer(text, return_tensors="pt", truncation=True, padding=True)
+        outputs = engine.model(**inputs)
+        pred = torch.argmax(outputs.logits, dim=1)
+        out.append(engine.label_encoder.inverse_transform(pred.detach().numpy())[0])
+    return out
+
+
+def benchmark(engine: BertInferenceEngine, texts: Sequence[str]):
+    """Rows per second for the per-row loop and the batched engine (cold token cache)."""
+    start = time.perf_counter()
+    loop_preds = per_row_loop(engine, texts)
+    loop_rps = len(texts) / (time.perf_counter() - start)
+    engine._token_cache.clear()
+    start = time.perf_counter()
+    batch_preds = engine.predict(texts)
+    batch_rps = len(texts) / (time.perf_counter() - start)
+    agreement = float(np.mean(np.asarray(loop_preds) == batch_preds)) if len(texts) else 1.0
+    return loop_rps, batch_rps, agreement
+
+
+if __name__ == "__main__":
+    import pandas as pd
+
+    parser = argparse.ArgumentParser(description="Benchmark batched BERT inference")
+    parser.add_argument("--csv", default="descriptions_to_predict.csv")
+    parser.add_argument("--column", default="description")
+    parser.add_argument("--threads", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--max-length", type=int, default=None,
+                        help="truncate below the tokenizer limit (faster, may change long-text predictions)")
+    parser.add_argument("--repeat", type=int, default=20, help="repeat the file to get a stable measurement")
+    args = parser.parse_args()
+
+    texts = pd.read_csv(args.csv)[args.column].astype(str).tolist() * args.repeat
+    # Distinct strings so the token cache doesn't flatter the batched path
+    texts = [f"{t} ({i})" for i, t in enumerate(texts)]
+    engine = BertInferenceEngine(batch_size=args.batch_size, max_length=args.max_length,
+                                 num_threads=args.threads)
+    loop_rps, batch_rps, agreement = benchmark(engine, texts)
+    print(f"threads={torch.get_num_threads()} batch_size={args.batch_size} max_length={engine.max_length} "
+          f"rows={len(texts)}")
+    print(f"per-row loop: {loop_rps:8.1f} rows/s")
+    print(f"batched     : {batch_rps:8.1f} rows/s ({batch_rps / loop_rps:.1f}x)")
+    print(f"agreement   : {agreement:.1%}")
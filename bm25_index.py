@@ -0,0 +1,111 @@
+# bm25_index.py
+# Prebuilt inverted index with BM25 scoring over labelled descriptions (career_data.csv).
+import bisect
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Words too common in "I enjoy / I like ..." descriptions to say anything about a career
+STOP_WORDS = frozenset("""
+a an and are as at be but by for from has have i in is it its like love enjoy my of on or
+so that the their them they this to want was we with you your am me about into who what
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in re.findall(r"[a-z0-9]+", text.lower()) if len(t) > 2 and t not in STOP_WORDS]
+
+
+class BM25Index:
+    """
+    Each posting list stores the doc ids containing a term and that term's
+    precomputed BM25 contribution for each doc, so a query is a handful of
+    NumPy gathers and adds. Doc scores are reduced to one score per label
+    (the best matching description) before ranking.
+    """
+
+    def __init__(self, docs: Sequence[Tuple[str, str]], k1: float = 1.5, b: float = 0.75):
+        texts = [t for t, _ in docs]
+        labels = [l for _, l in docs]
+        self.labels, self._doc_label = np.unique(np.asarray(labels, dtype=object), return_inverse=True) \
+            if labels else (np.array([], dtype=object), np.array([], dtype=np.int64))
+        self.n_docs = len(texts)
+
+        term_docs: Dict[str, Dict[int, int]] = {}
+        doc_len = np.zeros(self.n_docs, dtype=np.float32)
+        for doc_id, text in enumerate(texts):
+            tokens = tokenize(text)
+            doc_len[doc_id] = len(tokens)
+            for t in tokens:
+                tfs = term_docs.setdefault(t, {})
+                tfs[doc_id] = tfs.get(doc_id, 0) + 1
+        avg_len = float(doc_len.mean()) if self.n_docs else 0.0
+        norm = k1 * (1 - b + b * doc_len / max(avg_len, 1e-9))
+
+        self.postings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for term, tfs in term_docs.items():
+            ids = np.fromiter(tfs.keys(), dtype=np.int32, count=len(tfs))
+            tf = np.fromiter(tfs.values(), dtype=np.float32, count=len(tfs))
+            idf = np.log(1 + (self.n_docs - len(tfs) + 0.5) / (len(tfs) + 0.5))
+            self.postings[term] = (ids, (idf * tf * (k1 + 1) / (tf + norm[ids])).astype(np.float32))
+        self.vocabulary = sorted(self.postings)
+
+    # --- Query expansion ---
+    def _prefix_terms(self, token: str, limit: int = 10) -> List[str]:
+        start = bisect.bisect_left(self.vocabulary, token)
+        out = []
+        for term in self.vocabulary[start:start + limit]:
+            if not term.startswith(token):
+                break
+            out.append(term)
+        return out
+
+    def expand(self, tokens: List[str], mode: Optional[str]) -> List[Tuple[str, float]]:
+        """(term, weight) pairs; expanded terms count half as much as exact hits."""
+        terms = {}
+        for token in tokens:
+            if token in self.postings:
+                terms[token] = 1.0
+                continue
+            if mode == "prefix" and len(token) >= 4:
+                for term in self._prefix_terms(token):
+                    terms.setdefault(term, 0.5)
+        return list(terms.items())
+
+    def search(self, query: str, top_k: int = 4, min_score: float = 0.0,
+               expand: Optional[str] = "prefix") -> List[Tuple[str, float]]:
+        """Best (label, score) pairs, highest first, keeping labels scoring above min_score."""
+        terms = self.expand(tokenize(query), expand)
+        if not terms or self.n_docs == 0:
+            return []
+        scores = np.zeros(self.n_docs, dtype=np.float32)
+        for term, weight in terms:
+            ids, contrib = self.postings[term]
+            scores[ids] += weight * contrib
+        hit = np.flatnonzero(scores)
+        label_scores = np.zeros(len(self.labels), dtype=np.float32)
+        np.maximum.at(label_scores, self._doc_label[hit], scores[hit])
+        k = min(top_k, len(label_scores))
+        top = np.argpartition(-label_scores, k - 1)[:k]
+        top = top[np.argsort(-label_scores[top], kind="stable")]
+        return [(self.labels[i], float(label_scores[i])) for i in top if label_scores[i] > min_score]
+
+
+if __name__ == "__main__":
+    import time
+    from knowledge_base import get_kb
+
+    # Grow career_data.csv to 100k descriptions and time get_response-style queries
+    examples = get_kb().examples
+    docs = [(f"{text} {i}", career) for i in range(100_000 // len(examples) + 1)
+            for text, career in examples][:100_000]
+    index = BM25Index(docs)
+    queries = ["I love building mobile apps", "helping patients in a hospital",
+               "designing logos and brands", "analysing financial markets", "teach kids math"]
+    start = time.perf_counter()
+    for _ in range(200):
+        for q in queries:
+            index.search(q)
+    per_query = (time.perf_counter() - start) / (200 * len(queries))
+    print(f"{len(docs):,} descriptions: {per_query * 1e3:.3f} ms/query")
@@ -0,0 +1,167 @@
+# build_knowledge_base.py
+# Merges every career data source into one validated, versioned artifact
+# (career_kb.pkl) that app.py, chatbot.py, recommender.py and predict_career.py
+# load once per process.
+import ast
+import csv
+import hashlib
+import json
+import os
+import pickle
+import sys
+from datetime import datetime, timezone
+
+SCHEMA_VERSION = 1
+SOURCES_FILE = "career_kb_sources.py"
+CAREER_PAIRS_CSV = "career_pairs.csv"
+CAREER_INFO_JSON = "career_info.json"
+RECOMMENDER_JSON = "recommender.json"
+CAREER_DATA_CSV = "career_data.csv"
+OUTPUT_FILE = "career_kb.pkl"
+
+# career_info.json was generated with placeholder text; never let it win
+PLACEHOLDER_MARKER = "(Add a detailed description here.)"
+
+
+# --- Source loading ---
+def find_duplicate_keys(path=SOURCES_FILE):
+    """Return {dict_name: [(key, first_line, dup_line, same_value)]} for literal duplicates."""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    duplicates = {}
+    for node in tree.body:
+        if not (isinstance(node, ast.Assign) and isinstance(node.value, ast.Dict)):
+            continue
+        name = node.targets[0].id
+        seen = {}
+        for key, value in zip(node.value.keys, node.value.values):
+            if not isinstance(key, ast.Constant):
+                continue
+            dump = ast.dump(value)
+            if key.value in seen:
+                first_line, first_dump = seen[key.value]
+                duplicates.setdefault(name, []).append(
+                    (key.value, first_line, key.lineno, first_dump == dump))
+            seen[key.value] = (key.lineno, dump)
+    return duplicates
+
+
+def load_sources(path=SOURCES_FILE):
+    with open(path, encoding="utf-8") as f:
+        namespace = {}
+        exec(compile(f.read(), path, "exec"), namespace)
+    return namespace
+
+
+def read_career_pairs(path=CAREER_PAIRS_CSV):
+    info = {}
+    if not os.path.exists(path):
+        return info
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            career = (row.get("career") or "").strip()
+            if not career:
+                continue
+            steps = [s.strip() for s in (row.get("next_steps") or "").split(",") if s.strip()]
+            info[career] = {"description": (row.get("description") or "").strip(), "next_steps": steps}
+    return info
+
+
+def read_json(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def read_examples(path=CAREER_DATA_CSV):
+    if not os.path.exists(path):
+        return []
+    with open(path, newline="", encoding="utf-8") as f:
+        return [(row["description"], row["career"]) for row in csv.DictReader(f)
+                if row.get("description") and row.get("career")]
+
+
+def fingerprint(paths):
+    digest = hashlib.sha256()
+    for path in paths:
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+# --- Validation ---
+def validate(kb):
+    errors = []
+    for career, info in kb["career_info"].items():
+        if not isinstance(info.get("description"), str) or not info["description"]:
+            errors.append(f"career_info['{career}'] has no description")
+        if not isinstance(info.get("next_steps"), list):
+            errors.append(f"career_info['{career}'].next_steps is not a list")
+    for career, courses in kb["career_courses"].items():
+        for course in courses:
+            if len(course) != 2 or not str(course[1]).startswith("http"):
+                errors.append(f"career_courses['{career}'] has a malformed course: {course!r}")
+    for key, skills in kb["skills"].items():
+        if key != key.lower() or not isinstance(skills, list):
+            errors.append(f"skills['{key}'] must be a lowercase key with a list of skills")
+    for phrase, career in kb["phrase_career_map"].items():
+        if phrase != phrase.lower() or not isinstance(career, str):
+            errors.append(f"phrase_career_map['{phrase}'] must be a lowercase phrase -> career")
+    return errors
+
+
+# --- Build ---
+def build(strict=False):
+    """Compile the knowledge base. Conflicting duplicate keys always fail; strict fails on any duplicate."""
+    duplicates = find_duplicate_keys()
+    for name, dups in duplicates.items():
+        for key, first_line, dup_line, same in dups:
+            kind = "identical" if same else "CONFLICTING"
+            print(f"⚠️ {name}: {kind} duplicate key '{key}' (lines {first_line} and {dup_line})")
+    found = [d for dups in duplicates.values() for d in dups if strict or not d[3]]
+    if found:
+        raise SystemExit(f"❌ {len(found)} {'duplicate' if strict else 'conflicting duplicate'} keys "
+                         f"in {SOURCES_FILE}; keep one entry per key")
+
+    sources = load_sources()
+
+    # Curated entries win over career_pairs.csv, which wins over career_info.json
+    career_info = {}
+    for career, info in read_json(CAREER_INFO_JSON).items():
+        if PLACEHOLDER_MARKER not in info.get("description", ""):
+            career_info[career] = info
+    career_info.update(read_career_pairs())
+    career_info.update(sources["career_info"])
+
+    skills = {k.lower(): v for k, v in sources["skills_fallback"].items()}
+    skills.update({k.lower(): v.get("next_steps", []) for k, v in career_info.items()})
+
+    kb = {
+        "schema_version": SCHEMA_VERSION,
+        "career_info": career_info,
+        "career_courses": {k: [tuple(c) for c in v] for k, v in sources["career_courses"].items()},
+        "skills": skills,
+        "phrase_career_map": dict(sources["phrase_career_map"]),
+        "recommendations": read_json(RECOMMENDER_JSON),
+        "job_recommendations": dict(sources["job_recommendations"]),
+        "examples": read_examples(),
+    }
+    errors = validate(kb)
+    if errors:
+        raise SystemExit("❌ Knowledge base validation failed:\n- " + "\n- ".join(errors))
+
+    kb["version"] = fingerprint([SOURCES_FILE, CAREER_PAIRS_CSV, CAREER_INFO_JSON,
+                                 RECOMMENDER_JSON, CAREER_DATA_CSV])
+    kb["built_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    return kb
+
+
+if __name__ == "__main__":
+    kb = build(strict="--strict" in sys.argv)
+    with open(OUTPUT_FILE, "wb") as f:
+        pickle.dump(kb, f, protocol=pickle.HIGHEST_PROTOCOL)
+    print(f"✅ {OUTPUT_FILE} v{kb['version']}: {len(kb['career_info'])} careers, "
+          f"{len(kb['career_courses'])} course lists, {len(kb['skills'])} skill sets, "
+          f"{len(kb['phrase_career_map'])} phrases, {len(kb['examples'])} examples")
@@ -0,0 +1,186 @@
+# build_wiki_snapshot.py
+# Builds wiki_snapshot.pkl.gz: a Wikipedia intro summary for every career in career_kb.pkl.
+#
+#   python build_wiki_snapshot.py --dump enwiki-latest-pages-articles.xml.bz2
+#   python build_wiki_snapshot.py --jsonl export.jsonl      # {"title", "summary", "url"} per line
+#   python build_wiki_snapshot.py --export                  # one-time fetch via the MediaWiki API
+import argparse
+import bz2
+import gzip
+import hashlib
+import json
+import pickle
+import re
+import sys
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from typing import Dict, Iterator, Tuple
+
+from knowledge_base import get_kb
+from wiki_snapshot import SNAPSHOT_FILE
+
+WIKI_URL = "https://en.wikipedia.org/wiki/"
+
+
+def career_names():
+    kb = get_kb()
+    return sorted({name.strip() for name in kb.career_info if name.strip()})
+
+
+def page_url(title: str) -> str:
+    return WIKI_URL + title.replace(" ", "_")
+
+
+# --- Dump parsing ---
+def _strip_nested(text: str, open_: str, close: str) -> str:
+    out, depth, i = [], 0, 0
+    while i < len(text):
+        if text.startswith(open_, i):
+            depth += 1
+            i += len(open_)
+        elif depth and text.startswith(close, i):
+            depth -= 1
+            i += len(close)
+        else:
+            if not depth:
+                out.append(text[i])
+            i += 1
+    return "".join(out)
+
+
+def wikitext_intro(text: str) -> str:
+    """Plain text of the lead section: templates, tables, refs, files and markup removed."""
+    lead = re.split(r"\n==[^=]", text, maxsplit=1)[0]
+    lead = _strip_nested(lead, "{{", "}}")
+    lead = _strip_nested(lead, "{|", "|}")
+    lead = re.sub(r"<ref[^>]*/>|<ref[^>]*>.*?</ref>|<!--.*?-->", "", lead, flags=re.S)
+    lead = re.sub(r"\[\[(?:File|Image|Category):[^\]]*(?:\[\[[^\]]*\]\][^\]]*)*\]\]", "", lead)
+    lead = re.sub(r"\[\[(?:[^|\]]*\|)?([^\]]*)\]\]", r"\1", lead)
+    lead = re.sub(r"\[https?://\S+ ([^\]]*)\]", r"\1", lead)
+    lead = re.sub(r"'{2,}|<[^>]+>", "", lead)
+    paragraphs = [" ".join(p.split()) for p in lead.split("\n\n")]
+    return " ".join(p for p in paragraphs if p)
+
+
+def iter_dump(path: str) -> Iterator[Tuple[str, str, str]]:
+    """(title, redirect_target or '', wikitext) for main-namespace pages of a pages-articles dump."""
+    opener = bz2.open if path.endswith(".bz2") else open
+    with opener(path, "rb") as f:
+        for _, elem in ET.iterparse(f, events=("end",)):
+            if not elem.tag.endswith("}page"):
+                continue
+            ns = elem.find("{*}ns")
+            if ns is not None and ns.text == "0":
+                redirect = elem.find("{*}redirect")
+                text = elem.find("{*}revision/{*}text")
+                yield (elem.findtext("{*}title", ""),
+                       redirect.get("title", "") if redirect is not None else "",
+                       (text.text or "") if text is not None else "")
+            elem.clear()
+
+
+def from_dump(path: str, careers) -> Tuple[Dict, Dict]:
+    wanted = {c.lower() for c in careers}
+    articles, aliases, redirects = {}, {}, {}
+
+    def keep(title, text):
+        summary = wikitext_intro(text)
+        if summary and "may refer to" not in summary:
+            articles[title] = {"title": title, "summary": summary, "url": page_url(title)}
+
+    for title, redirect, text in iter_dump(path):
+        key = title.lower()
+        if key not in wanted:
+            continue
+        if redirect:
+            redirects[key] = redirect
+        else:
+            keep(title, text)
+            aliases[key] = title
+    # Second pass only for redirect targets that are not careers themselves
+    targets = {t for t in redirects.values() if t not in articles}
+    if targets:
+        for title, redirect, text in iter_dump(path):
+            if title in targets and not redirect:
+                keep(title, text)
+    aliases.update(redirects)
+    return articles, {a: t for a, t in aliases.items() if t in articles}
+
+
+# --- JSONL export / live export ---
+def from_pages(pages, careers) -> Tuple[Dict, Dict]:
+    wanted = {c.lower(): c for c in careers}
+    articles, aliases = {}, {}
+    for name, page in pages:
+        if not page or not page.get("summary"):
+            continue
+        articles[page["title"]] = {"title": page["title"], "summary": page["summary"],
+                                   "url": page.get("url") or page_url(page["title"])}
+        aliases[name.lower()] = page["title"]
+        if page["title"].lower() in wanted:
+            aliases[page["title"].lower()] = page["title"]
+    return articles, aliases
+
+
+def read_jsonl(path: str, careers):
+    wanted = {c.lower() for c in careers}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                page = json.loads(line)
+                name = page.get("career", page.get("title", ""))
+                if name.lower() in wanted:
+                    yield name, page
+
+
+def export_live(careers):
+    from http_client import SourceUnavailable
+    from wiki_lookup import WikiLookup
+
+    lookup = WikiLookup(deadline=15.0, min_score=0.5)
+    for i, career in enumerate(careers, 1):
+        try:
+            page = lookup.lookup(career, sentences=10)
+        except SourceUnavailable:
+            page = None
+        print(f"[{i}/{len(careers)}] {career}: {page['title'] if page else '—'}", file=sys.stderr)
+        yield career, page
+
+
+def build(args) -> Dict:
+    careers = career_names()
+    if args.dump:
+        articles, aliases = from_dump(args.dump, careers)
+        source = f"dump:{args.dump}"
+    elif args.jsonl:
+        articles, aliases = from_pages(read_jsonl(args.jsonl, careers), careers)
+        source = f"jsonl:{args.jsonl}"
+    else:
+        articles, aliases = from_pages(export_live(careers), careers)
+        source = "export:mediawiki-api"
+    digest = hashlib.sha256(json.dumps(articles, sort_keys=True).encode()).hexdigest()[:12]
+    return {
+        "version": digest,
+        "built_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "source": source,
+        "kb_version": get_kb().version,
+        "articles": articles,
+        "aliases": aliases,
+        "missing": [c for c in careers if c.lower() not in aliases],
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the offline Wikipedia snapshot for KB careers")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--dump", help="pages-articles XML dump (.xml or .xml.bz2)")
+    group.add_argument("--jsonl", help="one {'title'|'career', 'summary', 'url'} object per line")
+    group.add_argument("--export", action="store_true", help="fetch every career once from the MediaWiki API")
+    parser.add_argument("--out", default=SNAPSHOT_FILE)
+    args = parser.parse_args()
+
+    snapshot = build(args)
+    with gzip.open(args.out, "wb") as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    print(f"✅ {args.out} v{snapshot['version']}: {len(snapshot['articles'])} articles, "
+          f"{len(snapshot['aliases'])} names, {len(snapshot['missing'])} careers without a page")
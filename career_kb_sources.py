@@ -0,0 +1,1159 @@
+# career_kb_sources.py
+# Hand-curated knowledge base sources. Edit these dicts, then run
+# `python build_knowledge_base.py` to compile career_kb.pkl; the apps read the
+# compiled artifact, not this file.
+
+# ---------------- Career Info ----------------
+career_info = {
+    "Software Engineer": {
+        "description": "Designs, develops, tests and maintains software applications.",
+        "next_steps": ["Learn Python/Java/C++", "Build personal projects", "Study algorithms and data structures"]
+    },
+    "Data Scientist": {
+        "description": "Analyzes large datasets to extract insights and build predictive models.",
+        "next_steps": ["Learn Python/R", "Study statistics & ML", "Work on Kaggle projects"]
+    },
+    "AI/ML Engineer": {"description": "Designs, trains and deploys machine learning and deep learning models.","next_steps": ["Learn TensorFlow/PyTorch", "Practice with real datasets", "Study model deployment"]},
+    "UX/UI Designer": {"description": "Designs intuitive interfaces and user experiences for digital products.","next_steps": ["Master Figma/Sketch", "Build prototypes", "Study human-centered design"]},
+    "Digital Marketer": {"description": "Promotes products and brands online using social, search, and ads.","next_steps": ["Learn SEO/SEM", "Run small ad campaigns", "Analyze marketing metrics"]},
+    "Full Stack Developer": {"description": "Works across front-end and back-end to deliver end-to-end solutions.","next_steps": ["Combine front-end & back-end skills", "Build full-stack projects", "Deploy apps to cloud"]},
+    "Data Analyst": {"description": "Interprets data, builds dashboards, and supports decision-making with analytics.","next_steps": ["Learn SQL, Excel, Python", "Learn visualization (Tableau/PowerBI)", "Build analytic dashboards"]},
+    "Research Scientist (AI/ML)": {"description": "Conducts original research to advance algorithms and models.","next_steps": ["Pursue advanced degrees or research projects", "Read/implement papers", "Publish and collaborate"]},
+    "Computer Vision Engineer": {"description": "Builds systems that interpret images and video.","next_steps": ["Study convolutional networks", "Work with OpenCV and deep learning", "Build object detection projects"]},
+    "NLP Engineer": {"description": "Builds applications that understand and generate human language.","next_steps": ["Learn transformers and NLP libraries", "Work on text projects", "Study language modeling"]},
+    "DevOps Engineer": {"description": "Automates and manages CI/CD pipelines and infrastructure.","next_steps": ["Learn Docker, Kubernetes", "Understand CI/CD (Jenkins/GitHub Actions)", "Practice infra-as-code"]},
+    "Cloud Engineer": {"description": "Designs and maintains cloud infrastructure and services.","next_steps": ["Learn AWS/Azure/GCP", "Get cloud certifications", "Deploy scalable services"]},
+    "Site Reliability Engineer": {"description": "Improves reliability, scalability, and performance of systems.","next_steps": ["Learn monitoring tools", "Understand capacity planning", "Practice incident response"]},
+    "Security Engineer": {"description": "Secures systems and applications against threats and vulnerabilities.","next_steps": ["Learn network security", "Practice penetration testing", "Obtain security certifications"]},
+    "Cybersecurity Analyst": {"description": "Monitors, detects and responds to cyber threats for organizations.","next_steps": ["Study SIEM tools", "Learn incident response", "Practice threat hunting"]},
+    "Blockchain Developer": {"description": "Builds decentralized applications and smart contracts.","next_steps": ["Learn Solidity or Rust", "Understand blockchain protocols", "Build and deploy smart contracts"]},
+    "Mobile Developer (iOS/Android)": {"description": "Develops native or cross-platform mobile applications.","next_steps": ["Learn Swift/Kotlin or Flutter/React Native", "Build mobile apps", "Understand app lifecycle & deployment"]},
+    "Embedded Systems Engineer": {"description": "Works on software for hardware devices and IoT systems.","next_steps": ["Learn C/C++", "Work with microcontrollers", "Practice real-time programming"]},
+    "Hardware Engineer": {"description": "Designs electronic circuits and hardware components.","next_steps": ["Study electronics", "Practice PCB design", "Work on hardware prototypes"]},
+    "Product Manager": {"description": "Defines product vision, coordinates teams, and ensures delivery of valuable products.","next_steps": ["Learn product strategy and roadmapping", "Talk to users", "Practice prioritization and metrics tracking"]},
+    "Project Manager": {
+        "description": "Oversees projects from initiation to completion ensuring goals are met.",
+        "next_steps": ["Learn project management tools", "Develop leadership skills", "Manage project timelines and resources"]
+    },
+    "UX Researcher": {"description": "Studies users to inform product and design decisions.","next_steps": ["Learn user research methods", "Run usability tests", "Translate insights into design requirements"]},
+    "Graphic Designer": {
+        "description": "Creates visual content for branding, websites, and marketing materials.",
+        "next_steps": ["Master Photoshop/Illustrator", "Build a design portfolio", "Learn typography and color theory"]
+    },
+    "Visual Designer": {"description": "Focuses on the aesthetics and visuals of product interfaces and marketing material.","next_steps": ["Study color theory", "Practice UI layouts", "Build brand-style guides"]},
+    "Motion Designer": {"description": "Creates animated content for video, web, and apps.","next_steps": ["Learn After Effects/animation tools", "Build short animated pieces", "Study timing and storytelling"]},
+    "3D Artist / Animator": {"description": "Models and animates 3D content for film, games, and visualization.","next_steps": ["Learn Blender/Maya", "Build 3D portfolios", "Study lighting and rigging"]},
+    "Game Developer": {"description": "Designs and codes video games and interactive experiences.","next_steps": ["Learn Unity/Unreal", "Build small game projects", "Learn game design principles"]},
+    "Game Designer": {"description": "Designs game mechanics, systems and player experiences.","next_steps": ["Study ludology and level design", "Prototype games", "Playtest and iterate"]},
+    "Sound Designer": {"description": "Creates audio assets and soundscapes for media and games.","next_steps": ["Learn audio tools (DAW)", "Practice creating sound FX and Foley", "Collaborate on small projects"]},
+    "Animator": {
+        "description": "Creates animations for movies, games, or advertisements.",
+        "next_steps": ["Learn animation software", "Develop storyboarding skills", "Build an animation portfolio"]
+    },
+    "Content Writer": {
+        "description": "Produces online content for websites, blogs, and social media.",
+        "next_steps": ["Learn SEO and digital writing", "Write regularly", "Develop a portfolio of work"]
+    },
+    "Technical Writer": {"description": "Produces technical documentation like manuals, APIs, and guides.","next_steps": ["Learn documentation tools", "Practice clear technical communication", "Work with engineering teams"]},
+    "Journalist": {"description": "Reports on news, writes stories, and investigates topics for media outlets.","next_steps": ["Practice reporting and interviewing", "Write sample articles", "Intern at media outlets"]},
+    "Public Relations Specialist": {"description": "Manages public image and communications for organizations or individuals.","next_steps": ["Learn media relations", "Develop press materials", "Practice crisis communication"]},
+    "Social Media Manager": {"description": "Creates and manages social content and community engagement.","next_steps": ["Learn content strategy", "Practice community management", "Analyze social metrics"]},
+    "Marketing Analyst": {"description": "Analyzes data to measure marketing effectiveness and customer behavior.","next_steps": ["Learn analytics tools", "Study A/B testing", "Create marketing dashboards"]},
+    "Sales Specialist": {"description": "Sells products or services and builds customer relationships.","next_steps": ["Practice communication and negotiation", "Understand product value", "Develop CRM skills"]},
+    "Customer Success Manager": {"description": "Ensures customers achieve value and success with products or services.","next_steps": ["Learn onboarding techniques", "Gather customer feedback", "Build relationship management skills"]},
+    "Business Analyst": {"description": "Analyzes business processes and recommends improvements and solutions.","next_steps": ["Learn requirements elicitation", "Practice process mapping", "Work with stakeholders"]},
+    "Management Consultant": {"description": "Solves business problems and advises organizations on strategy and operations.","next_steps": ["Develop problem-solving frameworks", "Practice case interviews", "Gain domain knowledge"]},
+    "Entrepreneur / Founder": {"description": "Starts and scales new businesses, often leading product and strategy.","next_steps": ["Validate ideas with customers", "Create business plans", "Learn fundraising basics"]},
+    "Product Designer": {"description": "Designs end-to-end product experiences balancing UX and business needs.","next_steps": ["Practice prototyping", "Learn user research", "Work cross-functionally with engineers"]},
+    "HR Specialist": {"description": "Manages recruitment, benefits, and employee relations.","next_steps": ["Learn HR processes", "Understand labor law basics", "Practice interviewing"]},
+    "Recruiter": {"description": "Finds and hires talent for companies, building candidate pipelines.","next_steps": ["Practice sourcing and interviewing", "Learn hiring tools", "Build candidate networks"]},
+    "Training & Development Specialist": {"description": "Designs and delivers employee training programs.","next_steps": ["Learn instructional design", "Create training materials", "Measure learning outcomes"]},
+    "Accountant": {"description": "Prepares financial records, taxes and ensures compliance.","next_steps": ["Learn accounting basics", "Gain experience with accounting software", "Consider CPA/CA certification"]},
+    "Financial Analyst": {"description": "Evaluates financial performance and supports investment decisions.","next_steps": ["Learn financial modeling", "Study valuation", "Practice Excel and SQL"]},
+    "Controller / Finance Manager": {"description": "Oversees accounting, financial reporting and internal controls.","next_steps": ["Gain experience in accounting/finance", "Study financial regulations", "Lead reporting processes"]},
+    "Investment Banker": {"description": "Advises clients on investments, mergers, and capital raising.","next_steps": ["Study finance and investment banking", "Build financial modeling skills", "Intern with investment banks"]},
+    "Auditor": {"description": "Examines financial records to ensure accuracy and compliance.","next_steps": ["Learn auditing standards", "Gain practical auditing experience", "Pursue CPA/CA certification"]},
+    "Lawyer": {"description": "Provides legal advice, represents clients, and prepares legal documents.","next_steps": ["Attend law school", "Pass bar exam", "Specialize in a legal domain"]},
+    "Paralegal": {"description": "Supports lawyers by preparing legal documents and research.","next_steps": ["Learn legal documentation", "Gain practical experience", "Consider paralegal certification"]},
+    "Civil Engineer": {"description": "Designs, constructs and maintains infrastructure projects like roads and bridges.","next_steps": ["Study civil engineering fundamentals", "Work on construction projects", "Obtain PE license"]},
+    "Mechanical Engineer": {
+        "description": "Designs, builds, and maintains mechanical systems and machines.",
+        "next_steps": ["Study CAD and SolidWorks", "Understand thermodynamics and mechanics", "Work on engineering projects"]
+    },
+    "Electrical Engineer": {"description": "Designs electrical circuits, power systems, and electronics.","next_steps": ["Learn circuit design", "Practice embedded systems", "Work on electronics projects"]},
+    "Chemical Engineer": {
+        "description": "Designs processes to produce chemicals, fuels, and materials efficiently.",
+        "next_steps": ["Study chemical engineering principles", "Work on lab and industrial projects", "Learn process optimization"]
+    },
+    "Civil/Structural Designer": {"description": "Focuses on structural integrity and architectural planning.","next_steps": ["Learn structural analysis", "Practice CAD software", "Work on real projects"]},
+    "Architecture / Architect": {"description": "Designs buildings and urban environments balancing aesthetics and function.","next_steps": ["Study architectural design", "Master CAD and 3D modeling", "Gain internships"]},
+    "Interior Designer": {"description": "Designs interior spaces for aesthetics, functionality, and comfort.","next_steps": ["Learn interior design principles", "Practice with real spaces", "Build portfolio"]},
+    "Fashion Designer": {"description": "Creates clothing and accessories, balancing creativity and market needs.","next_steps": ["Study fashion design", "Practice sketching and pattern making", "Build a collection/portfolio"]},
+    "Chef / Culinary Artist": {"description": "Prepares meals, plans menus, and creates culinary experiences.","next_steps": ["Learn culinary techniques", "Gain kitchen experience", "Experiment with recipes"]},
+    "Nutritionist / Dietitian": {"description": "Advises on diet, nutrition, and healthy lifestyle choices.","next_steps": ["Study nutrition science", "Get certification", "Create personalized meal plans"]},
+    "Physician / Doctor": {"description": "Diagnoses and treats illnesses, promoting health.","next_steps": ["Complete medical degree", "Pass licensing exams", "Specialize if desired"]},
+    "Nurse": {
+        "description": "Provides patient care, administers medications, and supports medical teams.",
+        "next_steps": ["Complete nursing degree and license", "Develop patient care skills", "Learn hospital procedures and recordkeeping"]
+    },
+    "Pharmacist": {"description": "Dispenses medications and advises on their proper use.","next_steps": ["Study pharmacy", "Gain internship experience", "Get licensed"]},
+    "Psychologist / Therapist": {"description": "Provides mental health support and counseling.","next_steps": ["Complete psychology degree", "Gain clinical experience", "Obtain license"]},
+    "Teacher / Educator": {"description": "Educates students and develops curriculum.","next_steps": ["Earn teaching certification", "Plan lessons and assessments", "Gain classroom experience"]},
+    "Professor / Academic Researcher": {"description": "Teaches and conducts research at higher education institutions.","next_steps": ["Obtain advanced degrees", "Publish research papers", "Engage in academic networking"]},
+    "Fitness Trainer / Coach": {"description": "Designs exercise programs and motivates clients for health and performance.","next_steps": ["Get certified", "Practice personal training", "Design nutrition and fitness plans"]},
+    "Pilot / Aviation Professional": {"description": "Operates aircraft, ensuring safety and efficiency in travel.","next_steps": ["Obtain pilot license", "Complete flight hours", "Pass aviation exams"]},
+    "Scientist / Researcher": {"description": "Conducts scientific research in a specialized field.","next_steps": ["Study your field deeply", "Perform experiments", "Publish findings"]},
+    "Teacher": {
+        "description": "Educates and guides students, creating lesson plans and promoting learning.",
+        "next_steps": ["Earn teaching certification", "Prepare engaging lesson plans", "Develop classroom management skills"]
+    },
+    "Air Hostess": {
+        "description": "Ensures passenger safety and comfort during flights while providing excellent service.",
+        "next_steps": ["Complete flight attendant training", "Learn safety protocols", "Improve communication and customer service skills"]
+    },
+    "Tour Guide": {
+        "description": "Leads tourists and provides information on destinations and cultural sites.",
+        "next_steps": ["Study local history and culture", "Develop storytelling skills", "Learn foreign languages if needed"]
+    },
+    "Hydrologist": {
+        "description": "Studies water resources to manage and protect water systems.",
+        "next_steps": ["Study environmental science and hydrology", "Learn GIS and data analysis", "Participate in fieldwork projects"]
+    },
+    "Ambulance Driver": {
+        "description": "Provides emergency transport and basic medical assistance to patients.",
+        "next_steps": ["Obtain EMT or first aid certification", "Learn safe driving practices", "Develop crisis management skills"]
+    },
+    "Forensic Scientist": {
+        "description": "Analyzes physical evidence to help solve crimes.",
+        "next_steps": ["Study chemistry/biology forensics", "Practice lab techniques", "Learn criminal investigation procedures"]
+    },
+    "Pediatrician": {
+        "description": "Provides medical care to children and monitors their health and growth.",
+        "next_steps": ["Complete medical school and pediatric residency", "Learn child health assessment", "Stay updated on vaccinations and treatments"]
+    },
+    "Entrepreneur": {
+        "description": "Starts and manages businesses, developing products and strategies for growth.",
+        "next_steps": ["Identify business opportunities", "Learn financial and marketing basics", "Build a minimum viable product (MVP)"]
+    },
+    "Robotics Engineer": {
+        "description": "Designs and develops robots and automation systems.",
+        "next_steps": ["Study robotics and electronics", "Practice programming microcontrollers", "Work on robotic projects"]
+    },
+    "Advertising Executive": {
+        "description": "Creates advertising campaigns to promote brands and products.",
+        "next_steps": ["Learn marketing principles", "Develop creative writing and design skills", "Analyze ad performance metrics"]
+    },
+    "Firefighter": {
+        "description": "Responds to fires and emergencies to protect people and property.",
+        "next_steps": ["Complete fire safety training", "Develop physical fitness", "Learn emergency response protocols"]
+    },
+    "Biotechnologist": {
+        "description": "Uses biological processes to develop products in medicine, agriculture, and industry.",
+        "next_steps": ["Study molecular biology and genetics", "Practice lab techniques", "Work on biotech research projects"]
+    },
+    "Microbiologist": {
+        "description": "Studies microorganisms and their impact on health, environment, and industry.",
+        "next_steps": ["Learn microbiology lab techniques", "Analyze microbial data", "Participate in research projects"]
+    },
+    "Doctor": {
+        "description": "Diagnoses, treats, and prevents illnesses, providing patient care.",
+        "next_steps": ["Complete medical school and residency", "Develop clinical skills", "Stay updated on medical research"]
+    },
+    "Farmer": {
+        "description": "Cultivates crops and raises livestock, managing farm operations sustainably.",
+        "next_steps": ["Learn modern agricultural practices", "Understand soil and crop management", "Adopt sustainable farming techniques"]
+    },
+    "B.Pharm Graduate": {
+        "description": "Prepares and dispenses medications while studying drug interactions and effects.",
+        "next_steps": ["Study pharmacy principles", "Gain experience in a pharmacy or hospital", "Learn about pharmaceutical regulations"]
+    },
+    "Pharm.D Graduate": {
+        "description": "Manages clinical pharmacy operations and provides patient-specific medication care.",
+        "next_steps": ["Complete Pharm.D degree", "Learn clinical pharmacy practices", "Stay updated on new drugs and therapies"]
+    },
+    "Historian": {
+        "description": "Researches and analyzes historical events and societies.",
+        "next_steps": ["Study history and research methods", "Work with archives and museums", "Publish historical findings"]
+    },
+    "Librarian": {
+        "description": "Manages information resources and helps people access knowledge.",
+        "next_steps": ["Learn library science", "Develop cataloging and classification skills", "Assist students and researchers"]
+    },
+    "Medical Coder": {
+        "description": "Translates medical diagnoses into standardized codes for billing and records.",
+        "next_steps": ["Learn ICD and CPT coding", "Practice with medical records", "Stay updated on healthcare regulations"]
+    },
+    "Business": {
+        "description": "Manages and grows companies, making strategic decisions for success.",
+        "next_steps": ["Learn business management principles", "Develop leadership skills", "Study finance and marketing"]
+    },
+    "Food Critic": {
+        "description": "Reviews and evaluates food, restaurants, and culinary experiences.",
+        "next_steps": ["Develop food tasting skills", "Write reviews and articles", "Study culinary trends"]
+    },
+    "Animal Controller": {
+        "description": "Manages stray or dangerous animals and ensures public safety.",
+        "next_steps": ["Learn animal handling and care", "Understand animal behavior", "Work with animal welfare organizations"]
+    },
+    "Veterinary Doctor": {
+        "description": "Provides medical care for animals, diagnosing and treating illnesses.",
+        "next_steps": ["Complete veterinary degree", "Develop clinical skills for animals", "Stay updated on animal health practices"]
+    },
+    "Singer": {
+        "description": "Performs music vocally for audiences or recordings.",
+        "next_steps": ["Practice vocal techniques", "Perform regularly", "Study music theory and genres"]
+    },
+    "Dancer": {
+        "description": "Expresses ideas and stories through movement and choreography.",
+        "next_steps": ["Train in dance styles", "Join dance groups or performances", "Create a dance portfolio"]
+    },
+    "Actor/Actress": {
+        "description": "Portrays characters in theatre, film, or television.",
+        "next_steps": ["Take acting classes", "Participate in plays or short films", "Develop a showreel"]
+    },
+    "Athlete": {
+        "description": "Competes in sports and maintains physical fitness for performance.",
+        "next_steps": ["Train regularly in chosen sport", "Maintain proper nutrition", "Participate in competitions"]
+    },
+    "Coach": {
+        "description": "Trains and mentors athletes to improve their performance.",
+        "next_steps": ["Study coaching techniques", "Develop leadership and communication skills", "Gain experience with teams"]
+    },
+    "Writer": {
+        "description": "Creates written content for books, articles, or blogs.",
+        "next_steps": ["Practice writing daily", "Read widely for inspiration", "Build a portfolio or blog"]
+    },
+    "Model": {
+        "description": "Promotes products or fashion by appearing in photoshoots, videos, or events.",
+        "next_steps": ["Build a modeling portfolio", "Attend casting calls", "Work with photographers and agencies"]
+    },
+    "Food Inspector": {
+        "description": "Ensures food safety and quality in production and restaurants.",
+        "next_steps": ["Learn food safety regulations", "Inspect kitchens and products", "Report and recommend improvements"]
+    },
+    "Lab Technician": {
+        "description": "Performs experiments, tests, and analysis in a laboratory setting.",
+        "next_steps": ["Learn lab procedures and safety", "Practice analyzing samples", "Maintain accurate lab records"]
+    },
+    "Florist": {
+        "description": "Designs and arranges flowers for events, decorations, and sales.",
+        "next_steps": ["Learn flower arranging techniques", "Understand plant care", "Create a portfolio of arrangements"]
+    },
+    "Makeup Artist": {
+        "description": "Applies cosmetics to enhance or alter appearance for events or media.",
+        "next_steps": ["Study makeup techniques", "Build a portfolio", "Work with photographers and clients"]
+    },
+    "Content Creator": {
+        "description": "Produces digital media content for social platforms and online audiences.",
+        "next_steps": ["Learn video and photo editing", "Create engaging content", "Grow audience on social media"]
+    },
+    "Marketing Manager": {
+        "description": "Plans and executes strategies to promote products and brands.",
+        "next_steps": ["Study marketing and advertising", "Analyze market trends", "Lead marketing campaigns"]
+    },
+    "HR Professional": {
+        "description": "Manages recruitment, employee relations, and organizational development.",
+        "next_steps": ["Learn HR policies and laws", "Develop communication and negotiation skills", "Handle recruitment and employee engagement"]
+    },
+    "CEO": {
+        "description": "Leads and manages the overall operations of a company or organization.",
+        "next_steps": ["Develop leadership skills", "Study business strategy", "Make key organizational decisions"]
+    },
+    "Weather Forecaster": {
+        "description": "Analyzes meteorological data to predict weather conditions.",
+        "next_steps": ["Study meteorology and climate science", "Learn data modeling tools", "Practice interpreting weather patterns"]
+    },
+    "News Reader": {
+        "description": "Presents news and information to the public via TV, radio, or online platforms.",
+        "next_steps": ["Develop public speaking skills", "Stay updated on current events", "Practice news reading and reporting"]
+    },
+    "Architect": {
+        "description": "Designs buildings and structures, balancing aesthetics and functionality.",
+        "next_steps": ["Study architecture and design", "Learn CAD tools", "Develop a portfolio of projects"]
+    },
+    "Archaeologist": {
+        "description": "Studies human history through excavation and analysis of artifacts.",
+        "next_steps": ["Learn archaeology methods", "Participate in field digs", "Research historical findings"]
+    },
+    "Psychologist": {
+        "description": "Studies human behavior and mental processes to help individuals.",
+        "next_steps": ["Earn psychology degree", "Learn counseling techniques", "Conduct assessments and research"]
+    },
+    "Psychiatrist": {
+        "description": "Diagnoses and treats mental illnesses using therapy and medications.",
+        "next_steps": ["Complete medical school and psychiatry residency", "Learn psychotherapy", "Stay updated on mental health research"]
+    },
+    "Dentist": {
+        "description": "Examines, diagnoses, and treats dental issues to maintain oral health.",
+        "next_steps": ["Complete dental school", "Learn dental procedures", "Practice patient care and hygiene"]
+    },
+    "Electrician": {
+        "description": "Installs and maintains electrical systems in buildings and equipment.",
+        "next_steps": ["Learn electrical systems and safety", "Gain hands-on experience", "Obtain required certifications"]
+    },
+    "Biologist": {
+        "description": "Studies living organisms to understand life processes and ecosystems.",
+        "next_steps": ["Study biology and ecology", "Conduct experiments and field research", "Publish findings or work in labs"]
+    },
+    "Astronomer": {
+        "description": "Studies celestial objects, space, and the universe.",
+        "next_steps": ["Study astrophysics or astronomy", "Learn telescopes and observation techniques", "Analyze astronomical data"]
+    },
+    "Geologist": {
+        "description": "Studies the Earth, rocks, minerals, and natural resources.",
+        "next_steps": ["Learn geology and field mapping", "Conduct sample analysis", "Participate in field studies"]
+    },
+    "Director": {
+    "description": "Oversees the creative vision of a film or video project and directs actors and crew.",
+    "next_steps": ["Study film directing", "Watch and analyze movies", "Practice directing short films"]
+},
+
+    "Cameraman": {
+        "description": "Operates cameras to capture footage according to the director's vision.",
+        "next_steps": ["Learn camera operation and cinematography", "Practice filming scenes", "Study lighting and framing techniques"]
+    },
+
+    "Producer": {
+        "description": "Manages the production of films, including financing, scheduling, and coordination of the crew.",
+        "next_steps": ["Learn film production management", "Network with industry professionals", "Assist in film projects"]
+    },
+
+    "Production Controller": {
+        "description": "Oversees the logistics and schedule of a film production, ensuring smooth workflow and resource allocation.",
+        "next_steps": ["Study production management", "Practice project coordination", "Gain experience in film sets"]
+    },
+
+    "Cinematographer": {
+        "description": "Responsible for capturing the visual aesthetics of a film through camera work and lighting.",
+        "next_steps": ["Learn cinematography techniques", "Experiment with camera angles and lighting", "Study visual storytelling"]
+    },
+
+    "Visual Editor": {
+        "description": "Edits raw footage to create a polished final product, adding effects, transitions, and sound synchronization.",
+        "next_steps": ["Learn video editing software (Premiere, Final Cut)", "Practice editing short films", "Study post-production techniques"]
+    },
+
+    "Mentalist": {
+        "description": "Performs mental feats and illusions using psychology and observation.",
+        "next_steps": ["Study human behavior and psychology", "Practice observation and memory techniques", "Develop performance skills"]
+    }
+}
+
+
+# ---------------- Career Courses ----------------
+career_courses = {
+    "Software Engineer": [("CS50 (Harvard)", "https://cs50.harvard.edu"),
+                          ("The Odin Project", "https://www.theodinproject.com"),
+                          ("Udemy Python Bootcamp", "https://www.udemy.com/course/complete-python-bootcamp/")],
+
+    "Data Scientist": [("IBM Data Science", "https://www.coursera.org/professional-certificates/ibm-data-science"),
+                       ("Kaggle Micro-courses", "https://www.kaggle.com/learn"),
+                       ("Applied ML Specialization", "https://www.coursera.org/specializations/applied-machine-learning")],
+
+    "AI/ML Engineer": [("DeepLearning.ai", "https://www.deeplearning.ai"),
+                       ("fast.ai", "https://course.fast.ai"),
+                       ("TensorFlow Developer Certificate", "https://www.tensorflow.org/certificate")],
+
+    "UX/UI Designer": [("Interaction Design Foundation", "https://www.interaction-design.org"),
+                       ("Coursera UX Design", "https://www.coursera.org/specializations/ux-design"),
+                       ("Figma Tutorials", "https://help.figma.com")],
+
+    "Digital Marketer": [("Google Digital Marketing", "https://learndigital.withgoogle.com"),
+                         ("Hubspot Academy", "https://academy.hubspot.com"),
+                         ("Coursera Social Media Marketing", "https://www.coursera.org/specializations/social-media-marketing")],
+
+    "Graphic Designer": [("Adobe Illustrator CC", "https://helpx.adobe.com/illustrator/tutorials.html"),
+                         ("Canva Design School", "https://www.canva.com/learn/design-school/"),
+                         ("Udemy Graphic Design Masterclass", "https://www.udemy.com/course/graphic-design-masterclass/")],
+
+    "Mechanical Engineer": [("MIT OpenCourseWare: Mechanical Engineering", "https://ocw.mit.edu/courses/mechanical-engineering/"),
+                            ("Coursera Mechanical Design", "https://www.coursera.org/learn/mechanical-design"),
+                            ("SolidWorks Tutorials", "https://www.solidworks.com/learning")],
+
+    "Teacher": [("Coursera: Teaching and Learning", "https://www.coursera.org/specializations/teaching-learning"),
+                ("EdX: Foundations of Teaching", "https://www.edx.org/course/foundations-of-teaching"),
+                ("Khan Academy Teacher Resources", "https://www.khanacademy.org/teachers")],
+
+    "Air Hostess": [("IATA Cabin Crew Training", "https://www.iata.org/en/training/courses/airline/"),
+                    ("Flight Attendant Training Institute", "https://www.fattraining.com/"),
+                    ("Coursera Customer Service Skills", "https://www.coursera.org/learn/customer-service")],
+
+    "Tour Guide": [("Tourism and Travel Courses - Alison", "https://alison.com/course/diploma-in-tourism"),
+                   ("Coursera Cultural Tourism", "https://www.coursera.org/learn/cultural-tourism"),
+                   ("National Tour Association Training", "https://www.ntaonline.com/education")],
+
+    "Hydrologist": [("Coursera Water Resources", "https://www.coursera.org/learn/water-resources-management"),
+                    ("EdX Hydrology", "https://www.edx.org/course/fundamentals-of-hydrology"),
+                    ("USGS Hydrologic Resources", "https://www.usgs.gov/mission-areas/water-resources")],
+
+    "Ambulance Driver": [("EMT Basic Training", "https://www.ems1academy.com/emt-basic-course/"),
+                         ("First Aid & CPR - Red Cross", "https://www.redcross.org/take-a-class/first-aid"),
+                         ("Defensive Driving for Emergency Vehicles", "https://www.nfpa.org/")],
+
+    "Forensic Scientist": [("Forensic Science - Coursera", "https://www.coursera.org/specializations/forensic-science"),
+                           ("Udemy Forensic Investigation", "https://www.udemy.com/course/forensic-investigation/"),
+                           ("OpenLearn Forensics", "https://www.open.edu/openlearn/science-maths-technology/forensic-science")],
+
+    "Pediatrician": [("Medscape Pediatrics Courses", "https://www.medscape.com/pediatrics"),
+                     ("Coursera Child Health", "https://www.coursera.org/learn/child-health"),
+                     ("Stanford Pediatrics Lectures", "https://med.stanford.edu/pediatrics.html")],
+
+    "Entrepreneur": [("Y Combinator Startup School", "https://www.startupschool.org/"),
+                     ("Coursera Entrepreneurship Specialization", "https://www.coursera.org/specializations/wharton-entrepreneurship"),
+                     ("MIT OpenCourseWare: Entrepreneurship", "https://ocw.mit.edu/courses/sloan-school-of-management/15-390-new-enterprises-fall-2013/")],
+
+    "Robotics Engineer": [("Coursera Robotics Specialization", "https://www.coursera.org/specializations/robotics"),
+                          ("Udemy Robotics for Beginners", "https://www.udemy.com/course/robotics/"),
+                          ("MIT OpenCourseWare Robotics", "https://ocw.mit.edu/courses/electrical-engineering-and-computer-science/6-141-robotic-science-and-systems-i-fall-2014/")],
+
+    "Advertising Executive": [("Hubspot Marketing Courses", "https://academy.hubspot.com/"),
+                              ("Coursera Advertising Strategy", "https://www.coursera.org/learn/advertising-strategy"),
+                              ("Google Ads Certification", "https://skillshop.exceedlms.com/student/path/18109")],
+
+    "Firefighter": [("NFPA Firefighter Training", "https://www.nfpa.org/"),
+                    ("Coursera Fire Safety", "https://www.coursera.org/learn/fire-safety"),
+                    ("Red Cross Fire Safety", "https://www.redcross.org/take-a-class/fire-safety")],
+
+    "Nurse": [("Coursera Nursing Courses", "https://www.coursera.org/browse/health/nursing"),
+              ("MedlinePlus Nursing Resources", "https://medlineplus.gov/nursing.html"),
+              ("American Nurses Association", "https://www.nursingworld.org/")],
+
+    "Biotechnologist": [("Coursera Biotechnology Specialization", "https://www.coursera.org/specializations/biotechnology"),
+                         ("MIT OpenCourseWare Biotechnology", "https://ocw.mit.edu/courses/biological-engineering/"),
+                         ("Udemy Biotechnology", "https://www.udemy.com/course/biotechnology/")],
+
+    "Microbiologist": [("Coursera Microbiology", "https://www.coursera.org/learn/microbiology"),
+                       ("EdX Microbiology", "https://www.edx.org/learn/microbiology"),
+                       ("OpenLearn Microbiology", "https://www.open.edu/openlearn/science-maths-technology/microbiology")],
+
+    "Doctor": [("Medscape Clinical Courses", "https://www.medscape.com/"),
+               ("Coursera Clinical Medicine", "https://www.coursera.org/learn/clinical-medicine"),
+               ("Stanford Medicine Online", "https://med.stanford.edu/")],
+
+    "Farmer": [("Alison Agriculture Courses", "https://alison.com/course/diploma-in-agriculture"),
+               ("Coursera Sustainable Agriculture", "https://www.coursera.org/learn/sustainable-agriculture"),
+               ("FAO eLearning", "https://elearning.fao.org/")],
+
+    "B.Pharm Graduate": [("Coursera Pharmacology", "https://www.coursera.org/learn/pharmacology"),
+                         ("Alison Pharmacy Courses", "https://alison.com/courses/pharmacy"),
+                         ("MedlinePlus Drug Information", "https://medlineplus.gov/druginformation.html")],
+
+    "Pharm.D Graduate": [("Coursera Clinical Pharmacy", "https://www.coursera.org/learn/clinical-pharmacy"),
+                         ("EdX Pharmacy Courses", "https://www.edx.org/learn/pharmacy"),
+                         ("Udemy Pharmacy Technician Training", "https://www.udemy.com/course/pharmacy-technician-training/")],
+
+    "Historian": [("Coursera History Courses", "https://www.coursera.org/browse/arts-and-humanities/history"),
+                  ("EdX History Programs", "https://www.edx.org/learn/history"),
+                  ("Khan Academy History", "https://www.khanacademy.org/humanities/world-history")],
+
+    "Librarian": [("Coursera Library Science", "https://www.coursera.org/learn/library-science"),
+                  ("EdX Library Management", "https://www.edx.org/learn/library-management"),
+                  ("American Library Association", "https://www.ala.org/educationcareers")],
+
+    "Medical Coder": [("AAPC Medical Coding", "https://www.aapc.com/training/medical-coding/"),
+                      ("Coursera Health Informatics", "https://www.coursera.org/learn/health-informatics"),
+                      ("Udemy ICD-10 Coding", "https://www.udemy.com/course/icd-10-coding/")],
+
+    "Business": [("Coursera Business Foundations", "https://www.coursera.org/specializations/wharton-business-foundations"),
+                 ("MIT OpenCourseWare Business", "https://ocw.mit.edu/courses/sloan-school-of-management/"),
+                 ("Harvard Online Business Courses", "https://online.hbs.edu/courses/")],
+
+    "Food Critic": [("Udemy Food Writing", "https://www.udemy.com/course/food-writing/"),
+                    ("Coursera Culinary Arts", "https://www.coursera.org/learn/culinary-arts"),
+                    ("EdX Gastronomy Courses", "https://www.edx.org/learn/gastronomy")],
+
+    "Animal Controller": [("Animal Behavior Courses - Coursera", "https://www.coursera.org/learn/animal-behavior"),
+                          ("Udemy Animal Handling", "https://www.udemy.com/course/animal-handling/"),
+                          ("ASPCA Training Resources", "https://www.aspca.org/")],
+
+    "Veterinary Doctor": [("Coursera Veterinary Science", "https://www.coursera.org/specializations/veterinary-science"),
+                          ("VetMed Online", "https://www.vetmedonline.com/"),
+                          ("EdX Veterinary Courses", "https://www.edx.org/learn/veterinary")],
+
+    "Singer": [("Berklee Online Vocal Courses", "https://online.berklee.edu/courses/vocals"),
+               ("Coursera Music Performance", "https://www.coursera.org/learn/music-performance"),
+               ("Udemy Singing Lessons", "https://www.udemy.com/course/singing-lessons/")],
+
+    "Dancer": [("Udemy Dance Courses", "https://www.udemy.com/courses/dance/"),
+               ("Coursera Dance & Movement", "https://www.coursera.org/learn/dance-movement"),
+               ("DancePlug Tutorials", "https://www.danceplug.com/")],
+
+    "Actor/Actress": [("MasterClass Acting with Natalie Portman", "https://www.masterclass.com/classes/natalie-portman-teaches-acting"),
+                      ("Udemy Acting Classes", "https://www.udemy.com/course/acting-classes/"),
+                      ("Coursera Performing Arts", "https://www.coursera.org/learn/performing-arts")],
+
+    "Athlete": [("Coursera Sports Science", "https://www.coursera.org/learn/sports-science"),
+                ("Udemy Fitness Training", "https://www.udemy.com/course/fitness-training/"),
+                ("NASM Certified Personal Trainer", "https://www.nasm.org/certification")],
+
+    "Coach": [("Coursera Coaching Skills", "https://www.coursera.org/learn/coaching-skills"),
+              ("Udemy Sports Coaching", "https://www.udemy.com/course/sports-coaching/"),
+              ("International Coaching Federation", "https://coachingfederation.org/")],
+
+    "Writer": [("Coursera Creative Writing", "https://www.coursera.org/specializations/creative-writing"),
+               ("Udemy Writing Courses", "https://www.udemy.com/courses/writing/"),
+               ("OpenLearn Writing Skills", "https://www.open.edu/openlearn/skills-for-work")],
+
+    "Content Writer": [("Hubspot Content Marketing", "https://academy.hubspot.com/courses/content-marketing"),
+                       ("Coursera Content Writing", "https://www.coursera.org/learn/content-marketing"),
+                       ("Udemy SEO Content Writing", "https://www.udemy.com/course/seo-content-writing/")],
+
+    "Model": [("MasterClass Modeling with Naomi Campbell", "https://www.masterclass.com/classes/naomi-campbell-teaches-modeling"),
+              ("Udemy Modeling Courses", "https://www.udemy.com/course/modeling/"),
+              ("Modeling Workshop Tutorials", "https://www.modelingworkshop.com/")],
+
+    "Food Inspector": [("Coursera Food Safety", "https://www.coursera.org/learn/food-safety"),
+                       ("Alison Food Hygiene", "https://alison.com/course/diploma-in-food-hygiene"),
+                       ("FDA Training Resources", "https://www.fda.gov/training")],
+
+    "Chemical Engineer": [("MIT OpenCourseWare Chemical Engineering", "https://ocw.mit.edu/courses/chemical-engineering/"),
+                          ("Coursera Chemical Process", "https://www.coursera.org/learn/chemical-process"),
+                          ("Udemy Chemical Engineering", "https://www.udemy.com/course/chemical-engineering/")],
+
+    "Lab Technician": [("Coursera Lab Techniques", "https://www.coursera.org/learn/lab-techniques"),
+                       ("Udemy Lab Safety & Skills", "https://www.udemy.com/course/lab-safety/"),
+                       ("EdX Laboratory Courses", "https://www.edx.org/learn/laboratory")],
+
+    "Florist": [("Udemy Flower Arranging", "https://www.udemy.com/course/flower-arranging/"),
+                ("Skillshare Floristry", "https://www.skillshare.com/browse/floristry"),
+                ("Alison Floral Design", "https://alison.com/course/floral-design")],
+
+    "Makeup Artist": [("Udemy Makeup Artistry", "https://www.udemy.com/course/makeup-artistry/"),
+                      ("Skillshare Makeup Tutorials", "https://www.skillshare.com/browse/makeup"),
+                      ("MasterClass Makeup with Bobbi Brown", "https://www.masterclass.com/classes/bobbi-brown-teaches-makeup")],
+
+    "Content Creator": [("YouTube Creator Academy", "https://creatoracademy.youtube.com/"),
+                        ("Skillshare Content Creation", "https://www.skillshare.com/browse/content-creation"),
+                        ("Udemy Video Content Creation", "https://www.udemy.com/course/video-content-creation/")],
+
+    "Marketing Manager": [("Coursera Marketing Management", "https://www.coursera.org/learn/marketing-management"),
+                          ("Hubspot Marketing Courses", "https://academy.hubspot.com/courses/marketing"),
+                          ("Google Digital Marketing", "https://learndigital.withgoogle.com/digitalgarage")],
+
+    "Project Manager": [("Coursera Project Management", "https://www.coursera.org/specializations/project-management"),
+                        ("Udemy PMP Certification", "https://www.udemy.com/course/pmp-exam-prep/"),
+                        ("PMI Resources", "https://www.pmi.org/")],
+
+    "HR Professional": [("Coursera Human Resources", "https://www.coursera.org/learn/human-resources"),
+                        ("Udemy HR Management", "https://www.udemy.com/course/hr-management/"),
+                        ("SHRM HR Resources", "https://www.shrm.org/")],
+
+    "CEO": [("Harvard Business School Online Leadership", "https://online.hbs.edu/courses/leadership-principles/"),
+            ("Coursera Executive Leadership", "https://www.coursera.org/specializations/executive-leadership"),
+            ("MIT Sloan Leadership Programs", "https://executive.mit.edu/leadership/")],
+
+    "Weather Forecaster": [("Coursera Meteorology", "https://www.coursera.org/learn/meteorology"),
+                           ("EdX Weather and Climate", "https://www.edx.org/learn/weather"),
+                           ("NOAA Meteorology Training", "https://www.noaa.gov/")],
+
+    "News Reader": [("Coursera Journalism Courses", "https://www.coursera.org/browse/arts-and-humanities/journalism"),
+                    ("Udemy News Reporting", "https://www.udemy.com/course/news-reporting/"),
+                    ("BBC Academy Journalism", "https://www.bbc.co.uk/academy")],
+
+    "Architect": [("MIT OpenCourseWare Architecture", "https://ocw.mit.edu/courses/architecture/"),
+                  ("Coursera Architecture Design", "https://www.coursera.org/specializations/architecture-design"),
+                  ("EdX Architectural Design", "https://www.edx.org/learn/architecture")],
+
+    "Archaeologist": [("Coursera Archaeology", "https://www.coursera.org/learn/archaeology"),
+                      ("Udemy Archaeology Courses", "https://www.udemy.com/course/archaeology/"),
+                      ("OpenLearn Archaeology", "https://www.open.edu/openlearn/history/archaeology")],
+
+    "Psychologist": [("Coursera Psychology", "https://www.coursera.org/specializations/psychology"),
+                     ("Udemy Psychology Courses", "https://www.udemy.com/course/psychology/"),
+                     ("EdX Psychology", "https://www.edx.org/learn/psychology")],
+
+    "Psychiatrist": [("Coursera Psychiatry", "https://www.coursera.org/learn/psychiatry"),
+                     ("Udemy Mental Health Courses", "https://www.udemy.com/course/mental-health/"),
+                     ("Medscape Psychiatry", "https://www.medscape.com/psychiatry")],
+
+    "Dentist": [("Coursera Dentistry", "https://www.coursera.org/learn/dentistry"),
+                ("Udemy Dental Courses", "https://www.udemy.com/course/dentistry/"),
+                ("Colgate Oral Health Resources", "https://www.colgate.com/en-us/oral-health")],
+
+    "Electrician": [("Udemy Electrical Courses", "https://www.udemy.com/course/electrical/"),
+                    ("Coursera Electrical Engineering", "https://www.coursera.org/specializations/electrical-engineering"),
+                    ("Alison Electrical Training", "https://alison.com/course/electrician-training")],
+
+    "Biologist": [("Coursera Biology", "https://www.coursera.org/browse/life-sciences/biology"),
+                  ("EdX Biology Courses", "https://www.edx.org/learn/biology"),
+                  ("Khan Academy Biology", "https://www.khanacademy.org/science/biology")],
+
+    "Animator": [("Udemy Animation Courses", "https://www.udemy.com/course/animation/"),
+                 ("Coursera Character Animation", "https://www.coursera.org/learn/character-animation"),
+                 ("AnimSchool Tutorials", "https://www.animschool.com/")],
+
+    "Astronomer": [("Coursera Astronomy", "https://www.coursera.org/learn/astronomy"),
+                   ("EdX Astrophysics", "https://www.edx.org/learn/astrophysics"),
+                   ("NASA Online Learning", "https://www.nasa.gov/education")],
+
+    "Geologist": [("Coursera Geology", "https://www.coursera.org/learn/geology"),
+                  ("EdX Earth Sciences", "https://www.edx.org/learn/earth-sciences"),
+                  ("USGS Geological Training", "https://www.usgs.gov/education")],
+
+    "Mentalist": [("Udemy Mentalism", "https://www.udemy.com/course/mentalism/"),
+                  ("Skillshare Mentalism Classes", "https://www.skillshare.com/browse/mentalism"),
+                  ("MasterClass Mind Tricks", "https://www.masterclass.com/")],
+    "Director": [("MasterClass Filmmaking by Martin Scorsese", "https://www.masterclass.com/classes/martin-scorsese-teaches-filmmaking"),
+                ("Coursera Filmmaking Specialization", "https://www.coursera.org/specializations/filmmaking"),
+                ("Udemy Film Directing", "https://www.udemy.com/course/film-directing/")],
+
+    "Cameraman": [("Udemy Cinematography & Camera Skills", "https://www.udemy.com/course/cinematography/"),
+                ("MasterClass Cinematography by Werner Herzog", "https://www.masterclass.com/classes/werner-herzog-teaches-filmmaking"),
+                ("Skillshare Cinematography Classes", "https://www.skillshare.com/browse/cinematography")],
+
+    "Producer": [("Coursera Film Production", "https://www.coursera.org/learn/film-production"),
+                ("Udemy Film Producing", "https://www.udemy.com/course/film-producing/"),
+                ("MasterClass Producing by Shonda Rhimes", "https://www.masterclass.com/classes/shonda-rhimes-teaches-writing-for-television")],
+
+    "Production Controller": [("Udemy Film Production Management", "https://www.udemy.com/course/film-production-management/"),
+                            ("Coursera Project Management for Film", "https://www.coursera.org/learn/project-management-film"),
+                            ("Skillshare Production Coordination", "https://www.skillshare.com/browse/production")],
+
+    "Cinematographer": [("MasterClass Cinematography by Roger Deakins", "https://www.masterclass.com/classes/roger-deakins-teaches-cinematography"),
+                        ("Udemy Cinematography Techniques", "https://www.udemy.com/course/cinematography-techniques/"),
+                        ("Coursera Advanced Cinematography", "https://www.coursera.org/learn/advanced-cinematography")],
+
+    "Visual Editor": [("Udemy Video Editing with Premiere Pro", "https://www.udemy.com/course/adobe-premiere-pro-video-editing/"),
+                    ("Coursera Video Editing & Post Production", "https://www.coursera.org/learn/video-editing"),
+                    ("Skillshare Final Cut Pro Editing", "https://www.skillshare.com/browse/final-cut-pro")],
+
+}
+
+
+# ---------------- Skills Fallback ----------------
+skills_fallback = {
+    # ---------- IT & Technical ----------
+    "software engineer": ["Proficiency in Python, Java, or C++", "Knowledge of data structures & algorithms", "Software development lifecycle experience", "Problem-solving & debugging", "Collaboration with Git"],
+    "data scientist": ["Statistics & probability knowledge", "Python/R and ML libraries", "Data visualization (Matplotlib, Tableau)", "Feature engineering & data cleaning", "Communicate insights effectively"],
+    "ai/ml engineer": ["ML/DL frameworks (TensorFlow, PyTorch)", "Neural networks knowledge", "Data preprocessing & feature selection", "Hyperparameter tuning & evaluation", "Deploying scalable models"],
+    "cybersecurity analyst": ["Knowledge of network security and protocols", "Threat detection and incident response skills", "Familiarity with security tools and firewalls", "Problem-solving and risk assessment", "Staying updated on emerging threats"],
+    "devops engineer": ["Experience with CI/CD pipelines", "Knowledge of cloud services (AWS, Azure, GCP)", "Containerization and orchestration (Docker, Kubernetes)", "Automation and scripting skills", "Monitoring and troubleshooting systems"],
+    "network engineer": ["Understanding of networking protocols (TCP/IP, DNS, etc.)", "Router/switch configuration and maintenance", "Network security and firewall knowledge", "Troubleshooting connectivity issues", "Documentation and network planning"],
+    "web developer": ["Proficiency in HTML, CSS, JavaScript", "Backend framework knowledge (Node.js, Django, Flask)", "Database management (SQL/NoSQL)", "Responsive design and UX principles", "Problem-solving and debugging"],
+    "mobile app developer": ["Proficiency in Android/iOS development", "Knowledge of Flutter or React Native", "Understanding of UI/UX design for apps", "Debugging and testing skills", "Integration with APIs and databases"],
+    "cloud architect": ["Cloud platform expertise (AWS, Azure, GCP)", "Infrastructure design and deployment", "Security and compliance knowledge", "Problem-solving and scalability planning", "Collaboration with development teams"],
+    "game developer": ["Proficiency in C++, C#, or Unity/Unreal Engine", "Knowledge of game physics and graphics", "Problem-solving and debugging", "Creativity in gameplay design", "Collaboration in multi-disciplinary teams"],
+
+    # ---------- Healthcare ----------
+    "doctor": ["Medical knowledge & diagnostics", "Patient care & empathy", "Critical thinking & problem-solving", "Time management under pressure", "Collaboration with healthcare teams"],
+    "nurse": ["Patient monitoring & care", "Medication administration", "Communication with patients & doctors", "Emergency response", "Compassion & empathy"],
+    "pharmacist": ["Drug knowledge", "Attention to detail", "Patient counseling", "Regulatory compliance"],
+    "physiotherapist": ["Knowledge of physical therapy techniques", "Patient assessment and treatment planning", "Manual therapy and exercise prescription", "Communication and empathy", "Monitoring progress and adapting treatments"],
+    "psychologist": ["Understanding of human behavior and mental health", "Counseling and active listening skills", "Analytical and research skills", "Empathy and ethical judgment", "Communication and interpersonal skills"],
+    "nutritionist": ["Knowledge of diet planning and nutrition science", "Ability to assess patient dietary needs", "Communication and counseling skills", "Research and evidence-based advice", "Adaptability to different client requirements"],
+    "lab technician": ["Sample collection and handling", "Knowledge of lab procedures and protocols", "Attention to detail and accuracy", "Analytical and observational skills", "Safety and hygiene compliance"],
+    "radiologist": ["Imaging interpretation", "Attention to detail", "Communication", "Medical knowledge"],
+    "dentist": ["Knowledge of dental procedures and oral health", "Patient care and communication", "Manual dexterity and precision", "Problem-solving for dental issues", "Knowledge of hygiene and safety protocols"],
+    "veterinarian": ["Animal care and medical knowledge", "Diagnosis and treatment skills", "Communication with pet owners", "Problem-solving and decision-making", "Empathy and patience"],
+
+    # ---------- Business & Finance ----------
+    "financial analyst": ["Financial modeling", "Data analysis", "Attention to detail", "Communication"],
+    "accountant": ["Financial reporting and bookkeeping", "Knowledge of tax laws and compliance", "Attention to detail and accuracy", "Problem-solving and analytical skills", "Communication with clients and teams"],
+    "entrepreneur": ["Business planning and strategy", "Marketing and sales skills", "Financial management and budgeting", "Leadership and decision-making", "Networking and resilience"],
+    "marketing manager": ["Market research", "Strategy planning", "Communication", "Leadership"],
+    "sales executive": ["Client relationship management", "Negotiation and persuasion skills", "Product knowledge", "Communication and networking", "Goal orientation and resilience"],
+    "hr manager": ["Recruitment", "Employee relations", "Communication", "Problem-solving"],
+    "business analyst": ["Requirement analysis", "Data interpretation", "Communication", "Problem-solving"],
+    "project manager": ["Planning", "Resource management", "Leadership", "Risk management"],
+    "management consultant": ["Business strategy and problem-solving", "Analytical and research skills", "Communication and presentation", "Project management", "Stakeholder engagement and negotiation"],
+    "investment banker": ["Market knowledge", "Negotiation", "Decision-making", "Analytical skills"],
+
+    # ---------- Creative & Arts ----------
+    "actor": ["Acting and emotional expression", "Memorization and improvisation skills", "Stage or camera presence", "Collaboration with directors and cast", "Adaptability to roles and scripts"],
+    "singer": [
+        "Vocal control and breathing techniques",
+        "Music theory and song interpretation",
+        "Performance skills and stage presence",
+        "Collaboration with other musicians",
+        "Practice and consistency"
+    ],
+    "dancer": ["Rhythm", "Flexibility", "Stamina", "Stage presence"],
+    "musician": ["Instrument/vocal mastery", "Music theory & composition", "Collaboration with artists", "Stage presence", "Basic audio production"],
+    "photographer": ["Camera operation", "Lighting knowledge", "Editing skills", "Creativity"],
+    "graphic designer": ["Design software", "Creativity", "Typography", "Branding"],
+    "fashion designer": ["Creativity", "Trend analysis", "Sketching", "Sewing skills"],
+    "interior designer": ["Spatial planning", "Creativity", "Client communication", "Project management"],
+    "chef": ["Cooking skills", "Creativity", "Time management", "Teamwork"],
+    "writer": ["Strong writing and grammar skills", "Creativity and storytelling ability", "Research and analytical skills", "Editing and proofreading", "Discipline and time management"],
+
+    # ---------- Education ----------
+    "teacher": ["Lesson planning and curriculum development", "Effective communication and explanation", "Classroom management and discipline", "Patience and adaptability", "Assessment and feedback skills"],
+    "professor": ["Expertise in subject matter", "Curriculum development and teaching", "Research and publication skills", "Communication and mentorship", "Analytical and critical thinking"],
+    "tutor": ["Teaching skills", "Patience", "Adaptability", "Communication"],
+    "librarian": ["Cataloging and organization skills", "Knowledge of library systems", "Research and reference skills", "Communication and assistance", "Attention to detail and information management"],
+    "educational counselor": ["Guidance and advising skills", "Understanding of career paths and education", "Communication and empathy", "Problem-solving and planning", "Analytical and organizational skills"],
+
+    # ---------- Law & Public Service ----------
+    "lawyer": ["Strong research and analytical skills", "Knowledge of legal frameworks and laws", "Negotiation and advocacy", "Critical thinking and argumentation", "Client communication and ethics"],
+    "judge": ["Legal knowledge and interpretation", "Decision-making and impartiality", "Analytical thinking and reasoning", "Communication and courtroom management", "Ethics and integrity"],
+    "police officer": ["Law enforcement", "Observation", "Decision-making", "Communication"],
+    "civil services officer": ["Leadership and public administration", "Policy analysis and decision-making", "Problem-solving and crisis management", "Effective communication", "Ethical judgment and integrity"],
+    "firefighter": ["Emergency response", "Physical fitness", "Teamwork", "Problem-solving"],
+
+    # ---------- Sports & Fitness ----------
+    "sports coach": ["Knowledge of sports rules and techniques", "Team management and motivation", "Strategy planning and game analysis", "Physical training and conditioning", "Communication and leadership"],
+    "fitness trainer": ["Knowledge of exercise techniques and programs", "Ability to motivate clients", "Nutrition and wellness guidance", "Communication and interpersonal skills", "Monitoring progress and adjustments"],
+    "yoga instructor": ["Flexibility", "Teaching", "Patience", "Communication"],
+    "athlete": ["Physical fitness and endurance", "Discipline and training routine", "Strategic thinking for performance", "Teamwork and collaboration (if team sport)", "Focus and mental toughness"],
+
+    # ---------- Service & Trades ----------
+    "barber": ["Haircutting skills", "Creativity", "Customer service", "Precision"],
+    "cosmetologist": ["Skincare, makeup, and hair treatment knowledge", "Customer service and communication", "Creativity and trend awareness", "Attention to hygiene and safety", "Time management"],
+    "electrician": ["Technical knowledge", "Problem-solving", "Safety awareness", "Precision"],
+    "plumber": ["Technical skills", "Problem-solving", "Attention to detail", "Manual dexterity"],
+    "mechanic": ["Technical knowledge", "Problem-solving", "Attention to detail", "Manual skills"],
+    "carpenter": ["Woodworking skills", "Precision", "Planning", "Creativity"],
+    "painter": ["Painting skills", "Creativity", "Precision", "Time management"],
+    "driver": ["Safe driving skills", "Vehicle maintenance knowledge", "Time management and punctuality", "Navigation and route planning", "Attention and alertness"],
+
+    # ---------- Aviation ----------
+    "pilot": ["Aircraft operation knowledge", "Navigation and communication skills", "Decision-making under pressure", "Physical and mental fitness", "Attention to safety protocols"],
+    "air traffic controller": ["Attention to detail", "Decision making", "Communication", "Stress management"],
+
+    # ---------- Miscellaneous / Niche ----------
+    "journalist": ["Research and investigation", "Writing and reporting skills", "Communication", "Ethics and accuracy", "Time management"],
+    "translator": ["Language skills", "Writing", "Cultural knowledge", "Attention to detail"],
+    "social worker": ["Empathy", "Communication", "Problem-solving", "Organization"],
+    "event planner": ["Organization", "Communication", "Creativity", "Time management"],
+    "travel guide": ["Knowledge of history and culture", "Communication skills", "Navigation and planning", "Customer service", "Adaptability"],
+    
+    # ---------- Healthcare ----------
+    "occupational therapist": ["Patient rehabilitation", "Activity planning", "Empathy", "Communication"],
+    "speech therapist": ["Speech assessment", "Therapy planning", "Patience", "Communication"],
+    "anesthesiologist": ["Drug administration", "Patient monitoring", "Critical thinking", "Precision"],
+    "surgeon": ["Precision", "Medical knowledge", "Decision-making", "Teamwork"],
+    "paramedic": ["Emergency response", "First aid", "Quick decision-making", "Resilience"],
+    "dietitian": ["Nutrition planning", "Patient counseling", "Research", "Communication"],
+    "optometrist": ["Vision testing", "Patient care", "Technical knowledge", "Communication"],
+    "prosthetist": ["Custom device design", "Anatomy knowledge", "Technical skill", "Patient interaction"],
+    "physical therapist": ["Exercise planning", "Patient guidance", "Observation", "Motivation"],
+    "chiropractor": ["Spinal adjustment", "Patient assessment", "Manual dexterity", "Communication"],
+    "audiologist": ["Hearing assessment", "Patient care", "Technical knowledge", "Communication"],
+    "pathologist": ["Lab analysis", "Attention to detail", "Medical knowledge", "Reporting"],
+    "medical coder": ["Healthcare coding", "Attention to detail", "Regulatory knowledge", "Data entry"],
+    "genetic counselor": ["Genetics knowledge", "Patient counseling", "Communication", "Ethics"],
+    "clinical researcher": ["Research design", "Data analysis", "Communication", "Ethics"],
+    "biomedical engineer": ["Medical device design", "Engineering knowledge", "Problem-solving", "Technical skills"],
+    "epidemiologist": ["Data analysis", "Public health knowledge", "Research", "Critical thinking"],
+    "nuclear medicine technologist": ["Imaging techniques", "Technical knowledge", "Safety procedures", "Patient care"],
+    "orthotist": ["Custom brace design", "Anatomy knowledge", "Technical skill", "Patient guidance"],
+    "cardiologist": ["Heart assessment", "Medical knowledge", "Decision-making", "Patient care"],
+    "dermatologist": ["Skin assessment", "Medical knowledge", "Treatment planning", "Communication"],
+    "psychiatrist": ["Mental health assessment", "Therapy planning", "Empathy", "Decision-making"],
+    "neurologist": ["Brain assessment", "Medical knowledge", "Diagnosis", "Problem-solving"],
+    "urologist": ["Urinary system knowledge", "Surgical skills", "Patient care", "Diagnosis"],
+    "obstetrician": ["Pregnancy care", "Medical knowledge", "Surgical skills", "Communication"],
+    "pediatrician": ["Child health assessment", "Medical knowledge", "Empathy", "Communication"],
+    "geriatric specialist": ["Elderly care", "Medical knowledge", "Communication", "Patience"],
+    "oncologist": ["Cancer treatment planning", "Medical knowledge", "Decision-making", "Patient care"],
+
+    # ---------- Business & Finance ----------
+    "auditor": ["Financial review", "Risk assessment", "Attention to detail", "Analytical skills"],
+    "compliance officer": ["Regulatory knowledge", "Attention to detail", "Analysis", "Communication"],
+    "actuary": ["Statistics", "Risk modeling", "Analytical skills", "Software proficiency"],
+    "stock broker": ["Market analysis", "Client communication", "Decision-making", "Stress management"],
+    "logistics manager": ["Supply chain planning", "Coordination", "Time management", "Problem-solving"],
+    "supply chain analyst": ["Data analysis", "Process optimization", "Problem-solving", "Attention to detail"],
+    "insurance underwriter": ["Risk assessment", "Analytical skills", "Attention to detail", "Decision-making"],
+    "tax consultant": ["Tax law knowledge", "Financial analysis", "Communication", "Problem-solving"],
+    "venture capitalist": ["Investment analysis", "Networking", "Decision-making", "Negotiation"],
+    "real estate manager": ["Property management", "Negotiation", "Client communication", "Planning"],
+    "bank teller": ["Customer service", "Cash handling", "Attention to detail", "Communication"],
+    "credit analyst": ["Financial statement analysis", "Decision-making", "Attention to detail", "Risk assessment"],
+    "economist": ["Data analysis", "Research", "Forecasting", "Critical thinking"],
+    "insurance agent": ["Client communication", "Policy knowledge", "Sales skills", "Problem-solving"],
+    "portfolio manager": ["Investment analysis", "Risk management", "Decision-making", "Communication"],
+    "business consultant": ["Strategy development", "Problem-solving", "Research", "Communication"],
+    "management analyst": ["Process improvement", "Data analysis", "Problem-solving", "Communication"],
+    "operations manager": ["Coordination", "Leadership", "Problem-solving", "Time management"],
+    "credit controller": ["Financial monitoring", "Risk assessment", "Attention to detail", "Communication"],
+    "treasurer": ["Financial planning", "Budgeting", "Decision-making", "Analytical skills"],
+    "fund manager": ["Investment strategy", "Market analysis", "Decision-making", "Communication"],
+    "equity analyst": ["Stock analysis", "Research", "Decision-making", "Report writing"],
+    "mergers & acquisitions specialist": ["Negotiation", "Financial analysis", "Strategy", "Communication"],
+    "procurement manager": ["Supplier negotiation", "Cost analysis", "Planning", "Coordination"],
+
+    # ---------- Creative & Arts ----------
+    "animator": ["Animation software", "Creativity", "Storytelling", "Attention to detail"],
+    "film director": ["Leadership", "Creative vision", "Communication", "Problem-solving"],
+    "set designer": ["Creativity", "Architecture sense", "Teamwork", "Budgeting"],
+    "composer": ["Music composition", "Instrument mastery", "Creativity", "Collaboration"],
+    "illustrator": ["Digital/hand illustration", "Creativity", "Typography", "Communication"],
+    "copywriter": ["Writing skills", "Creativity", "SEO knowledge", "Marketing understanding"],
+    "video editor": ["Editing software", "Creativity", "Storytelling", "Attention to detail"],
+    "sound engineer": ["Audio editing", "Mixing skills", "Attention to detail", "Creativity"],
+    "makeup artist": ["Makeup skills", "Creativity", "Client communication", "Precision"],
+    "voice actor": ["Vocal skills", "Acting", "Creativity", "Pronunciation"],
+    "game designer": ["Game mechanics knowledge", "Creativity", "Storytelling", "Programming basics"],
+    "stage actor": ["Acting", "Memorization", "Expressiveness", "Teamwork"],
+    "stunt performer": ["Physical skills", "Safety awareness", "Precision", "Adaptability"],
+    "illustration artist": ["Drawing", "Creativity", "Attention to detail", "Communication"],
+    "content creator": ["Creativity", "Writing", "Social media skills", "Time management"],
+    "podcaster": ["Communication", "Storytelling", "Editing", "Consistency"],
+    "web designer": ["HTML/CSS", "Creativity", "UX design", "Responsive design"],
+    "fashion stylist": ["Trend analysis", "Creativity", "Coordination", "Client communication"],
+    "cartoonist": ["Drawing", "Creativity", "Storytelling", "Attention to detail"],
+    "screenwriter": ["Storytelling", "Creativity", "Dialogue writing", "Collaboration"],
+    "producer": ["Project management", "Budgeting", "Communication", "Leadership"],
+    "mural artist": ["Creativity", "Painting skills", "Spatial awareness", "Teamwork"],
+    "concept artist": ["Digital art", "Creativity", "Visualization", "Software skills"],
+    "illustration designer": ["Illustration", "Digital tools", "Creativity", "Typography"],
+    "craft artist": ["Manual skills", "Creativity", "Design", "Attention to detail"],
+
+    # ---------- Education ----------
+    "instructional designer": ["Curriculum planning", "E-learning tools", "Creativity", "Communication"],
+    "special education teacher": ["Patience", "Teaching skills", "Empathy", "Adaptability"],
+    "education consultant": ["Research", "Policy knowledge", "Communication", "Planning"],
+    "school principal": ["Leadership", "Administration", "Communication", "Decision-making"],
+    "linguistics researcher": ["Language analysis", "Research skills", "Analytical thinking", "Writing"],
+    "curriculum coordinator": ["Lesson planning", "Collaboration", "Communication", "Organization"],
+    "academic advisor": ["Communication", "Planning", "Empathy", "Problem-solving"],
+    "library scientist": ["Cataloging", "Research", "Information management", "Attention to detail"],
+    "e-learning specialist": ["Tech skills", "Content creation", "Instructional design", "Adaptability"],
+    "teacher trainer": ["Communication", "Training skills", "Patience", "Organization"],
+    "career counselor": ["Guidance", "Communication", "Empathy", "Research"],
+    "principal secretary": ["Administration", "Coordination", "Communication", "Organization"],
+    "educational researcher": ["Data analysis", "Research skills", "Report writing", "Critical thinking"],
+    "language teacher": ["Linguistic knowledge", "Communication", "Patience", "Adaptability"],
+    "math teacher": ["Math knowledge", "Problem-solving", "Communication", "Patience"],
+    "science teacher": ["Science knowledge", "Experiment design", "Communication", "Observation"],
+    "history teacher": ["Research", "Storytelling", "Communication", "Critical thinking"],
+    "arts teacher": ["Creativity", "Art techniques", "Communication", "Mentoring"],
+    "physical education teacher": ["Fitness knowledge", "Motivation", "Planning", "Safety"],
+    "educational content writer": ["Writing", "Research", "Creativity", "Subject knowledge"],
+    "education administrator": ["Leadership", "Planning", "Organization", "Communication"],
+    "exam coordinator": ["Scheduling", "Organization", "Communication", "Attention to detail"],
+    "student support officer": ["Empathy", "Problem-solving", "Communication", "Organization"],
+    "adult educator": ["Teaching", "Communication", "Patience", "Organization"],
+    "online course instructor": ["Tech skills", "Communication", "Content creation", "Adaptability"],
+    "reading specialist": ["Literacy skills", "Patience", "Assessment", "Communication"],
+    "math tutor": ["Problem-solving", "Patience", "Communication", "Analytical skills"],
+    "language tutor": ["Linguistics knowledge", "Communication", "Patience", "Adaptability"],
+
+    # ---------- Law & Public Service ----------
+    "immigration officer": ["Communication", "Attention to detail", "Policy knowledge", "Problem-solving"],
+    "diplomat": ["Negotiation", "Communication", "Cultural knowledge", "Research"],
+    "forensic analyst": ["Evidence analysis", "Attention to detail", "Scientific knowledge", "Reporting"],
+    "mediator": ["Conflict resolution", "Communication", "Negotiation", "Patience"],
+    "policy advisor": ["Research", "Analysis", "Communication", "Strategic thinking"],
+    "law clerk": ["Legal research", "Writing", "Attention to detail", "Organization"],
+    "paralegal": ["Legal knowledge", "Research", "Writing", "Organization"],
+    "public relations officer": ["Media knowledge", "Communication", "Writing", "Problem-solving"],
+    "legislative assistant": ["Research", "Policy analysis", "Writing", "Organization"],
+    "government auditor": ["Analysis", "Attention to detail", "Reporting", "Organization"],
+    "sheriff deputy": ["Law enforcement", "Observation", "Decision-making", "Physical fitness"],
+    "probation officer": ["Monitoring", "Communication", "Empathy", "Documentation"],
+    "public defender": ["Legal knowledge", "Communication", "Advocacy", "Research"],
+    "judge's clerk": ["Legal research", "Attention to detail", "Organization", "Writing"],
+    "corrections officer": ["Security", "Observation", "Communication", "Decision-making"],
+    "customs officer": ["Inspection", "Attention to detail", "Communication", "Law knowledge"],
+    "tax investigator": ["Financial analysis", "Investigation", "Attention to detail", "Communication"],
+    "personal trainer": ["Fitness planning", "Motivation", "Exercise knowledge", "Communication"],
+    "gym manager": ["Organization", "Leadership", "Communication", "Problem-solving"],
+    "nutrition coach": ["Diet planning", "Communication", "Motivation", "Research"],
+    "swimming coach": ["Swimming skills", "Teaching", "Patience", "Motivation"],
+    "fitness model": ["Physical fitness", "Discipline", "Posing skills", "Endurance"],
+    "sports psychologist": ["Psychology knowledge", "Communication", "Analysis", "Empathy"],
+    "athletic trainer": ["First aid", "Exercise planning", "Motivation", "Observation"],
+    "strength & conditioning coach": ["Training programs", "Motivation", "Anatomy knowledge", "Monitoring"],
+    "marathon coach": ["Endurance training", "Planning", "Motivation", "Observation"],
+    "cycling coach": ["Technique", "Endurance knowledge", "Motivation", "Observation"],
+    "soccer coach": ["Team management", "Strategy planning", "Motivation", "Observation"],
+    "basketball coach": ["Team management", "Strategy planning", "Motivation", "Observation"],
+    "tennis coach": ["Technique coaching", "Patience", "Strategy", "Motivation"],
+    "boxing coach": ["Technique coaching", "Fitness knowledge", "Motivation", "Observation"],
+    "martial arts instructor": ["Technique", "Discipline", "Teaching", "Motivation"],
+    "ski instructor": ["Technique", "Patience", "Teaching", "Safety awareness"],
+    "climbing instructor": ["Safety knowledge", "Physical fitness", "Teaching", "Patience"],
+    "dance fitness instructor": ["Rhythm", "Motivation", "Creativity", "Communication"],
+    "sports commentator": ["Communication", "Knowledge of sport", "Quick thinking", "Writing"],
+    "referee": ["Rule knowledge", "Decision making", "Observation", "Communication"],
+    "gymnastics coach": ["Technique", "Physical fitness", "Motivation", "Observation"],
+    "track coach": ["Technique coaching", "Planning", "Motivation", "Observation"],
+    "swim instructor": ["Swimming skills", "Safety knowledge", "Patience", "Motivation"],
+    "sports analyst": ["Data analysis", "Knowledge of sport", "Reporting", "Observation"],
+    "weightlifting coach": ["Strength training", "Technique coaching", "Motivation", "Safety"],
+    "youth sports coordinator": ["Organization", "Motivation", "Planning", "Communication"],
+    "fitness blogger": ["Writing", "Creativity", "Social media", "Communication"],
+    "outdoor adventure guide": ["Safety knowledge", "Leadership", "Planning", "Physical fitness"],
+    "athlete scout": ["Observation", "Talent assessment", "Communication", "Knowledge of sport"],
+    "baker": ["Baking skills", "Precision", "Time management", "Creativity"],
+    "beautician": ["Skincare knowledge", "Technique", "Customer service", "Creativity"],
+    "welder": ["Technical skills", "Safety awareness", "Manual skills", "Precision"],
+    "plasterer": ["Plastering techniques", "Precision", "Tool usage", "Safety"],
+    "bricklayer": ["Masonry skills", "Measurement", "Strength", "Precision"],
+    "landscaper": ["Creativity", "Physical fitness", "Planning", "Plant knowledge"],
+    "cleaning supervisor": ["Team management", "Attention to detail", "Planning", "Organization"],
+    "security guard": ["Observation", "Safety knowledge", "Communication", "Decision-making"],
+    "janitor": ["Cleaning skills", "Organization", "Time management", "Attention to detail"],
+    "delivery driver": ["Driving skills", "Time management", "Navigation", "Customer service"],
+    "chauffeur": ["Driving skills", "Customer service", "Time management", "Navigation"],
+    "tailor": ["Sewing skills", "Precision", "Creativity", "Attention to detail"],
+    "shoemaker": ["Leatherwork skills", "Tool usage", "Precision", "Creativity"],
+    "receptionist": ["Communication", "Organization", "Customer service", "Multitasking"],
+    "catering manager": ["Food knowledge", "Organization", "Leadership", "Time management"],
+    "housekeeping manager": ["Team management", "Organization", "Attention to detail", "Planning"],
+    "laundry supervisor": ["Organization", "Efficiency", "Attention to detail", "Teamwork"],
+    "photography assistant": ["Photography skills", "Attention to detail", "Teamwork", "Creativity"],
+    "pest control technician": ["Safety knowledge", "Problem-solving", "Chemical handling", "Observation"],
+    "HVAC technician": ["Technical skills", "Problem-solving", "Safety awareness", "Analysis"],
+    "plumbing contractor": ["Project management", "Technical knowledge", "Safety", "Problem-solving"],
+    "furniture restorer": ["Woodworking", "Attention to detail", "Creativity", "Patience"],
+    "commercial pilot": ["Flying skills", "Navigation", "Decision making", "Communication"],
+    "flight attendant": ["Customer service", "Communication", "Safety knowledge", "Emergency response"],
+    "aviation mechanic": ["Mechanical skills", "Problem-solving", "Attention to detail", "Safety"],
+    "drone operator": ["Technical skills", "Navigation", "Safety awareness", "Problem-solving"],
+    "flight instructor": ["Teaching", "Flying skills", "Communication", "Safety"],
+    "cargo handler": ["Physical fitness", "Organization", "Safety awareness", "Teamwork"],
+    "airport manager": ["Leadership", "Planning", "Communication", "Problem-solving"],
+    "aerospace engineer": ["Engineering skills", "Problem-solving", "Design", "Analysis"],
+    "aircraft dispatcher": ["Coordination", "Communication", "Organization", "Decision-making"],
+    "ground crew": ["Physical fitness", "Teamwork", "Safety awareness", "Communication"],
+    "aviation safety inspector": ["Regulations knowledge", "Observation", "Reporting", "Decision-making"],
+    "aviation consultant": ["Industry knowledge", "Communication", "Problem-solving", "Analysis"],
+    "flight scheduler": ["Planning", "Organization", "Attention to detail", "Coordination"],
+    "aerial photographer": ["Drone/camera skills", "Observation", "Creativity", "Planning"],
+    "aviation maintenance planner": ["Scheduling", "Technical knowledge", "Coordination", "Safety"],
+    "airport security officer": ["Observation", "Problem-solving", "Communication", "Attention to detail"],
+    "charter pilot": ["Flying skills", "Navigation", "Customer service", "Decision-making"],
+    "flight operations analyst": ["Data analysis", "Attention to detail", "Problem-solving", "Reporting"],
+    "aviation software developer": ["Programming", "Problem-solving", "System design", "Attention to detail"],
+    "airline route planner": ["Data analysis", "Planning", "Decision-making", "Coordination"],
+    "helicopter pilot": ["Flying skills", "Navigation", "Decision making", "Safety awareness"],
+    "aviation meteorologist": ["Weather analysis", "Communication", "Attention to detail", "Reporting"],
+    "airport operations manager": ["Leadership", "Organization", "Coordination", "Decision-making"],
+    "flight simulator technician": ["Technical skills", "Problem-solving", "Attention to detail", "Maintenance"],
+    "aviation trainer": ["Teaching", "Communication", "Aviation knowledge", "Observation"],
+    "cargo pilot": ["Flying skills", "Navigation", "Safety procedures", "Decision-making"],
+    "airline customer service agent": ["Customer service", "Communication", "Problem-solving", "Patience"],
+    "aviation safety trainer": ["Teaching", "Regulation knowledge", "Communication", "Observation"],
+    "aircraft leasing specialist": ["Negotiation", "Market knowledge", "Communication", "Decision-making"],
+    "interpreter": ["Language skills", "Listening", "Communication", "Quick thinking"],
+    "tour guide": ["Communication", "Knowledge of culture", "Organization", "Interpersonal skills"],
+    "blogger": ["Writing", "Creativity", "Digital marketing", "Consistency"],
+    "vlogger": ["Video skills", "Creativity", "Communication", "Editing"],
+    "podcast host": ["Communication", "Storytelling", "Interviewing", "Content planning"],
+    "event host": ["Public speaking", "Organization", "Communication", "Engagement"],
+    "motivational speaker": ["Communication", "Confidence", "Storytelling", "Empathy"],
+    "life coach": ["Empathy", "Communication", "Problem-solving", "Motivation"],
+    "parliament researcher": ["Research", "Writing", "Policy analysis", "Organization"],
+    "career coach": ["Career guidance", "Empathy", "Communication", "Motivation"],
+    "voiceover artist": ["Vocal control", "Pronunciation", "Recording skills", "Creativity"],
+    "magician": ["Performance", "Creativity", "Manual dexterity", "Audience engagement"],
+    "professional gamer": ["Gaming skills", "Strategy", "Focus", "Teamwork"],
+    "e-sports coach": ["Game knowledge", "Strategy planning", "Motivation", "Communication"],
+    "street artist": ["Creativity", "Performance", "Public interaction", "Adaptability"],
+    "public speaker": ["Communication", "Confidence", "Storytelling", "Engagement"],
+    "book author": ["Writing skills", "Creativity", "Research", "Storytelling"],
+    "screenplay writer": ["Storytelling", "Dialogue writing", "Creativity", "Structure planning"],
+    "film critic": ["Film analysis", "Writing skills", "Attention to detail", "Communication"],
+    "cultural researcher": ["Research", "Writing", "Analysis", "Observation"],
+    "museum curator": ["Artifact knowledge", "Organization", "Research", "Communication"],
+    "archivist": ["Organization", "Research", "Attention to detail", "Preservation skills"],
+    "social media manager": ["Content creation", "Planning", "Communication", "Analytics"],
+    "photography blogger": ["Photography skills", "Editing", "Writing", "Creativity"],
+    "craft designer": ["Manual skills", "Creativity", "Attention to detail", "Planning"],
+    "eco-tourism guide": ["Environmental knowledge", "Communication", "Planning", "Customer service"],
+    "travel writer": ["Writing", "Research", "Creativity", "Storytelling"],
+    "documentary filmmaker": ["Filming", "Storytelling", "Editing", "Research"],
+    "street performer": ["Performance", "Creativity", "Audience engagement", "Adaptability"],
+    "digital nomad entrepreneur": ["Business skills", "Digital marketing", "Adaptability", "Problem-solving"],
+    "interior decorator": ["Creativity", "Spatial planning", "Color sense", "Client communication"],
+    "comic artist": ["Drawing skills", "Storytelling", "Creativity", "Consistency"],
+    "calligrapher": ["Handwriting", "Creativity", "Patience", "Design skills"],
+    "ceramic artist": ["Clay modeling", "Creativity", "Patience", "Attention to detail"],
+    "tattoo artist": ["Drawing skills", "Creativity", "Precision", "Hygiene awareness"],
+    "graphic illustrator": ["Digital illustration", "Creativity", "Software skills", "Communication"],
+    "sculptor": ["Sculpting", "Creativity", "Material knowledge", "Patience"],
+    "stage designer": ["Creativity", "Spatial design", "Collaboration", "Problem-solving"],
+    "costume designer": ["Creativity", "Sewing", "Research", "Collaboration"],
+    "puppeteer": ["Performance", "Creativity", "Dexterity", "Storytelling"],
+    "lighting designer": ["Technical skills", "Creativity", "Collaboration", "Problem-solving"],
+    "sound designer": ["Audio editing", "Creativity", "Attention to detail", "Collaboration"],
+    "storyboard artist": ["Sketching", "Storytelling", "Creativity", "Time management"],
+    "visual merchandiser": ["Creativity", "Marketing sense", "Spatial planning", "Presentation"],
+    "photographer assistant": ["Photography skills", "Attention to detail", "Equipment knowledge", "Teamwork"],
+    "art restorer": ["Art history", "Restoration techniques", "Precision", "Patience"],
+    "cinematographer": ["Camera skills", "Creativity", "Lighting knowledge", "Storytelling"],
+    "voice coach": ["Vocal training", "Patience", "Listening", "Communication"],
+    "film set coordinator": ["Organization", "Problem-solving", "Teamwork", "Communication"],
+    "choreographer": ["Creativity", "Physical fitness", "Memory", "Leadership"],
+    "musical director": ["Music theory", "Leadership", "Creativity", "Collaboration"],
+    "stage manager": ["Organization", "Communication", "Problem-solving", "Leadership"],
+    "dance instructor": ["Physical fitness", "Teaching", "Creativity", "Patience"],
+    "curriculum developer": ["Research", "Instructional design", "Writing", "Creativity"],
+    "online tutor": ["Subject knowledge", "Communication", "Tech skills", "Patience"],
+    "educational consultant": ["Analysis", "Communication", "Research", "Problem-solving"],
+    "school administrator": ["Organization", "Leadership", "Communication", "Planning"],
+    "college counselor": ["Guidance", "Communication", "Empathy", "Planning"],
+    "education researcher": ["Research", "Analysis", "Writing", "Attention to detail"],
+    "language instructor": ["Language skills", "Teaching", "Patience", "Communication"],
+    "STEM educator": ["Subject expertise", "Teaching skills", "Creativity", "Problem-solving"],
+    "art educator": ["Creativity", "Teaching skills", "Patience", "Communication"],
+    "music educator": ["Music skills", "Teaching", "Patience", "Communication"],
+    "science communicator": ["Research", "Writing", "Communication", "Creativity"],
+    "literacy coach": ["Teaching", "Communication", "Observation", "Problem-solving"],
+    "instructional coordinator": ["Planning", "Curriculum design", "Organization", "Communication"],
+    "school librarian": ["Organization", "Research", "Communication", "Tech skills"],
+    "education policy analyst": ["Research", "Writing", "Analysis", "Presentation"],
+    "academic publisher": ["Editing", "Research", "Communication", "Organization"],
+    "online course developer": ["Tech skills", "Content creation", "Instructional design", "Creativity"],
+    "tutoring program manager": ["Organization", "Communication", "Planning", "Leadership"],
+    "educational technologist": ["Tech skills", "Problem-solving", "Instructional design", "Creativity"],
+    "school psychologist": ["Psychology knowledge", "Empathy", "Communication", "Observation"],
+    "language pathologist": ["Communication", "Patience", "Therapy skills", "Observation"],
+    "vocational trainer": ["Technical knowledge", "Teaching", "Communication", "Problem-solving"],
+    "educational program evaluator": ["Research", "Analysis", "Communication", "Organization"],
+    "human rights officer": ["Research", "Empathy", "Advocacy", "Communication"],
+    "urban planner": ["Planning", "Research", "Problem-solving", "Collaboration"],
+    "public health officer": ["Research", "Communication", "Planning", "Analysis"],
+    "nonprofit manager": ["Leadership", "Organization", "Fundraising", "Communication"],
+    "legal researcher": ["Research", "Analysis", "Writing", "Attention to detail"],
+    "policy analyst": ["Research", "Writing", "Data analysis", "Communication"],
+    "lobbyist": ["Communication", "Negotiation", "Research", "Persuasion"],
+    "civil rights advocate": ["Research", "Communication", "Advocacy", "Empathy"],
+    "municipal officer": ["Organization", "Communication", "Planning", "Problem-solving"],
+    "fire inspector": ["Safety knowledge", "Attention to detail", "Inspection", "Communication"],
+    "public information officer": ["Communication", "Writing", "Media knowledge", "Organization"],
+    "court clerk": ["Organization", "Attention to detail", "Communication", "Problem-solving"],
+    "policy coordinator": ["Organization", "Research", "Communication", "Planning"],
+    "regulatory affairs officer": ["Research", "Compliance knowledge", "Attention to detail", "Communication"],
+    "intelligence analyst": ["Analysis", "Research", "Problem-solving", "Attention to detail"],
+    "government relations manager": ["Communication", "Networking", "Strategic thinking", "Planning"],
+    "public defender assistant": ["Research", "Legal knowledge", "Communication", "Attention to detail"],
+    "tax officer": ["Accounting knowledge", "Attention to detail", "Analysis", "Communication"],
+    "election officer": ["Organization", "Communication", "Attention to detail", "Problem-solving"],
+    "public policy researcher": ["Research", "Writing", "Data analysis", "Communication"],
+    "humanitarian officer": ["Empathy", "Planning", "Organization", "Communication"],
+    "community development officer": ["Planning", "Communication", "Organization", "Problem-solving"],
+    "sports physiologist": ["Knowledge of physiology", "Analysis", "Fitness assessment", "Communication"],
+    "strength and conditioning coach": ["Exercise science", "Motivation", "Planning", "Analysis"],
+    "sports nutritionist": ["Nutrition knowledge", "Planning", "Communication", "Analysis"],
+    "recreational therapist": ["Empathy", "Exercise knowledge", "Planning", "Motivation"],
+    "dance therapist": ["Dance skills", "Empathy", "Teaching", "Motivation"],
+    "surfing instructor": ["Surfing skills", "Patience", "Teaching", "Safety awareness"],
+    "rowing coach": ["Technique", "Leadership", "Motivation", "Observation"],
+    "triathlon coach": ["Endurance knowledge", "Planning", "Motivation", "Analysis"],
+    "basketball scout": ["Observation", "Analysis", "Communication", "Reporting"],
+    "soccer analyst": ["Analysis", "Communication", "Tactical knowledge", "Observation"],
+    "sports statistician": ["Data analysis", "Observation", "Reporting", "Attention to detail"],
+    "ice skating coach": ["Technique", "Patience", "Teaching", "Motivation"],
+    "athlete manager": ["Organization", "Communication", "Negotiation", "Planning"],
+    "parkour trainer": ["Physical fitness", "Teaching", "Motivation", "Safety awareness"],
+    "sports therapist": ["Physiotherapy knowledge", "Empathy", "Observation", "Communication"],
+    "locksmith": ["Technical skills", "Problem-solving", "Manual dexterity", "Precision"],
+    "glazier": ["Glass cutting", "Precision", "Safety awareness", "Problem-solving"],
+    "roofing contractor": ["Manual skills", "Planning", "Safety awareness", "Problem-solving"],
+    "gardener": ["Plant knowledge", "Physical fitness", "Planning", "Attention to detail"],
+    "pest control specialist": ["Technical knowledge", "Safety awareness", "Problem-solving", "Observation"],
+    "seamstress": ["Sewing skills", "Precision", "Creativity", "Patience"],
+    "house painter": ["Painting skills", "Precision", "Time management", "Attention to detail"],
+    "flooring installer": ["Manual skills", "Precision", "Planning", "Problem-solving"],
+    "tile setter": ["Manual skills", "Precision", "Planning", "Problem-solving"],
+    "car detailer": ["Attention to detail", "Cleaning skills", "Time management", "Patience"],
+    "handyman": ["Problem-solving", "Manual skills", "Versatility", "Time management"],
+    "furniture maker": ["Woodworking", "Creativity", "Precision", "Planning"],
+    "sign maker": ["Creativity", "Precision", "Design skills", "Planning"],
+    "mason": ["Technical skills", "Precision", "Problem-solving", "Manual skills"],
+    "drywall installer": ["Manual skills", "Precision", "Planning", "Problem-solving"],
+    "window installer": ["Manual skills", "Precision", "Planning", "Problem-solving"],
+    "equipment operator": ["Technical skills", "Safety awareness", "Attention to detail", "Problem-solving"],
+    "aircraft maintenance engineer": ["Technical knowledge", "Problem-solving", "Safety awareness", "Attention to detail"],
+    "flight operations officer": ["Planning", "Coordination", "Communication", "Attention to detail"],
+    "aviation inspector": ["Attention to detail", "Safety knowledge", "Regulatory knowledge", "Analysis"],
+    "airline scheduler": ["Planning", "Coordination", "Organization", "Communication"],
+    "aviation safety officer": ["Safety knowledge", "Analysis", "Problem-solving", "Communication"],
+    "flight dispatcher": ["Planning", "Communication", "Coordination", "Attention to detail"],
+    "aviation analyst": ["Analysis", "Research", "Communication", "Problem-solving"],
+    "maintenance planner": ["Planning", "Technical knowledge", "Coordination", "Problem-solving"],
+    "avionics technician": ["Technical skills", "Problem-solving", "Attention to detail", "Manual skills"],
+    "aircraft fueling operator": ["Safety awareness", "Attention to detail", "Physical fitness", "Problem-solving"],
+    "meteorologist (aviation)": ["Weather knowledge", "Analysis", "Communication", "Problem-solving"],
+    "pilot trainer": ["Flying skills", "Teaching", "Communication", "Patience"],
+    "airline operations manager": ["Leadership", "Planning", "Coordination", "Problem-solving"],
+    "cabin services manager": ["Leadership", "Customer service", "Communication", "Problem-solving"],
+    "flight simulator instructor": ["Technical knowledge", "Teaching", "Patience", "Communication"],
+    "aviation logistician": ["Planning", "Coordination", "Problem-solving", "Communication"],
+    "aircraft parts specialist": ["Technical knowledge", "Attention to detail", "Organization", "Problem-solving"],
+    "airline quality assurance officer": ["Analysis", "Attention to detail", "Problem-solving", "Communication"],
+    "air traffic systems engineer": ["Technical knowledge", "Analysis", "Problem-solving", "Communication"],
+    "market researcher": ["Research", "Analysis", "Communication", "Attention to detail"],
+    "real estate agent": ["Negotiation", "Communication", "Organization", "Marketing knowledge"],
+    "author": ["Writing", "Creativity", "Research", "Discipline"],
+    "travel blogger": ["Writing", "Photography", "Creativity", "Planning"],
+    "crafts maker": ["Creativity", "Manual skills", "Patience", "Design"],
+    "animal trainer": ["Patience", "Observation", "Training skills", "Empathy"],
+    "pet groomer": ["Animal handling", "Patience", "Attention to detail", "Safety"],
+    "florist": ["Creativity", "Design", "Manual skills", "Customer service"],
+    "museum guide": ["Communication", "History knowledge", "Interpersonal skills", "Presentation"],
+    "librarian assistant": ["Organization", "Communication", "Attention to detail", "Research"],
+    "app tester": ["Attention to detail", "Problem-solving", "Technical skills", "Communication"],
+    "UX researcher": ["Research", "Analysis", "Communication", "Observation"],
+    "sound technician": ["Technical knowledge", "Attention to detail", "Problem-solving", "Collaboration"],
+    "video producer": ["Planning", "Creativity", "Editing", "Communication"],
+    "drone photographer": ["Drone handling", "Photography", "Creativity", "Safety awareness"],
+    "fitness influencer": ["Social media", "Creativity", "Motivation", "Communication"],
+    "startup mentor": ["Guidance", "Communication", "Experience", "Problem-solving"],
+    "dance": [  # add a simpler key to catch "dance" or "dancing"
+        "Rhythm",
+        "Motivation",
+        "Creativity",
+        "Communication",
+        "Energy and stamina"
+    ],
+    "dancing": [  # optional
+        "Rhythm",
+        "Motivation",
+        "Creativity",
+        "Communication",
+        "Energy and stamina"],
+    "singing": [
+        "Mastery of a primary instrument or vocals",
+        "Understanding of music theory and composition",
+        "Collaboration and teamwork with other artists",
+        "Stage presence and confidence",
+        "Basic audio production and recording knowledge"
+    ],
+    "music": [  # general catch-all
+        "Mastery of a primary instrument or vocals",
+        "Understanding of music theory and composition",
+        "Collaboration and teamwork with other artists",
+        "Stage presence and confidence"
+    ],
+    # IT & Technical
+    # Healthcare
+    # Creative & Arts
+    # Trending skills
+    "trending skills 2026": ["AI & ML proficiency", "Data analytics", "Cloud computing", "Cybersecurity", "Emotional intelligence", "Creativity & innovation", "Critical thinking", "Communication", "Collaboration", "Adaptability"]
+
+}
+
+
+# ---------------- Phrase -> Career ----------------
+phrase_career_map = {
+    "i like dancing": "Dance Fitness Instructor",
+    "i enjoy dancing": "Dance Fitness Instructor",
+    "i love dancing": "Dance Fitness Instructor",
+    "i like music": "Musician",
+    "i enjoy music": "Musician",
+    "i love music": "Musician",
+    "i want to become a doctor": "Doctor",
+    "i want to be a doctor": "Doctor",
+    "i want to be a nurse": "Nurse",
+    "top paying jobs in data science": "Data Scientist",
+    "best career in ai": "AI Engineer",
+    "careers in cybersecurity": "Cybersecurity Analyst",
+    "high salary tech jobs": "Software Engineer",
+    "i love drawing": "Graphic Designer",
+    "i like helping people": "Social Worker"
+}
+
+
+# ---------------- Job / Course Recommendations ----------------
+job_recommendations = {
+    "Data Scientist": ["Complete a Machine Learning course on Coursera", "Look for Data Analyst internships"],
+    "Software Engineer": ["Learn Full-Stack Development on Udemy", "Explore junior developer jobs"],
+    "UI/UX Designer": ["Try Figma tutorials", "Build a Behance portfolio"],
+    "Teacher": ["Earn a teaching certification", "Apply for tutoring opportunities"],
+    # Add more career → recommendation pairs
+}
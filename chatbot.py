@@ -1,16 +1,17 @@
 # chatbot.py
 import random
 import pandas as pd
-import difflib
-import wikipedia
 from functools import lru_cache
-
-# Set Wikipedia language
-wikipedia.set_lang("en")
-
-# --- Load career data (local CSV) ---
+from knowledge_base import get_kb
+from bm25_index import BM25Index
+from phrase_matcher import PhraseMatcher
+from wiki_lookup import WikiLookup
+from http_client import HTTP_ERRORS
+from wiki_snapshot import get_wiki_snapshot
+
+# --- Load career data (compiled knowledge base) ---
 try:
-    career_df = pd.read_csv("career_data.csv")
+    career_df = pd.DataFrame(get_kb().examples, columns=['description', 'career'])
     career_df['description'] = career_df['description'].astype(str).str.lower()
 except FileNotFoundError:
     career_df = pd.DataFrame(columns=['description', 'career'])
@@ -32,53 +33,46 @@ responses = {
 # Keyword-to-response mapping
 keyword_map = {"hi": "hello", "hey": "hello", "hello": "hello", "thank": "thanks", "thanks": "thanks"}
 
-# --- Fuzzy career search ---
-def search_careers_fuzzy(user_input, threshold=0.4):
+# Response keys first, then keywords, so priority matches checking them in that order
+response_matcher = PhraseMatcher({**{key: key for key in responses},
+                                  **{w: k for w, k in keyword_map.items() if w not in responses}})
+
+# --- Career search (BM25 over career_data descriptions) ---
+_career_index = None
+
+def get_career_index():
+    global _career_index
+    if _career_index is None:
+        _career_index = BM25Index(list(zip(career_df['description'], career_df['career'])))
+    return _career_index
+
+def search_careers_fuzzy(user_input, threshold=1.0, expand="prefix"):
+    """Top-4 careers whose descriptions best match the input (BM25 score above threshold)."""
     if career_df.empty or not user_input.strip():
         return None
-    text = user_input.lower().strip()
-    words = [w for w in text.split() if len(w) > 2]
-    if not words:
-        return None
-    scores = {}
-    for desc, career in zip(career_df['description'], career_df['career']):
-        for word in words:
-            ratio = difflib.SequenceMatcher(None, word, desc).ratio()
-            scores[career] = max(scores.get(career, 0), ratio)
-    if not scores:
-        return None
-    ranked = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-    matches = [c for c, s in ranked if s >= threshold]
-    if matches:
-        return matches[:4]  # top 4 matches
-    return None
+    ranked = get_career_index().search(user_input, top_k=4, min_score=threshold, expand=expand)
+    matches = [career for career, _ in ranked]
+    return matches or None
 
 # --- Wikipedia integration ---
+_wiki = WikiLookup(max_candidates=3)
+
 @lru_cache(maxsize=256)
+def _wikipedia_summary(query, sentences):
+    # Raises on outages; lru_cache does not cache exceptions, so they are retried next time
+    page = get_wiki_snapshot().lookup(query, sentences=sentences)
+    if page:
+        return page
+    return _wiki.lookup(query, sentences=sentences, rank="search")
+
 def get_wikipedia_summary(query, sentences=3):
+    # Offline snapshot first; then the first non-disambiguation page in search order
     if not query.strip():
         return None
     try:
-        search_results = wikipedia.search(query, results=5)
-    except Exception:
+        return _wikipedia_summary(query, sentences)
+    except HTTP_ERRORS:
         return None
-    if not search_results:
-        return None
-    for title in search_results[:3]:
-        try:
-            page = wikipedia.page(title, auto_suggest=False)
-            summary = page.summary
-            if summary:
-                parts = summary.split('. ')
-                short = '. '.join(parts[:sentences])
-                if not short.endswith('.'):
-                    short += '.'
-                return {"title": page.title, "summary": short, "url": page.url}
-        except (wikipedia.DisambiguationError, wikipedia.PageError):
-            continue
-        except Exception:
-            continue
-    return None
 
 # --- Main chatbot response ---
 def get_response(user_input):
@@ -86,15 +80,10 @@ def get_response(user_input):
     if not text:
         return "Please type something about your interests or skills."
 
-    # 1) Predefined responses
-    for key in responses:
-        if key in text:
-            return random.choice(responses[key])
-
-    # 2) Keyword map
-    for word, mapped_key in keyword_map.items():
-        if word in text:
-            return random.choice(responses[mapped_key])
+    # 1) Predefined responses, 2) Keyword map (one pass over the text)
+    hit = response_matcher.best(text)
+    if hit:
+        return random.choice(responses[hit[1]])
 
     # 3) Fuzzy local career suggestion
     careers = search_careers_fuzzy(text)
@@ -0,0 +1,202 @@
+# compiled_classifier.py
+# Sklearn-free inference for the TF-IDF + LogisticRegression career classifier.
+#
+#   python compiled_classifier.py export   # career_model.pkl + vectorizer.pkl -> career_model_compiled.npz
+#   python compiled_classifier.py check    # parity against sklearn + latency benchmark
+import argparse
+import json
+import re
+import time
+from collections import Counter
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+COMPILED_FILE = "career_model_compiled.npz"
+
+
+# --- Export (needs sklearn, build time only) ---
+def export_compiled(model, vectorizer, out_path: str = COMPILED_FILE) -> None:
+    """
+    Fold the vectorizer's vocabulary and idf weights into the LR coefficients,
+    giving one float32 (n_terms x n_classes) table plus what is needed to
+    reproduce the analyzer and the l1/l2 normalisation.
+    """
+    if vectorizer.analyzer != "word" or vectorizer.preprocessor or vectorizer.tokenizer:
+        raise ValueError("Only the default word analyzer can be compiled")
+    if vectorizer.strip_accents:
+        raise ValueError("strip_accents is not supported by the compiled runtime")
+
+    vocab = vectorizer.vocabulary_
+    terms = np.empty(len(vocab), dtype=object)
+    for term, idx in vocab.items():
+        terms[idx] = term
+    idf = vectorizer.idf_.astype(np.float32) if vectorizer.use_idf else np.ones(len(vocab), np.float32)
+    weights = (model.coef_.T * idf[:, None]).astype(np.float32)
+
+    # multi_class is "deprecated" (or gone) on newer sklearn; liblinear is always one-vs-rest there
+    multi_class = getattr(model, "multi_class", "auto")
+    if model.coef_.shape[0] == 1:
+        link = "binary"
+    elif multi_class == "ovr" or (multi_class != "multinomial" and model.solver == "liblinear"):
+        link = "ovr"
+    else:
+        link = "softmax"
+
+    stop_words = vectorizer.get_stop_words() or []
+    meta = {
+        "lowercase": bool(vectorizer.lowercase),
+        "token_pattern": vectorizer.token_pattern,
+        "ngram_range": list(vectorizer.ngram_range),
+        "stop_words": sorted(stop_words),
+        "norm": vectorizer.norm,
+        "sublinear_tf": bool(vectorizer.sublinear_tf),
+        "binary": bool(vectorizer.binary),
+        "link": link,
+    }
+    np.savez(
+        out_path,
+        terms=terms.astype(str),
+        idf=idf,
+        weights=weights,
+        intercept=model.intercept_.astype(np.float32),
+        classes=np.asarray(model.classes_).astype(str),
+        meta=np.array(json.dumps(meta)),
+    )
+
+
+# --- Runtime (NumPy only) ---
+class CompiledClassifier:
+    """Scores token lists against the folded term-by-class weight table."""
+
+    def __init__(self, path: str = COMPILED_FILE):
+        with np.load(path, allow_pickle=False) as data:
+            self.vocabulary: Dict[str, int] = {t: i for i, t in enumerate(data["terms"].tolist())}
+            self.idf = data["idf"]
+            self.weights = data["weights"]
+            self.intercept = data["intercept"]
+            self.classes_ = data["classes"]
+            meta = json.loads(str(data["meta"]))
+        self.lowercase = meta["lowercase"]
+        self.token_re = re.compile(meta["token_pattern"])
+        self.ngram_range = tuple(meta["ngram_range"])
+        self.stop_words = frozenset(meta["stop_words"])
+        self.norm = meta["norm"]
+        self.sublinear_tf = meta["sublinear_tf"]
+        self.binary = meta["binary"]
+        self.link = meta["link"]
+
+    def tokenize(self, text: str) -> List[str]:
+        if self.lowercase:
+            text = text.lower()
+        return [t for t in self.token_re.findall(text) if t not in self.stop_words]
+
+    def _term_ids(self, tokens: Sequence[str]) -> Counter:
+        lo, hi = self.ngram_range
+        vocab = self.vocabulary
+        counts = Counter()
+        for n in range(lo, hi + 1):
+            for i in range(len(tokens) - n + 1):
+                idx = vocab.get(tokens[i] if n == 1 else " ".join(tokens[i:i + n]))
+                if idx is not None:
+                    counts[idx] += 1
+        return counts
+
+    def decision_function_tokens(self, tokens: Sequence[str]) -> np.ndarray:
+        counts = self._term_ids(tokens)
+        if not counts:
+            return self.intercept.copy()
+        ids = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        tf = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+        if self.binary:
+            tf[:] = 1.0
+        elif self.sublinear_tf:
+            tf = 1.0 + np.log(tf)
+        scores = tf @ self.weights[ids]
+        if self.norm == "l2":
+            scores /= np.sqrt(np.dot(tf * self.idf[ids], tf * self.idf[ids]))
+        elif self.norm == "l1":
+            scores /= np.abs(tf * self.idf[ids]).sum()
+        return scores + self.intercept
+
+    def predict_proba_tokens(self, tokens: Sequence[str]) -> np.ndarray:
+        z = self.decision_function_tokens(tokens)
+        if self.link == "binary":
+            p = 1.0 / (1.0 + np.exp(-z[0]))
+            return np.array([1.0 - p, p], dtype=np.float32)
+        if self.link == "ovr":
+            p = 1.0 / (1.0 + np.exp(-z))
+            return p / p.sum()
+        z = np.exp(z - z.max())
+        return z / z.sum()
+
+    def predict_proba(self, text: str) -> np.ndarray:
+        return self.predict_proba_tokens(self.tokenize(text))
+
+
+# --- Parity & latency ---
+SAMPLE_TEXTS = [
+    "I love coding and solving problems",
+    "I enjoy painting and sketching",
+    "I like analyzing data and statistics",
+    "I want to help patients recover in a hospital",
+    "I am passionate about teaching children",
+    "",
+]
+
+
+def check_parity(model, vectorizer, compiled: CompiledClassifier, texts: Sequence[str], atol: float = 1e-4):
+    """Return the max absolute probability difference; raises if classes or probabilities disagree."""
+    if list(compiled.classes_) != [str(c) for c in model.classes_]:
+        raise AssertionError("Compiled classes do not match the sklearn model")
+    expected = model.predict_proba(vectorizer.transform(list(texts)))
+    worst = 0.0
+    for text, row in zip(texts, expected):
+        got = compiled.predict_proba(text)
+        diff = float(np.max(np.abs(got - row)))
+        worst = max(worst, diff)
+        if diff > atol:
+            raise AssertionError(f"Probability mismatch {diff:.2e} for {text!r}")
+    return worst
+
+
+def benchmark(fn, texts: Sequence[str], repeat: int = 200) -> float:
+    """Mean latency per single-text call in microseconds."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            fn(text)
+    return (time.perf_counter() - start) / (repeat * len(texts)) * 1e6
+
+
+def _load_sklearn_artifacts(model_path, vectorizer_path):
+    from model_registry import load_pickle
+    return load_pickle(model_path), load_pickle(vectorizer_path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile or check the career classifier")
+    parser.add_argument("command", choices=["export", "check"])
+    parser.add_argument("--model", default="career_model.pkl",
+                        help="e.g. career_model.pkl or career_model_logreg.pkl")
+    parser.add_argument("--vectorizer", default="vectorizer.pkl")
+    parser.add_argument("--out", default=COMPILED_FILE)
+    parser.add_argument("--texts", help="CSV with a 'description' column to use for the check")
+    args = parser.parse_args()
+
+    model, vectorizer = _load_sklearn_artifacts(args.model, args.vectorizer)
+    if args.command == "export":
+        export_compiled(model, vectorizer, args.out)
+        print(f"✅ Compiled {len(vectorizer.vocabulary_)} terms x {len(model.classes_)} classes to '{args.out}'")
+    else:
+        texts = SAMPLE_TEXTS
+        if args.texts:
+            import pandas as pd
+            texts = pd.read_csv(args.texts)["description"].astype(str).tolist()
+        compiled = CompiledClassifier(args.out)
+        worst = check_parity(model, vectorizer, compiled, texts)
+        print(f"✅ Parity OK on {len(texts)} texts (max |Δp| = {worst:.2e})")
+        sk_us = benchmark(lambda t: model.predict_proba(vectorizer.transform([t])), texts)
+        np_us = benchmark(compiled.predict_proba, texts)
+        print(f"sklearn : {sk_us:8.1f} µs/call")
+        print(f"compiled: {np_us:8.1f} µs/call ({sk_us / np_us:.1f}x faster)")
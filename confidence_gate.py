@@ -0,0 +1,142 @@
+# confidence_gate.py
+# Decides when the local career classifier is sure enough to answer without remote sources.
+#
+#   python confidence_gate.py --log queries.csv   # replay a query log: remote calls / latency saved
+from typing import NamedTuple
+
+import numpy as np
+
+# Tuned for the 25-class career_model.pkl: its probabilities are spread thin (normalised
+# entropy 0.8-0.98 even on clear queries), so entropy can't separate confident rows.
+# Replaying confidence_gate_log.csv (40 labelled user-style queries): top-1 0.30 keeps
+# precision 1.00 and saves 2 of 21 remote calls; 0.25 drops precision to 0.67, and
+# from 0.40 up nothing passes. The 0.10 margin guards two-way ties at that top-1.
+DEFAULT_MIN_TOP = 0.30
+DEFAULT_MIN_MARGIN = 0.10
+
+
+class GateDecision(NamedTuple):
+    confident: bool
+    top: float       # top-1 probability
+    margin: float    # top-1 minus top-2 probability
+
+
+class ConfidenceGate:
+    """A prediction passes when its top-1 probability is high AND clearly ahead of the runner-up."""
+
+    def __init__(self, min_top: float = DEFAULT_MIN_TOP, min_margin: float = DEFAULT_MIN_MARGIN):
+        self.min_top = min_top
+        self.min_margin = min_margin
+        self.passed = self.rejected = 0
+
+    @staticmethod
+    def measure(probs: np.ndarray):
+        probs = np.asarray(probs, dtype=np.float64).ravel()
+        if probs.size < 2:
+            return 1.0, 1.0
+        top2 = np.partition(probs, probs.size - 2)[-2:]
+        return float(top2[1]), float(top2[1] - top2[0])
+
+    def assess(self, probs: np.ndarray) -> GateDecision:
+        top, margin = self.measure(probs)
+        confident = top >= self.min_top and margin >= self.min_margin
+        if confident:
+            self.passed += 1
+        else:
+            self.rejected += 1
+        return GateDecision(confident, top, margin)
+
+
+# --- Replay report ---
+def _local_answerers():
+    """Cheap local stages get_answer tries before the gate (phrases, keywords, skills, snapshot)."""
+    from knowledge_base import get_kb
+    from phrase_matcher import PhraseMatcher
+    from trigram_index import TrigramIndex
+    from wiki_snapshot import get_wiki_snapshot
+
+    kb = get_kb()
+    phrases = PhraseMatcher(kb.phrase_career_map)
+    skills = TrigramIndex(list(kb.skills.keys()))
+    snapshot = get_wiki_snapshot()
+    keywords = ["career", "job", "suit me", "suggest", "profession", "best", "future"]
+
+    def answered_locally(query_norm: str) -> bool:
+        return bool(phrases.best(query_norm) or any(k in query_norm for k in keywords)
+                    or skills.match(query_norm, 70) or snapshot.lookup(query_norm))
+    return answered_locally
+
+
+def _probabilities():
+    """Scores a normalised query exactly as app.career_probabilities does (preprocess, then correct_typo)."""
+    from model_registry import get_registry
+    from nlp_resources import load_resources
+
+    registry = get_registry()
+    nlp = load_resources()
+    spell = registry.get("spell_index")
+    compiled = registry.try_get("compiled_classifier")
+    if compiled is not None:
+        return lambda q: (compiled.classes_, compiled.predict_proba(spell.correct_text(nlp.preprocess_text(q))))
+    model, vectorizer = registry.get("career_model"), registry.get("vectorizer")
+    return lambda q: (model.classes_,
+                      model.predict_proba(vectorizer.transform([spell.correct_text(nlp.preprocess_text(q))]))[0])
+
+
+def replay(queries, remote_ms, labels=None, tops=(0.2, 0.25, 0.3, 0.4, 0.5, 0.6),
+           margins=(0.0, 0.05, 0.1, 0.2, 0.3)):
+    """
+    Rows of (min top-1, min margin, remote calls before, remote calls after, seconds saved,
+    precision). Savings are net of scoring every remote-bound query with the classifier;
+    precision is the share of gated answers whose top career matches `labels` (None without labels).
+    """
+    import time
+
+    answered_locally = _local_answerers()
+    proba = _probabilities()
+    labels = labels if labels is not None else [None] * len(queries)
+    measured, local_ms = [], []
+    for query, ms, label in zip(queries, remote_ms, labels):
+        # get_answer's normalize_text
+        query_norm = query.lower().strip()
+        if answered_locally(query_norm):
+            continue
+        start = time.perf_counter()
+        classes, probs = proba(query_norm)
+        correct = None if label is None else str(classes[int(np.argmax(probs))]) == label
+        measured.append((ConfidenceGate.measure(probs), ms, correct))
+        local_ms.append((time.perf_counter() - start) * 1e3)
+    rows = []
+    for t in tops:
+        for m in margins:
+            gated = [(ms, correct) for (top, margin), ms, correct in measured if top >= t and margin >= m]
+            judged = [c for _, c in gated if c is not None]
+            precision = sum(judged) / len(judged) if judged else None
+            saved = (sum(ms for ms, _ in gated) - sum(local_ms)) / 1e3
+            rows.append((t, m, len(measured), len(measured) - len(gated), saved, precision))
+    return rows
+
+
+if __name__ == "__main__":
+    import argparse
+
+    import pandas as pd
+
+    parser = argparse.ArgumentParser(description="Replay a query log through the confidence gate")
+    parser.add_argument("--log", required=True,
+                        help="CSV with a 'query' column (optional 'remote_ms', and 'career' labels for precision)")
+    parser.add_argument("--query-column", default="query")
+    parser.add_argument("--label-column", default="career")
+    parser.add_argument("--remote-ms", type=float, default=2500.0,
+                        help="remote answer latency to assume when the log has no 'remote_ms'")
+    args = parser.parse_args()
+
+    log = pd.read_csv(args.log).dropna(subset=[args.query_column])
+    remote_ms = log["remote_ms"].fillna(args.remote_ms) if "remote_ms" in log else [args.remote_ms] * len(log)
+    labels = log[args.label_column].astype(str).tolist() if args.label_column in log else None
+    print(f"{len(log)} queries replayed (defaults: top-1 {DEFAULT_MIN_TOP}, margin {DEFAULT_MIN_MARGIN})")
+    print("top-1  margin  remote before  remote after  calls saved  latency saved  precision")
+    for t, m, before, after, saved, precision in replay(log[args.query_column].astype(str).tolist(),
+                                                        list(remote_ms), labels):
+        shown = "     -" if precision is None else f"{precision:9.2f}"
+        print(f"{t:5.2f}  {m:6.2f}  {before:13d}  {after:12d}  {before - after:11d}  {saved:12.1f}s  {shown}")
@@ -0,0 +1,99 @@
+# fallback_fanout.py
+# Run several remote answer sources at once and keep the best-priority answer within a deadline.
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool(workers: int) -> ThreadPoolExecutor:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fallback")
+    return _pool
+
+
+class FanoutResult(NamedTuple):
+    answer: Optional[str]
+    source: Optional[str]
+    seconds: float
+    timed_out: bool
+
+
+def fan_out(sources: Sequence[Tuple[str, Callable[[str], Optional[str]]]], query: str,
+            deadline: float = 6.0, workers: int = 8,
+            hedge: Optional[Dict[str, float]] = None) -> FanoutResult:
+    """
+    Run the sources on the shared pool. `sources` is in priority order: an
+    answer is returned as soon as it arrives and every higher-priority source
+    has already come back empty. At the deadline the best answer received so
+    far wins. Sources named in `hedge` (name -> seconds) are expensive: they
+    start only after that delay, or earlier once every higher-priority source
+    has come back empty, and never if a cheaper answer wins first. Sources
+    already running when the result is decided finish in the background and
+    their results are dropped (their own caching still keeps them).
+    """
+    start = time.perf_counter()
+    pool = _get_pool(workers)
+    hedge = hedge or {}
+    delays = [hedge.get(name) for name, _ in sources]
+    answers: List[Optional[str]] = [None] * len(sources)
+    finished = [False] * len(sources)
+    started = [False] * len(sources)
+    pending = set()
+    index = {}
+
+    def launch(elapsed: float) -> None:
+        for i, (_, fetch) in enumerate(sources):
+            if started[i]:
+                continue
+            ahead_empty = all(finished[j] and not answers[j] for j in range(i))
+            if delays[i] is None or elapsed >= delays[i] or ahead_empty:
+                started[i] = True
+                future = pool.submit(fetch, query)
+                index[future] = i
+                pending.add(future)
+
+    def decided() -> Optional[int]:
+        for i, done in enumerate(finished):
+            if not done:
+                return None
+            if answers[i]:
+                return i
+        return -1  # all empty
+
+    winner = None
+    while True:
+        elapsed = time.perf_counter() - start
+        launch(elapsed)
+        remaining = deadline - elapsed
+        if remaining <= 0 or not pending:
+            break
+        waits = [delays[i] - elapsed for i in range(len(sources)) if not started[i]]
+        done, _ = wait(pending, timeout=min([remaining] + waits), return_when=FIRST_COMPLETED)
+        for f in done:
+            pending.discard(f)
+            i = index[f]
+            finished[i] = True
+            try:
+                answers[i] = f.result()
+            except Exception:
+                answers[i] = None
+        winner = decided()
+        if winner is not None:
+            break
+
+    timed_out = winner is None
+    if timed_out:
+        winner = next((i for i, a in enumerate(answers) if a), -1)
+    for f in pending:
+        f.cancel()
+    elapsed = time.perf_counter() - start
+    if winner < 0:
+        return FanoutResult(None, None, elapsed, timed_out)
+    return FanoutResult(answers[winner], sources[winner][0], elapsed, timed_out)
@@ -24,3 +24,4 @@ with open("career_info.json", "w") as f:
     json.dump(career_info, f, indent=4)
 
 print(f"Generated career_info.json with {len(careers)} careers.")
+print("Run `python build_knowledge_base.py` to refresh career_kb.pkl.")
@@ -39,3 +39,4 @@ with open("recommender.json", "w", encoding="utf-8") as f:
     json.dump(recs, f, indent=2, ensure_ascii=False)
 
 print(f"recommender.json created with {len(careers)} careers.")
+print("Run `python build_knowledge_base.py` to refresh career_kb.pkl.")
@@ -0,0 +1,162 @@
+# http_client.py
+# Shared HTTP layer for the remote answer sources: pooled keep-alive connections,
+# latency-derived timeouts and a circuit breaker per source.
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+USER_AGENT = "CareerGuidanceAI/1.0 (career chatbot)"
+
+
+class SourceUnavailable(RuntimeError):
+    """The upstream could not be asked (transport error, timeout, open breaker) - not a "no result"."""
+
+
+class CircuitOpenError(SourceUnavailable):
+    """Raised instead of calling a source whose breaker is open."""
+
+
+class SourceState:
+    """Latency window, counters and breaker state for one upstream."""
+
+    def __init__(self, failure_threshold: int, cooldown: float, window: int = 200):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.latencies = deque(maxlen=window)
+        self.calls = self.successes = self.failures = self.short_circuited = 0
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+        self.lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            # Half-open: after the cooldown let a single probe call through
+            if not self.probing and time.monotonic() - self.opened_at >= self.cooldown:
+                self.probing = True
+                return True
+            self.short_circuited += 1
+            return False
+
+    def record(self, ok: bool, seconds: float) -> None:
+        with self.lock:
+            self.calls += 1
+            if ok:
+                self.successes += 1
+                self.latencies.append(seconds)
+                self.consecutive_failures = 0
+                self.opened_at = None
+            else:
+                self.failures += 1
+                self.consecutive_failures += 1
+                if self.probing or self.consecutive_failures >= self.failure_threshold:
+                    self.opened_at = time.monotonic()
+            self.probing = False
+
+    def percentile(self, p: float) -> Optional[float]:
+        with self.lock:
+            if not self.latencies:
+                return None
+            ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        return "half-open" if time.monotonic() - self.opened_at >= self.cooldown else "open"
+
+
+class HttpClient:
+    """
+    One requests.Session (and connection pool) for every source. A request's
+    timeout is 3x the source's observed p95 latency, kept within
+    [min_timeout, max_timeout]; until `warm_samples` calls have succeeded the
+    caller's (or the default) timeout is used. After `failure_threshold`
+    consecutive failures a source is skipped for `cooldown` seconds.
+    """
+
+    def __init__(self, default_timeout: float = 5.0, min_timeout: float = 0.5, max_timeout: float = 8.0,
+                 failure_threshold: int = 3, cooldown: float = 30.0, warm_samples: int = 20,
+                 pool_size: int = 16):
+        self.default_timeout = default_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.warm_samples = warm_samples
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers["User-Agent"] = USER_AGENT
+        self._sources: Dict[str, SourceState] = {}
+        self._lock = threading.Lock()
+
+    def source(self, name: str) -> SourceState:
+        state = self._sources.get(name)
+        if state is None:
+            with self._lock:
+                state = self._sources.setdefault(name, SourceState(self.failure_threshold, self.cooldown))
+        return state
+
+    def timeout_for(self, name: str, timeout: Optional[float] = None) -> float:
+        state = self.source(name)
+        limit = self.default_timeout if timeout is None else timeout
+        if len(state.latencies) < self.warm_samples:
+            return limit
+        adaptive = min(self.max_timeout, max(self.min_timeout, 3 * state.percentile(95)))
+        return min(adaptive, limit)
+
+    def get_json(self, source: str, url: str, params: Optional[Dict] = None,
+                 timeout: Optional[float] = None):
+        """GET url and decode JSON; raises CircuitOpenError, requests.RequestException or ValueError."""
+        state = self.source(source)
+        if not state.allow():
+            raise CircuitOpenError(f"{source} circuit open")
+        start = time.perf_counter()
+        try:
+            r = self.session.get(url, params=params, timeout=self.timeout_for(source, timeout))
+            r.raise_for_status()
+            data = r.json()
+        except Exception:
+            # Anything else counts as a failure too, or a half-open probe would never be cleared
+            state.record(False, time.perf_counter() - start)
+            raise
+        state.record(True, time.perf_counter() - start)
+        return data
+
+    def metrics(self) -> Dict[str, Dict]:
+        out = {}
+        for name, state in list(self._sources.items()):
+            p50, p95 = state.percentile(50), state.percentile(95)
+            out[name] = {
+                "state": state.state, "calls": state.calls, "successes": state.successes,
+                "failures": state.failures, "short_circuited": state.short_circuited,
+                "p50_ms": None if p50 is None else p50 * 1e3,
+                "p95_ms": None if p95 is None else p95 * 1e3,
+                "timeout_s": self.timeout_for(name),
+            }
+        return out
+
+
+# Transient failures: callers answer "nothing this time" but must not cache it as a miss
+HTTP_ERRORS = (SourceUnavailable, requests.RequestException, ValueError)
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> HttpClient:
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = HttpClient()
+    return _client
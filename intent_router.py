@@ -0,0 +1,74 @@
+# intent_router.py
+# Predicts which get_answer stage will answer a query, so it can be called directly.
+import logging
+import threading
+from typing import Dict, Optional, Tuple
+
+ROUTER_FILE = "intent_router_compiled.npz"
+# get_answer stages a query can be routed to (cascade order)
+ROUTES = ("career", "skills", "wiki", "web", "chat")
+
+logger = logging.getLogger(__name__)
+
+
+class RouterStats:
+    """
+    Per-route dispatch/hit counts and latency. `cascade_cost[route]` is an
+    EWMA of how long the full cascade took when that route's stage ended up
+    answering; a routed hit is credited with that cost minus its own time.
+    """
+
+    def __init__(self, alpha: float = 0.1):
+        self.alpha = alpha
+        self.dispatched: Dict[str, int] = {r: 0 for r in ROUTES}
+        self.hits: Dict[str, int] = {r: 0 for r in ROUTES}
+        self.saved_seconds: Dict[str, float] = {r: 0.0 for r in ROUTES}
+        self.cascade_cost: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record_cascade(self, route: Optional[str], seconds: float) -> None:
+        if route is None:
+            return
+        with self._lock:
+            prev = self.cascade_cost.get(route)
+            self.cascade_cost[route] = seconds if prev is None else prev + self.alpha * (seconds - prev)
+
+    def record_dispatch(self, route: str, hit: bool, seconds: float) -> float:
+        with self._lock:
+            self.dispatched[route] += 1
+            saved = 0.0
+            if hit:
+                self.hits[route] += 1
+                saved = max(self.cascade_cost.get(route, seconds) - seconds, 0.0)
+                self.saved_seconds[route] += saved
+        logger.info("route=%s hit=%s %.1fms saved~%.1fms (hit rate %d/%d)", route, hit, seconds * 1e3,
+                    saved * 1e3, self.hits[route], self.dispatched[route])
+        return saved
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {r: {"dispatched": self.dispatched[r], "hits": self.hits[r],
+                        "hit_rate": self.hits[r] / self.dispatched[r] if self.dispatched[r] else 0.0,
+                        "saved_s": self.saved_seconds[r]}
+                    for r in ROUTES}
+
+
+class IntentRouter:
+    """Compiled TF-IDF + LR route classifier (train_intent_router.py) with a confidence floor."""
+
+    def __init__(self, path: str = ROUTER_FILE, min_confidence: float = 0.6):
+        from compiled_classifier import CompiledClassifier
+
+        self.classifier = CompiledClassifier(path)
+        self.min_confidence = min_confidence
+        self.stats = RouterStats()
+
+    def predict(self, query_norm: str) -> Tuple[Optional[str], float]:
+        """(route, probability); route is None when the classifier is not confident enough."""
+        proba = self.classifier.predict_proba(query_norm)
+        best = int(proba.argmax())
+        confidence = float(proba[best])
+        route = str(self.classifier.classes_[best])
+        if confidence < self.min_confidence or route not in ROUTES:
+            return None, confidence
+        return route, confidence
@@ -0,0 +1,48 @@
+# knowledge_base.py
+import os
+import pickle
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+KB_FILE = "career_kb.pkl"
+
+
+class CareerKB:
+    """Read-only view over the compiled knowledge base (see build_knowledge_base.py)."""
+
+    def __init__(self, data: Dict[str, Any]):
+        self.version: str = data.get("version", "unknown")
+        self.career_info: Dict[str, Dict[str, Any]] = data.get("career_info", {})
+        self.career_courses: Dict[str, List[Tuple[str, str]]] = data.get("career_courses", {})
+        self.skills: Dict[str, List[str]] = data.get("skills", {})
+        self.phrase_career_map: Dict[str, str] = data.get("phrase_career_map", {})
+        self.recommendations: Dict[str, Dict[str, Any]] = data.get("recommendations", {})
+        self.job_recommendations: Dict[str, List[str]] = data.get("job_recommendations", {})
+        self.examples: List[Tuple[str, str]] = data.get("examples", [])
+
+    def info(self, career: str, default=None) -> Optional[Dict[str, Any]]:
+        return self.career_info.get(career, default)
+
+    def courses(self, career: str) -> List[Tuple[str, str]]:
+        return self.career_courses.get(career, [])
+
+    def skills_for(self, career: str) -> List[str]:
+        return self.skills.get(career.lower(), [])
+
+
+_kb: Optional[CareerKB] = None
+_lock = threading.Lock()
+
+
+def get_kb(path: str = KB_FILE) -> CareerKB:
+    """Load career_kb.pkl once per process."""
+    global _kb
+    if _kb is None:
+        with _lock:
+            if _kb is None:
+                if not os.path.exists(path):
+                    raise FileNotFoundError(
+                        f"'{path}' not found. Run `python build_knowledge_base.py` first.")
+                with open(path, "rb") as f:
+                    _kb = CareerKB(pickle.load(f))
+    return _kb
@@ -0,0 +1,187 @@
+# model_registry.py
+import hashlib
+import os
+import pickle
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+class ModelRegistry:
+    """
+    Loads each model artifact at most once per process, on first use.
+
+    Loaders are registered by name; `get(name)` runs the loader the first time
+    and returns the same in-memory instance afterwards. Loading is guarded by a
+    per-artifact lock so concurrent Streamlit sessions never build a model twice.
+    A failed load is re-raised without retrying until its backoff expires
+    (`retry_base` seconds, doubling per consecutive failure up to `retry_max`);
+    `reset(name)` clears it immediately, e.g. after the artifact is restored.
+    """
+
+    def __init__(self, retry_base: float = 30.0, retry_max: float = 600.0):
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._errors: Dict[str, Exception] = {}
+        self._failures: Dict[str, int] = {}
+        self._retry_at: Dict[str, float] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._load_times: Dict[str, float] = {}
+        self._warmup_thread: Optional[threading.Thread] = None
+
+    def register(self, name: str, loader: Callable[[], Any]) -> None:
+        self._loaders[name] = loader
+        self._locks.setdefault(name, threading.Lock())
+
+    def has(self, name: str) -> bool:
+        return name in self._loaders
+
+    def get(self, name: str) -> Any:
+        if name in self._instances:
+            return self._instances[name]
+        if name not in self._loaders:
+            raise KeyError(f"No loader registered for '{name}'")
+        with self._locks[name]:
+            if name in self._instances:
+                return self._instances[name]
+            if name in self._errors and time.monotonic() < self._retry_at[name]:
+                raise self._errors[name]
+            start = time.perf_counter()
+            try:
+                instance = self._loaders[name]()
+            except Exception as e:
+                failures = self._failures.get(name, 0) + 1
+                self._failures[name] = failures
+                self._errors[name] = e
+                self._retry_at[name] = time.monotonic() + min(self.retry_base * 2 ** (failures - 1), self.retry_max)
+                raise
+            finally:
+                self._load_times[name] = time.perf_counter() - start
+            self.reset(name)
+            self._instances[name] = instance
+            return instance
+
+    def reset(self, name: str) -> None:
+        """Forget a cached load failure so the next get() tries the loader again."""
+        self._errors.pop(name, None)
+        self._failures.pop(name, None)
+        self._retry_at.pop(name, None)
+
+    def try_get(self, name: str) -> Any:
+        """Like get(), but returns None instead of raising when loading fails."""
+        try:
+            return self.get(name)
+        except Exception:
+            return None
+
+    def error(self, name: str) -> Optional[Exception]:
+        return self._errors.get(name)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._instances
+
+    def load_times(self) -> Dict[str, float]:
+        """Seconds spent loading each artifact that has been requested so far."""
+        return dict(self._load_times)
+
+    def warmup(self, names=None, background: bool = True) -> Optional[threading.Thread]:
+        """Load the given artifacts (default: all) now, optionally on a daemon thread."""
+        names = list(names) if names is not None else list(self._loaders)
+
+        def _run():
+            for name in names:
+                self.try_get(name)
+
+        if not background:
+            _run()
+            return None
+        if self._warmup_thread is None or not self._warmup_thread.is_alive():
+            self._warmup_thread = threading.Thread(target=_run, name="model-warmup", daemon=True)
+            self._warmup_thread.start()
+        return self._warmup_thread
+
+
+# --- Artifact loaders ---
+def load_pickle(path: str) -> Any:
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+
+def load_sentence_transformer(name: str = "paraphrase-MiniLM-L6-v2"):
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(name)
+
+
+def load_compiled_classifier(path: str):
+    from compiled_classifier import CompiledClassifier
+    return CompiledClassifier(path)
+
+
+def load_intent_router(path: str):
+    from intent_router import IntentRouter
+    return IntentRouter(path)
+
+
+def load_spell_index(registry: "ModelRegistry"):
+    # Classifier vocabulary plus every career and skill name in the knowledge base;
+    # words WordNet knows are never "corrected" into that vocabulary
+    from knowledge_base import get_kb
+    from nlp_resources import load_resources
+    from spell_index import build_spell_index
+
+    kb = get_kb()
+    nlp = load_resources()
+    vectorizer = registry.try_get("vectorizer")
+    vocabulary = vectorizer.vocabulary_.keys() if vectorizer is not None else []
+    # Without WordNet a real word can't be told from a typo ("baking" -> "making"),
+    # so every token counts as known and correction is off
+    is_known = (lambda word: True) if "wordnet" in nlp.missing else nlp.is_english_word
+    return build_spell_index(vocabulary, kb.career_info.keys(), kb.skills.keys(), is_known=is_known)
+
+
+def build_default_registry(base_dir: str = ".") -> ModelRegistry:
+    registry = ModelRegistry()
+    registry.register("career_model", lambda: load_pickle(os.path.join(base_dir, "career_model.pkl")))
+    registry.register("vectorizer", lambda: load_pickle(os.path.join(base_dir, "vectorizer.pkl")))
+    registry.register("embedding_model", load_sentence_transformer)
+    # Optional: produced by `python compiled_classifier.py export`
+    registry.register("compiled_classifier",
+                      lambda: load_compiled_classifier(os.path.join(base_dir, "career_model_compiled.npz")))
+    # Optional: produced by `python train_intent_router.py`
+    registry.register("intent_router", lambda: load_intent_router(os.path.join(base_dir, "intent_router_compiled.npz")))
+    # Shared by app.py's correct_typo and the confidence gate replay
+    registry.register("spell_index", lambda: load_spell_index(registry))
+    return registry
+
+
+# Artifacts whose contents define "the model" for anything caching its outputs
+MODEL_FILES = ("career_model.pkl", "vectorizer.pkl", "career_model_compiled.npz", "intent_router_compiled.npz")
+
+
+def model_version(base_dir: str = ".", files=MODEL_FILES) -> str:
+    """Short content hash of the model artifacts present on disk."""
+    digest = hashlib.sha256()
+    for name in files:
+        path = os.path.join(base_dir, name)
+        if os.path.exists(path):
+            digest.update(name.encode())
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+    return digest.hexdigest()[:12]
+
+
+_default_registry: Optional[ModelRegistry] = None
+_default_lock = threading.Lock()
+
+
+def get_registry() -> ModelRegistry:
+    """Process-wide registry shared by the app and the CLIs."""
+    global _default_registry
+    if _default_registry is None:
+        with _default_lock:
+            if _default_registry is None:
+                _default_registry = build_default_registry()
+    return _default_registry
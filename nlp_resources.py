@@ -0,0 +1,214 @@
+# nlp_resources.py
+import csv
+import logging
+import os
+import pickle
+import re
+import sys
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set
+
+# Corpora are vendored next to the app (see `python nlp_resources.py --vendor`)
+# and never downloaded at request time.
+VENDOR_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "nltk_data")
+RESOURCES_FILE = "nlp_resources.pkl"
+REQUIRED_CORPORA = {
+    "stopwords": "corpora/stopwords",
+    "wordnet": "corpora/wordnet",
+    "omw-1.4": "corpora/omw-1.4",
+}
+# Text sources whose tokens are pre-lemmatized into the lookup table
+VOCAB_SOURCES = [
+    ("generated_dataset.csv", "Description"),
+    ("generated_dataset_fixed.csv", "Description"),
+    ("career_data.csv", "description"),
+]
+
+logger = logging.getLogger(__name__)
+
+
+class NLPResources:
+    """
+    Stop words plus a word -> lemma lookup table used by preprocess_text.
+    `missing` lists the corpora that were unavailable, i.e. degraded
+    preprocessing (sklearn stop words and/or no lemmatization).
+    """
+
+    def __init__(self, stop_words: Set[str], lemma_table: Dict[str, str], lemmatizer=None,
+                 missing: Optional[List[str]] = None, cache_size: int = 50000):
+        self.stop_words = stop_words
+        self.lemma_table = lemma_table
+        self._lemmatizer = lemmatizer
+        self.missing = missing or []
+        # Words outside the prebuilt table are memoized in a bounded LRU, not the table itself
+        self._lemmatize_unknown = lru_cache(maxsize=cache_size)(self._lemmatize_uncached)
+
+    def _lemmatize_uncached(self, word: str) -> str:
+        return self._lemmatizer.lemmatize(word) if self._lemmatizer else word
+
+    def lemmatize(self, word: str) -> str:
+        lemma = self.lemma_table.get(word)
+        return lemma if lemma is not None else self._lemmatize_unknown(word)
+
+    def is_english_word(self, word: str) -> bool:
+        """True for stop words and anything WordNet knows, inflections included."""
+        if word in self.stop_words:
+            return True
+        if self._lemmatizer is None:
+            return False
+        from nltk.corpus import wordnet
+        return wordnet.morphy(word) is not None
+
+    def preprocess_text(self, text: str, strip_pattern: str = r'[^\w\s]') -> str:
+        text = re.sub(strip_pattern, '', text.lower())
+        return ' '.join(self.lemmatize(w) for w in text.split() if w not in self.stop_words)
+
+
+# --- Corpus discovery (local only) ---
+def _use_vendor_dir():
+    import nltk
+    if os.path.isdir(VENDOR_DIR) and VENDOR_DIR not in nltk.data.path:
+        nltk.data.path.insert(0, VENDOR_DIR)
+
+
+def missing_corpora() -> list:
+    """Names of required corpora that are not available locally."""
+    try:
+        import nltk
+    except ImportError:
+        return list(REQUIRED_CORPORA)
+    _use_vendor_dir()
+    missing = []
+    for name, path in REQUIRED_CORPORA.items():
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            # Zipped corpora are found under the same path with a .zip suffix
+            try:
+                nltk.data.find(path + ".zip")
+            except LookupError:
+                missing.append(name)
+    return missing
+
+
+def _warn_missing(missing: List[str]) -> None:
+    if missing:
+        logger.warning("NLP corpora missing (%s): preprocessing is degraded; run "
+                       "`python nlp_resources.py --vendor` to fix", ", ".join(missing))
+
+
+def _fallback_stop_words() -> Set[str]:
+    from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+    return set(ENGLISH_STOP_WORDS)
+
+
+def iter_vocabulary(sources=VOCAB_SOURCES) -> Iterable[str]:
+    seen = set()
+    for path, column in sources:
+        if not os.path.exists(path):
+            continue
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                text = re.sub(r'[^\w\s]', '', (row.get(column) or "").lower())
+                for word in text.split():
+                    if word not in seen:
+                        seen.add(word)
+                        yield word
+
+
+def build_resources(vocabulary: Optional[Iterable[str]] = None) -> NLPResources:
+    """Build stop words and the lemma table from locally available corpora."""
+    missing = missing_corpora()
+    _warn_missing(missing)
+    if "stopwords" in missing:
+        stop_words = _fallback_stop_words()
+    else:
+        from nltk.corpus import stopwords
+        stop_words = set(stopwords.words('english'))
+
+    lemmatizer = None
+    if "wordnet" not in missing:
+        from nltk.stem import WordNetLemmatizer
+        lemmatizer = WordNetLemmatizer()
+
+    lemma_table = {}
+    if lemmatizer is not None:
+        for word in (vocabulary if vocabulary is not None else iter_vocabulary()):
+            if word not in stop_words:
+                lemma_table[word] = lemmatizer.lemmatize(word)
+    return NLPResources(stop_words, lemma_table, lemmatizer, missing)
+
+
+def save_resources(resources: NLPResources, path: str = RESOURCES_FILE) -> None:
+    with open(path, "wb") as f:
+        pickle.dump({"stop_words": resources.stop_words, "lemma_table": resources.lemma_table}, f)
+
+
+_resources: Optional[NLPResources] = None
+
+
+def load_resources(path: str = RESOURCES_FILE) -> NLPResources:
+    """
+    Return the process-wide resources, checking the local disk exactly once.
+    Prefers the prebuilt pickle; otherwise builds from vendored corpora.
+    """
+    global _resources
+    if _resources is not None:
+        return _resources
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        lemmatizer = None
+        missing = [name for name in missing_corpora() if name != "stopwords"]
+        _warn_missing(missing)
+        if "wordnet" not in missing:
+            from nltk.stem import WordNetLemmatizer
+            lemmatizer = WordNetLemmatizer()
+        _resources = NLPResources(data["stop_words"], data["lemma_table"], lemmatizer, missing)
+    else:
+        _resources = build_resources()
+    return _resources
+
+
+# --- Build-time helpers ---
+def vendor_corpora(target_dir: str = VENDOR_DIR) -> None:
+    """Download the corpora into the repo once, on a machine with network access."""
+    import nltk
+    for name in REQUIRED_CORPORA:
+        nltk.download(name, download_dir=target_dir)
+
+
+def measure_startup() -> Dict[str, float]:
+    """Compare the old nltk.download() preamble against load_resources()."""
+    global _resources
+    timings = {}
+    start = time.perf_counter()
+    import nltk
+    for name in REQUIRED_CORPORA:
+        nltk.download(name, quiet=True)
+    from nltk.corpus import stopwords
+    from nltk.stem import WordNetLemmatizer
+    WordNetLemmatizer()
+    set(stopwords.words('english'))
+    timings["nltk_download"] = time.perf_counter() - start
+
+    _resources = None
+    start = time.perf_counter()
+    load_resources()
+    timings["load_resources"] = time.perf_counter() - start
+    return timings
+
+
+if __name__ == "__main__":
+    if "--vendor" in sys.argv:
+        vendor_corpora()
+        print(f"✅ Corpora vendored into '{VENDOR_DIR}'")
+    elif "--benchmark" in sys.argv:
+        for name, seconds in measure_startup().items():
+            print(f"{name}: {seconds * 1000:.1f} ms")
+    else:
+        resources = build_resources()
+        save_resources(resources)
+        print(f"✅ Saved {len(resources.stop_words)} stop words and "
+              f"{len(resources.lemma_table)} lemmas to '{RESOURCES_FILE}'")
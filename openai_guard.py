@@ -0,0 +1,155 @@
+# openai_guard.py
+# Single-flight coalescing and a local request/token budget in front of the OpenAI fallback.
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from answer_cache import canonical_query
+from openai_stream import StreamingAnswer, open_stream
+
+
+class TokenBucket:
+    """Continuously refilled bucket; take() never blocks."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self.stamp = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.stamp) * self.rate)
+        self.stamp = now
+
+    def available(self, amount: float) -> bool:
+        self._refill()
+        return self.level >= amount
+
+    def take(self, amount: float) -> None:
+        self.level -= amount
+
+    def give(self, amount: float) -> None:
+        self.level = min(self.capacity, self.level + amount)
+
+
+class RateBudget:
+    """Process-wide requests-per-minute and tokens-per-minute limits."""
+
+    def __init__(self, requests_per_minute: float = 60, tokens_per_minute: float = 40000):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self._lock = threading.Lock()
+
+    def try_acquire(self, tokens: float) -> bool:
+        with self._lock:
+            if not (self.requests.available(1) and self.tokens.available(tokens)):
+                return False
+            self.requests.take(1)
+            self.tokens.take(tokens)
+            return True
+
+    def settle(self, reserved: float, used: float) -> None:
+        """Return the unused part of a reservation (or charge the overrun)."""
+        with self._lock:
+            self.tokens.give(reserved - used)
+
+
+def estimate_tokens(text: str) -> int:
+    # ~4 characters per token for English text
+    return len(text) // 4 + 1
+
+
+class _Flight:
+    def __init__(self):
+        self.event = threading.Event()
+        self.answer: Optional[StreamingAnswer] = None
+
+
+class OpenAIGuard:
+    """
+    Concurrent calls for the same canonical question share one in-flight
+    completion: followers get the leader's StreamingAnswer, including while it
+    is still streaming. A new call is only made if the budget has room for the
+    prompt plus max_tokens; otherwise it is rejected at once (never queued)
+    and the caller degrades. Reservations are settled against the streamed
+    length when the completion ends.
+    """
+
+    def __init__(self, budget: Optional[RateBudget] = None, max_tokens: int = 250,
+                 open_fn: Callable[..., Optional[StreamingAnswer]] = open_stream,
+                 follower_timeout: float = 10.0):
+        self.budget = budget or RateBudget()
+        self.max_tokens = max_tokens
+        self.open_fn = open_fn
+        self.follower_timeout = follower_timeout
+        self._inflight: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+        self.counters = {"calls": 0, "coalesced": 0, "rejected": 0, "failed": 0}
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.counters[name] += 1
+
+    def _release(self, key: str, flight: _Flight) -> None:
+        with self._lock:
+            if self._inflight.get(key) is flight:
+                del self._inflight[key]
+
+    def answer(self, query: str,
+               on_complete: Optional[Callable[[str], None]] = None) -> Optional[StreamingAnswer]:
+        key = canonical_query(query)
+        if not key:
+            # Nothing to coalesce on: an unkeyable query always gets its own call
+            key = object()
+        with self._lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+            else:
+                self.counters["coalesced"] += 1
+        if not leader:
+            flight.event.wait(self.follower_timeout)
+            return flight.answer
+
+        reserved = estimate_tokens(query) + 20 + self.max_tokens
+        try:
+            if not self.budget.try_acquire(reserved):
+                self._count("rejected")
+                return None
+            self._count("calls")
+            flight.answer = self.open_fn(query, max_tokens=self.max_tokens, on_complete=on_complete)
+            if flight.answer is None:
+                self._count("failed")
+                self.budget.settle(reserved, 0)
+        finally:
+            flight.event.set()
+            if flight.answer is None:
+                self._release(key, flight)
+        if flight.answer is None:
+            return None
+
+        def finished(answer: StreamingAnswer) -> None:
+            self.budget.settle(reserved, estimate_tokens(query) + 20 + estimate_tokens(answer.text))
+            self._release(key, flight)
+
+        flight.answer.add_done_callback(finished)
+        return flight.answer
+
+    def metrics(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self.counters, "in_flight": len(self._inflight)}
+
+
+_guard: Optional[OpenAIGuard] = None
+_guard_lock = threading.Lock()
+
+
+def get_openai_guard() -> OpenAIGuard:
+    global _guard
+    if _guard is None:
+        with _guard_lock:
+            if _guard is None:
+                _guard = OpenAIGuard()
+    return _guard
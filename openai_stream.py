@@ -0,0 +1,203 @@
+# openai_stream.py
+# Token-streaming OpenAI fallback with time-to-first-token / total latency tracking.
+#
+#   python openai_stream.py --selftest   # streams from a local OpenAI-compatible stub server
+import os
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Iterator, List, Optional
+
+SYSTEM_PROMPT = "You are a career advisor assistant."
+OPENAI_API_BASE = os.environ.get("OPENAI_API_BASE")  # e.g. http://127.0.0.1:8001/v1 for a stub
+
+
+class LatencyStats:
+    """Recent time-to-first-token and total stream latencies, in seconds."""
+
+    def __init__(self, window: int = 500):
+        self.ttft = deque(maxlen=window)
+        self.total = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, ttft: float, total: float) -> None:
+        with self._lock:
+            self.ttft.append(ttft)
+            self.total.append(total)
+
+    @staticmethod
+    def _pct(samples, p) -> Optional[float]:
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        with self._lock:
+            ttft, total = list(self.ttft), list(self.total)
+        return {"n": len(total), "ttft_p50": self._pct(ttft, 50), "ttft_p95": self._pct(ttft, 95),
+                "total_p50": self._pct(total, 50), "total_p95": self._pct(total, 95)}
+
+
+STATS = LatencyStats()
+
+
+class StreamingAnswer:
+    """
+    Text chunks from one chat completion, shareable by several readers. The
+    first chunk is pulled eagerly by open_stream() so an empty or failed
+    stream is known before the answer is handed out; a background thread then
+    drains the rest into a buffer. Every iteration (e.g. st.write_stream)
+    replays the buffer and follows it live. `on_complete(text)` runs when the
+    stream ends normally; done callbacks run however it ends.
+    """
+
+    def __init__(self, chunks: Iterator[str], first: str, started: float,
+                 on_complete: Optional[Callable[[str], None]] = None):
+        self._parts: List[str] = [first]
+        self._started = started
+        self.ttft = time.perf_counter() - started
+        self.total: Optional[float] = None
+        self.completed = False
+        self.done = False
+        self.on_complete = on_complete
+        self._callbacks: List[Callable[["StreamingAnswer"], None]] = []
+        self._cond = threading.Condition()
+        threading.Thread(target=self._pump, args=(chunks,), daemon=True, name="openai-stream").start()
+
+    def _pump(self, chunks: Iterator[str]) -> None:
+        try:
+            for chunk in chunks:
+                with self._cond:
+                    self._parts.append(chunk)
+                    self._cond.notify_all()
+            self.completed = True
+        except Exception:
+            pass
+        self.total = time.perf_counter() - self._started
+        if self.completed:
+            STATS.record(self.ttft, self.total)
+            if self.on_complete:
+                self.on_complete(self.text)
+        with self._cond:
+            self.done = True
+            self._cond.notify_all()
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            callback(self)
+
+    def add_done_callback(self, callback: Callable[["StreamingAnswer"], None]) -> None:
+        with self._cond:
+            if not self.done:
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    def __bool__(self):
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        i = 0
+        while True:
+            with self._cond:
+                while i >= len(self._parts) and not self.done:
+                    self._cond.wait()
+                if i >= len(self._parts):
+                    return
+                chunk = self._parts[i]
+            i += 1
+            yield chunk
+
+    def wait(self, timeout: Optional[float] = None) -> str:
+        with self._cond:
+            self._cond.wait_for(lambda: self.done, timeout)
+        return self.text
+
+    def __str__(self):
+        return self.text
+
+
+def _content_chunks(response) -> Iterator[str]:
+    for chunk in response:
+        choices = chunk.get("choices") or [{}]
+        content = choices[0].get("delta", {}).get("content")
+        if content:
+            yield content
+
+
+def open_stream(query: str, model: str = "gpt-3.5-turbo", max_tokens: int = 250,
+                api_base: Optional[str] = OPENAI_API_BASE,
+                on_complete: Optional[Callable[[str], None]] = None) -> Optional[StreamingAnswer]:
+    """Start a streamed completion and wait for its first token; None if it fails or is empty."""
+    import openai
+
+    started = time.perf_counter()
+    kwargs = {"api_base": api_base} if api_base else {}
+    try:
+        response = openai.ChatCompletion.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": query}
+            ],
+            max_tokens=max_tokens,
+            stream=True,
+            **kwargs,
+        )
+        chunks = _content_chunks(response)
+        first = next(chunks, None)
+    except Exception:
+        return None
+    if first is None:
+        return None
+    return StreamingAnswer(chunks, first, started, on_complete)
+
+
+# --- Local OpenAI-compatible stub ---
+def _stub_server(words: int = 40, delay: float = 0.02):
+    import json
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            for i in range(words):
+                chunk = {"id": "stub", "object": "chat.completion.chunk", "model": "stub",
+                         "choices": [{"index": 0, "delta": {"content": f"word{i} "}, "finish_reason": None}]}
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                self.wfile.flush()
+                time.sleep(delay)
+            self.wfile.write(b"data: [DONE]\n\n")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    import sys
+
+    if "--selftest" in sys.argv:
+        import openai
+
+        server = _stub_server()
+        openai.api_key = openai.api_key or "stub"
+        answer = open_stream("What does a data analyst do?",
+                             api_base=f"http://127.0.0.1:{server.server_address[1]}/v1")
+        if answer is None:
+            print("❌ no stream from the stub")
+        else:
+            for chunk in answer:
+                print(chunk, end="", flush=True)
+            print(f"\nttft {answer.ttft * 1e3:.0f} ms · total {answer.total * 1e3:.0f} ms")
+        server.shutdown()
@@ -0,0 +1,105 @@
+# phrase_matcher.py
+# Aho-Corasick multi-phrase matcher: all phrase hits in one pass over the query.
+from collections import deque
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+
+class PhraseMatcher:
+    """
+    Substring matcher over many phrases at once. Phrases keep the priority of
+    their insertion order, so best() returns the same hit as looping over the
+    phrases in order with `phrase in text`. New phrases are inserted into the
+    trie immediately; failure links are recomputed lazily on the next search.
+    """
+
+    def __init__(self, phrases: Optional[Mapping[str, Any]] = None):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._own: List[List[int]] = [[]]   # phrases ending exactly at each node
+        self._out: List[List[int]] = [[]]   # own phrases plus those reachable by failure links
+        self._phrases: List[str] = []
+        self._values: List[Any] = []
+        self._ids: Dict[str, int] = {}
+        self._dirty = False
+        if phrases:
+            for phrase, value in phrases.items():
+                self.add(phrase, value)
+            self._build()
+
+    def __len__(self):
+        return len(self._phrases)
+
+    def __contains__(self, phrase: str) -> bool:
+        return phrase in self._ids
+
+    def add(self, phrase: str, value: Any) -> None:
+        """Add a phrase with the lowest priority so far; re-adding only updates its value."""
+        if phrase in self._ids:
+            self._values[self._ids[phrase]] = value
+            return
+        if not phrase:
+            return
+        pid = len(self._phrases)
+        self._phrases.append(phrase)
+        self._values.append(value)
+        self._ids[phrase] = pid
+        node = 0
+        for ch in phrase:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._own.append([])
+            node = nxt
+        self._own[node].append(pid)
+        self._dirty = True
+
+    def sync(self, phrases: Mapping[str, Any]) -> None:
+        """Bring the matcher in line with a dict that only grows (e.g. learned phrases)."""
+        if any(p not in phrases for p in self._ids):
+            self.__init__(phrases)
+            return
+        for phrase, value in phrases.items():
+            self.add(phrase, value)
+
+    def _build(self) -> None:
+        # BFS over the trie: failure links, then merged output lists
+        self._out = [list(own) for own in self._own]
+        queue = deque()
+        for child in self._goto[0].values():
+            self._fail[child] = 0
+            queue.append(child)
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[child] = self._goto[f].get(ch, 0)
+                self._out[child] += self._out[self._fail[child]]
+        self._dirty = False
+
+    def find_all(self, text: str) -> List[int]:
+        """Ids of every phrase occurring in text, in priority order."""
+        if self._dirty:
+            self._build()
+        goto, fail, out = self._goto, self._fail, self._out
+        hits = set()
+        node = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                hits.update(out[node])
+        return sorted(hits)
+
+    def best(self, text: str) -> Optional[Tuple[str, Any]]:
+        """(phrase, value) of the highest-priority phrase found in text, or None."""
+        hits = self.find_all(text)
+        if not hits:
+            return None
+        return self._phrases[hits[0]], self._values[hits[0]]
@@ -22,39 +22,35 @@ career_info = {
 }
 
 
-from transformers import BertTokenizer, BertForSequenceClassification
-import torch
-import pickle
+from bert_inference import BertInferenceEngine
 
-# Load BERT model and tokenizer
-tokenizer = BertTokenizer.from_pretrained("career_bert_model")
-model = BertForSequenceClassification.from_pretrained("career_bert_model")
+# Load BERT model, tokenizer and label encoder once; inference is batched
+engine = BertInferenceEngine("career_bert_model", "label_encoder.pkl")
 
-# Load label encoder
-with open("label_encoder.pkl", "rb") as f:
-    le = pickle.load(f)
+def predict_careers(descriptions):
+    """Career info for a list of descriptions (one forward pass per length-sorted batch)."""
+    careers = engine.predict(descriptions)
+    results = []
+    for career in careers:
+        info = career_info.get(career, {"description": "N/A", "next_steps": []})
+        results.append({
+            "predicted_career": career,
+            "description": info["description"],
+            "next_steps": info["next_steps"]
+        })
+    return results
 
 def predict_career(user_input):
-    inputs = tokenizer(user_input, return_tensors="pt", truncation=True, padding=True)
-    outputs = model(**inputs)
-    pred = torch.argmax(outputs.logits, dim=1)
-    career = le.inverse_transform(pred.detach().numpy())[0]
-    
-    info = career_info.get(career, {"description": "N/A", "next_steps": []})
-    
-    return {
-        "predicted_career": career,
-        "description": info["description"],
-        "next_steps": info["next_steps"]
-    }
+    return predict_careers([user_input])[0]
 
 
 # Function to do bulk prediction from CSV
 def bulk_predict(csv_path):
     df = pd.read_csv(csv_path)
-    df['predicted_career'] = df['description'].apply(lambda x: predict_career(x)['predicted_career'])
-    df['career_description'] = df['description'].apply(lambda x: predict_career(x)['description'])
-    df['next_steps'] = df['description'].apply(lambda x: ", ".join(predict_career(x)['next_steps']))
+    results = predict_careers(df['description'].astype(str).tolist())
+    df['predicted_career'] = [r['predicted_career'] for r in results]
+    df['career_description'] = [r['description'] for r in results]
+    df['next_steps'] = [", ".join(r['next_steps']) for r in results]
     
     output_file = "career_predictions.csv"
     df.to_csv(output_file, index=False)
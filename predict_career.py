@@ -1,6 +1,11 @@
 import pickle
 import pandas as pd
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from knowledge_base import get_kb
+from batch_predict import predict_topk_batch
+from prediction_io import read_predictions_input, write_predictions
 
 # --- Load the saved vectorizer and both models safely ---
 def safe_load(file_name, fallback_name=None):
@@ -20,29 +25,8 @@ vectorizer = safe_load('vectorizer.pkl')
 model_logreg = safe_load('career_model_logreg.pkl', fallback_name='career_model_lr.pkl')
 model_rf = safe_load('career_model_rf.pkl')
 
-# --- Career info dictionary ---
-career_info = {
-    "Software Engineer": {
-        "description": "Designs and develops software applications.",
-        "next_steps": ["Learn Python/Java/C++", "Build small projects", "Study algorithms"]
-    },
-    "Data Scientist": {
-        "description": "Analyzes data to extract insights and build predictive models.",
-        "next_steps": ["Learn Python/R", "Study statistics & ML", "Work on Kaggle projects"]
-    },
-    "Graphic Designer": {
-        "description": "Creates visual or digital graphics.",
-        "next_steps": ["Practice design tools", "Build portfolio", "Study color theory"]
-    },
-    "Mechanical Engineer": {
-        "description": "Designs and analyzes mechanical systems.",
-        "next_steps": ["Learn CAD tools", "Work on projects", "Study thermodynamics"]
-    },
-    "Teacher": {
-        "description": "Educates and guides students.",
-        "next_steps": ["Plan lessons", "Practice teaching", "Engage in classroom activities"]
-    }
-}
+# --- Career info (compiled knowledge base) ---
+career_info = get_kb().career_info
 
 # --- Predict career ---
 def predict_career(description):
@@ -81,16 +65,52 @@ def predict_career(description):
     }
 
 # --- Bulk CSV prediction ---
-def bulk_predict(csv_path, output_file="career_predictions.csv"):
-    df = pd.read_csv(csv_path)
-    df['LogReg_Career'] = df['Description'].apply(lambda x: predict_career(x)['LogisticRegression']['career'])
-    df['LogReg_Description'] = df['Description'].apply(lambda x: predict_career(x)['LogisticRegression']['description'])
-    df['LogReg_NextSteps'] = df['Description'].apply(lambda x: ", ".join(predict_career(x)['LogisticRegression']['next_steps']))
-    df['RF_Career'] = df['Description'].apply(lambda x: predict_career(x)['RandomForest']['career'])
-    df['RF_Description'] = df['Description'].apply(lambda x: predict_career(x)['RandomForest']['description'])
-    df['RF_NextSteps'] = df['Description'].apply(lambda x: ", ".join(predict_career(x)['RandomForest']['next_steps']))
-    df.to_csv(output_file, index=False)
-    print(f"✅ Bulk predictions saved to '{output_file}'")
+BULK_COLUMNS = ['LogReg_Career', 'LogReg_Description', 'LogReg_NextSteps',
+                'RF_Career', 'RF_Description', 'RF_NextSteps']
+SHARD_ROWS = 20000
+
+def score_descriptions(descriptions):
+    """All six bulk output columns for a list of descriptions, in one vectorized pass."""
+    codes, uniques = pd.factorize(pd.Series(descriptions, dtype=object).astype(str), sort=False)
+    if not vectorizer or not model_logreg or not model_rf:
+        unavailable = predict_career("")["LogisticRegression"]
+        row = [unavailable["career"], unavailable["description"], ""] * 2
+        return pd.DataFrame([row] * len(codes), columns=BULK_COLUMNS)
+
+    X = vectorizer.transform(uniques.tolist())
+    columns = {}
+    for prefix, model in (("LogReg", model_logreg), ("RF", model_rf)):
+        careers = model.predict(X)
+        infos = [career_info.get(c, {"description": "N/A", "next_steps": []}) for c in careers]
+        columns[f"{prefix}_Career"] = careers[codes]
+        columns[f"{prefix}_Description"] = pd.Series([i["description"] for i in infos], dtype=object).to_numpy()[codes]
+        columns[f"{prefix}_NextSteps"] = pd.Series([", ".join(i["next_steps"]) for i in infos], dtype=object).to_numpy()[codes]
+    return pd.DataFrame(columns, columns=BULK_COLUMNS)
+
+def bulk_predict(csv_path, output_file="career_predictions.csv", workers=None, shard_rows=SHARD_ROWS):
+    """
+    Input may be CSV or Parquet; the output format (csv, csv.gz, csv.zst, parquet) follows output_file.
+    Large files are split into shards scored by a process pool (each worker loads the
+    models once, on import) and merged back in input order.
+    """
+    start = time.perf_counter()
+    df = read_predictions_input(csv_path)
+    descriptions = df['Description'].tolist()
+    workers = workers or os.cpu_count() or 1
+    shards = [descriptions[i:i + shard_rows] for i in range(0, len(descriptions), shard_rows)]
+
+    if workers > 1 and len(shards) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(shards))) as pool:
+            parts = list(pool.map(score_descriptions, shards))
+    else:
+        parts = [score_descriptions(shard) for shard in shards]
+
+    scored = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(columns=BULK_COLUMNS)
+    df = pd.concat([df.reset_index(drop=True), scored], axis=1)
+    write_predictions(df, output_file)
+    seconds = time.perf_counter() - start
+    print(f"✅ Bulk predictions saved to '{output_file}' "
+          f"({len(df):,} rows in {seconds:.1f}s, {len(df) / max(seconds, 1e-9):,.0f} rows/s)")
 
 # --- Interactive mode ---
 if __name__ == "__main__":
@@ -118,21 +138,25 @@ if __name__ == "__main__":
         
 def predict_top_n(description, n=3):
     """Return top-n career suggestions with probabilities using LogisticRegression."""
+    batch = predict_top_n_batch([description], n=n)
+    return batch[0] if batch else []
+
+def predict_top_n_batch(descriptions, n=3):
+    """predict_top_n for a list of descriptions, scored in one vectorized pass."""
     if not vectorizer or not model_logreg:
         return []
-    desc_vec = vectorizer.transform([description])
-    probs = model_logreg.predict_proba(desc_vec)[0]
-    classes = model_logreg.classes_
-    # Sort by probability
-    top_indices = probs.argsort()[::-1][:n]
-    suggestions = []
-    for i in top_indices:
-        career = classes[i]
-        info = career_info.get(career, {"description": "N/A", "next_steps": []})
-        suggestions.append({
-            "career": career,
-            "probability": round(probs[i] * 100, 2),
-            "description": info["description"],
-            "next_steps": info["next_steps"]
-        })
-    return suggestions
+    top = predict_topk_batch(descriptions, n, model=model_logreg, vectorizer=vectorizer)
+    results = []
+    for ids, scores in zip(top.ids, top.scores):
+        suggestions = []
+        for i, p in zip(ids, scores):
+            career = top.classes[i]
+            info = career_info.get(career, {"description": "N/A", "next_steps": []})
+            suggestions.append({
+                "career": career,
+                "probability": round(float(p) * 100, 2),
+                "description": info["description"],
+                "next_steps": info["next_steps"]
+            })
+        results.append(suggestions)
+    return results
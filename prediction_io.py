@@ -0,0 +1,155 @@
+# prediction_io.py
+# Input/output formats for bulk career predictions: CSV, gzip/zstd CSV and Parquet.
+import io
+from typing import Iterator, List, Optional
+
+import pandas as pd
+
+FORMATS = ["csv", "csv.gz", "csv.zst", "parquet"]
+MIME_TYPES = {
+    "csv": "text/csv",
+    "csv.gz": "application/gzip",
+    "csv.zst": "application/zstd",
+    "parquet": "application/vnd.apache.parquet",
+}
+_CODECS = {"csv.gz": "gzip", "csv.zst": "zstd"}
+# Free-text input columns are never dictionary-encoded
+TEXT_COLUMNS = {"description", "Description"}
+
+
+def format_from_path(path: str, default: str = "csv") -> str:
+    name = path.lower()
+    for fmt in sorted(FORMATS, key=len, reverse=True):
+        if name.endswith("." + fmt):
+            return fmt
+    return default
+
+
+def read_predictions_input(source, fmt: Optional[str] = None) -> pd.DataFrame:
+    """Read a CSV (optionally compressed) or Parquet file of descriptions."""
+    fmt = fmt or format_from_path(getattr(source, "name", source) if not isinstance(source, str) else source)
+    if fmt == "parquet":
+        return pd.read_parquet(source)
+    if fmt in _CODECS:
+        return pd.read_csv(source, compression=_CODECS[fmt])
+    return pd.read_csv(source)
+
+
+def iter_parquet_chunks(source, batch_rows: int = 65536) -> Iterator[pd.DataFrame]:
+    import pyarrow.parquet as pq
+    for batch in pq.ParquetFile(source).iter_batches(batch_size=batch_rows):
+        yield batch.to_pandas()
+
+
+def categorical_columns(df: pd.DataFrame, max_ratio: float = 0.5) -> List[str]:
+    """Low-cardinality string columns (careers, skills, mapped names) worth dictionary-encoding."""
+    cols = []
+    for col in df.columns:
+        if col in TEXT_COLUMNS or df[col].dtype != object or len(df) == 0:
+            continue
+        if df[col].nunique(dropna=True) <= max_ratio * len(df):
+            cols.append(col)
+    return cols
+
+
+def _to_arrow(df: pd.DataFrame, dictionary_columns: List[str], schema=None):
+    import pyarrow as pa
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if schema is not None:
+        return table.cast(schema)
+    fields = []
+    for field in table.schema:
+        if field.name in dictionary_columns:
+            # Fixed int32 indices keep the schema identical across streamed chunks
+            field = pa.field(field.name, pa.dictionary(pa.int32(), pa.string()))
+        fields.append(field)
+    return table.cast(pa.schema(fields))
+
+
+class PredictionWriter:
+    """
+    Incremental writer for scored chunks. Parquet output uses `schema` when
+    given; otherwise it is inferred from the first chunk (dictionary-encoded
+    columns included) and reused for the rest of the file, so pass a schema
+    whenever a later chunk's types could differ (e.g. an all-null column).
+
+        with PredictionWriter("out.parquet") as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+    """
+
+    def __init__(self, sink, fmt: Optional[str] = None, schema=None):
+        if fmt is None:
+            fmt = format_from_path(sink) if isinstance(sink, str) else "csv"
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown output format '{fmt}'; expected one of {FORMATS}")
+        self.sink = sink
+        self.fmt = fmt
+        self._stream = None
+        self._parquet = None
+        self._dictionary_columns: Optional[List[str]] = None
+        self._schema = schema
+        self.rows = 0
+
+    def _open(self, first: pd.DataFrame):
+        self._dictionary_columns = categorical_columns(first)
+        if self.fmt == "csv":
+            self._stream = open(self.sink, "w", newline="", encoding="utf-8") if isinstance(self.sink, str) \
+                else io.TextIOWrapper(self.sink, encoding="utf-8", newline="")
+            return
+        import pyarrow as pa
+        sink = self.sink if isinstance(self.sink, str) else pa.PythonFile(self.sink, mode="w")
+        if self.fmt == "parquet":
+            import pyarrow.parquet as pq
+            if self._schema is None:
+                self._schema = _to_arrow(first, self._dictionary_columns).schema
+            self._parquet = pq.ParquetWriter(sink, self._schema, compression="zstd", use_dictionary=True)
+        else:
+            self._stream = pa.CompressedOutputStream(sink, _CODECS[self.fmt])
+
+    def write(self, df: pd.DataFrame) -> None:
+        first = self._dictionary_columns is None
+        if first:
+            self._open(df)
+        if self.fmt == "csv":
+            df.to_csv(self._stream, header=first, index=False)
+        elif self.fmt == "parquet":
+            self._parquet.write_table(_to_arrow(df, self._dictionary_columns, self._schema))
+        else:
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+            pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), self._stream,
+                            write_options=pacsv.WriteOptions(include_header=first))
+        self.rows += len(df)
+
+    def close(self) -> None:
+        if self._parquet is not None:
+            self._parquet.close()
+        elif isinstance(self._stream, io.TextIOWrapper) and not isinstance(self.sink, str):
+            self._stream.flush()
+            self._stream.detach()  # leave the caller's buffer open
+        elif self._stream is not None:
+            self._stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_predictions(df: pd.DataFrame, sink, fmt: Optional[str] = None) -> None:
+    with PredictionWriter(sink, fmt) as writer:
+        writer.write(df)
+
+
+class _KeepOpenBytesIO(io.BytesIO):
+    # pyarrow closes the sink it writes to; keep the buffer readable afterwards
+    def close(self):
+        pass
+
+
+def to_bytes(df: pd.DataFrame, fmt: str = "csv") -> bytes:
+    buffer = _KeepOpenBytesIO()
+    write_predictions(df, buffer, fmt)
+    return buffer.getvalue()
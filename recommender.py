@@ -1,16 +1,9 @@
 # recommender.py
-import json
 from typing import List, Dict, Any
+from knowledge_base import get_kb
 
-# load recommender.json (generated above)
-def load_recs(path: str = "recommender.json") -> Dict[str, Any]:
-    try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {}
-
-RECS = load_recs()
+# Recommendations are served from the compiled knowledge base (career_kb.pkl)
+RECS = get_kb().recommendations
 
 def recommend(career: str) -> Dict[str, Any]:
     """
@@ -69,13 +62,7 @@ def recommend_by_text(text: str, predictor_fn) -> Dict[str, Any]:
 
 
 # Simple job/course recommendations
-recommendations = {
-    "Data Scientist": ["Complete a Machine Learning course on Coursera", "Look for Data Analyst internships"],
-    "Software Engineer": ["Learn Full-Stack Development on Udemy", "Explore junior developer jobs"],
-    "UI/UX Designer": ["Try Figma tutorials", "Build a Behance portfolio"],
-    "Teacher": ["Earn a teaching certification", "Apply for tutoring opportunities"],
-    # Add more career → recommendation pairs
-}
+recommendations = get_kb().job_recommendations
 
 def recommend(career):
     return recommendations.get(career, ["Explore online resources", "Research entry-level opportunities"])
@@ -0,0 +1,108 @@
+# response_cache.py
+# Process-wide LRU+TTL cache of get_answer responses, shared by every Streamlit session.
+import atexit
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+SNAPSHOT_FILE = os.environ.get("RESPONSE_CACHE_SNAPSHOT", "response_cache.pkl")
+
+# Kept in the key even though they are stop words: "jobs without math" != "jobs with math"
+NEGATIONS = frozenset({"no", "not", "nor", "never", "without", "dont", "cant", "wont"})
+
+
+def canonical_key(query: str, nlp) -> str:
+    """Lowercased, lemmatized, stop-word-stripped, sorted tokens (see nlp_resources)."""
+    words = query.lower().replace("'", "").split()
+    kept = []
+    for w in words:
+        w = "".join(ch for ch in w if ch.isalnum())
+        if not w:
+            continue
+        if w in NEGATIONS:
+            kept.append(w)
+        elif w not in nlp.stop_words:
+            kept.append(nlp.lemmatize(w))
+    return " ".join(sorted(kept))
+
+
+class ResponseCache:
+    """
+    OrderedDict LRU of canonical key -> (expires, answer). Entries belong to
+    one `version` (model + knowledge-base hash): a snapshot written under a
+    different version is ignored on load, so retrains and KB rebuilds
+    invalidate it without any manual step.
+    """
+
+    def __init__(self, version: str, max_entries: int = 5000, ttl: float = 6 * 3600):
+        self.version = version
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: str, answer: str) -> None:
+        if not key or not answer:
+            return
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl, answer)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    # --- Snapshots ---
+    def save(self, path: str = SNAPSHOT_FILE) -> int:
+        now = time.time()
+        with self._lock:
+            entries = [(k, v) for k, v in self._entries.items() if v[0] >= now]
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump({"version": self.version, "entries": entries}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        return len(entries)
+
+    def load(self, path: str = SNAPSHOT_FILE) -> int:
+        """Warm from a snapshot written under the same version; returns entries loaded."""
+        if not os.path.exists(path):
+            return 0
+        try:
+            with open(path, "rb") as f:
+                data = pickle.load(f)
+        except Exception:
+            return 0
+        if data.get("version") != self.version:
+            return 0
+        now = time.time()
+        with self._lock:
+            for key, entry in data.get("entries", [])[-self.max_entries:]:
+                if entry[0] >= now:
+                    self._entries[key] = entry
+        return len(self._entries)
+
+
+def create_response_cache(version: str, path: str = SNAPSHOT_FILE, **kwargs) -> ResponseCache:
+    """Cache warmed from `path`, snapshotted back to it when the process exits."""
+    cache = ResponseCache(version, **kwargs)
+    cache.load(path)
+    atexit.register(cache.save, path)
+    return cache
@@ -1,6 +1,8 @@
 import joblib
 import pandas as pd
 import os
+from batch_predict import predict_topk_batch
+from prediction_io import read_predictions_input, write_predictions
 
 # Load the trained model and vectorizer
 model = joblib.load('career_model.pkl')
@@ -36,18 +38,20 @@ def predict_career(user_input):
     }
 
 # Function to do bulk prediction from CSV
-def bulk_predict(csv_path):
+def bulk_predict(csv_path, output_file="career_predictions.csv"):
     if not os.path.exists(csv_path):
         print(f"CSV file '{csv_path}' does not exist!")
         return
     
-    df = pd.read_csv(csv_path)
-    df['predicted_career'] = df['description'].apply(lambda x: predict_career(x)['predicted_career'])
-    df['career_description'] = df['description'].apply(lambda x: predict_career(x)['description'])
-    df['next_steps'] = df['description'].apply(lambda x: ", ".join(predict_career(x)['next_steps']))
+    # CSV or Parquet in; csv / csv.gz / csv.zst / parquet out, by file extension
+    df = read_predictions_input(csv_path)
+    top = predict_topk_batch(df['description'].astype(str).tolist(), 1, model=model, vectorizer=vectorizer)
+    df['predicted_career'] = top.labels()[:, 0]
+    infos = df['predicted_career'].map(lambda c: career_info.get(c, {"description": "N/A", "next_steps": []}))
+    df['career_description'] = infos.map(lambda info: info["description"])
+    df['next_steps'] = infos.map(lambda info: ", ".join(info["next_steps"]))
     
-    output_file = "career_predictions.csv"
-    df.to_csv(output_file, index=False)
+    write_predictions(df, output_file)
     print(f"Bulk predictions saved to '{output_file}'")
 
 # Step 1: Create sample CSV if not exists
@@ -0,0 +1,196 @@
+# semantic_cache.py
+# Reuse remote answers for paraphrased questions, matched by sentence-embedding cosine similarity.
+#
+#   python semantic_cache.py   # precision/recall of candidate thresholds on labelled paraphrase pairs
+import atexit
+import os
+import pickle
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from answer_cache import DEFAULT_TTLS
+
+DEFAULT_THRESHOLD = 0.85
+# Answers whose source has no entry in DEFAULT_TTLS
+DEFAULT_TTL = 24 * 3600
+SNAPSHOT_FILE = os.environ.get("SEMANTIC_CACHE_SNAPSHOT", "semantic_cache.pkl")
+
+
+class SemanticCache:
+    """
+    Unit-normalised query embeddings live in one preallocated float32 matrix,
+    so a lookup is a single matrix-vector product. Each slot remembers the
+    tick of its last hit and when its answer expires (per source, as in
+    answer_cache); expired slots never match and are reused first, and when
+    every slot is live the least recently used one is overwritten. Like
+    ResponseCache, entries belong to one `version` (model + KB hash) and a
+    snapshot written under another version is ignored on load.
+    """
+
+    def __init__(self, encode: Callable[[List[str]], np.ndarray], capacity: int = 2000,
+                 threshold: float = DEFAULT_THRESHOLD, version: str = "",
+                 ttls: Optional[Dict[str, float]] = None):
+        self.encode = encode
+        self.capacity = capacity
+        self.threshold = threshold
+        self.version = version
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._matrix: Optional[np.ndarray] = None
+        self._answers: List[Optional[str]] = [None] * capacity
+        self._queries: List[Optional[str]] = [None] * capacity
+        self._last_used = np.zeros(capacity, dtype=np.int64)
+        self._expires = np.zeros(capacity, dtype=np.float64)
+        self._size = 0
+        self._tick = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def __len__(self):
+        return int((self._expires[:self._size] >= time.time()).sum())
+
+    def embed(self, query: str) -> Optional[np.ndarray]:
+        try:
+            vector = np.asarray(self.encode([query]), dtype=np.float32).reshape(-1)
+        except Exception:
+            return None
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+    def lookup(self, query: str) -> Tuple[Optional[str], Optional[np.ndarray]]:
+        """(answer or None, query vector); pass the vector back to put() to avoid re-encoding."""
+        vector = self.embed(query)
+        if vector is None:
+            return None, None
+        with self._lock:
+            if self._size == 0:
+                self.misses += 1
+                return None, vector
+            sims = self._matrix[:self._size] @ vector
+            sims[self._expires[:self._size] < time.time()] = -np.inf
+            best = int(np.argmax(sims))
+            if sims[best] < self.threshold:
+                self.misses += 1
+                return None, vector
+            self._tick += 1
+            self._last_used[best] = self._tick
+            self.hits += 1
+            return self._answers[best], vector
+
+    def put(self, query: str, answer: str, vector: Optional[np.ndarray] = None,
+            source: Optional[str] = None) -> None:
+        """Store answer for query; it expires after the TTL of the remote `source` it came from."""
+        if not answer:
+            return
+        vector = self.embed(query) if vector is None else vector
+        if vector is None:
+            return
+        now = time.time()
+        with self._lock:
+            self._store(vector, query, answer, now + self.ttls.get(source, DEFAULT_TTL), now)
+
+    def _store(self, vector: np.ndarray, query: str, answer: str, expires: float, now: float) -> None:
+        if self._matrix is None:
+            self._matrix = np.zeros((self.capacity, vector.shape[0]), dtype=np.float32)
+        if self._size < self.capacity:
+            slot = self._size
+            self._size += 1
+        else:
+            stale = int(np.argmin(self._expires))
+            slot = stale if self._expires[stale] < now else int(np.argmin(self._last_used))
+        self._matrix[slot] = vector
+        self._answers[slot] = answer
+        self._queries[slot] = query
+        self._expires[slot] = expires
+        self._tick += 1
+        self._last_used[slot] = self._tick
+
+    # --- Snapshots ---
+    def save(self, path: str = SNAPSHOT_FILE) -> int:
+        now = time.time()
+        with self._lock:
+            live = [i for i in range(self._size) if self._expires[i] >= now]
+            entries = [(self._queries[i], self._answers[i], float(self._expires[i]), self._matrix[i].copy())
+                       for i in sorted(live, key=lambda i: self._last_used[i])]
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump({"version": self.version, "entries": entries}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        return len(entries)
+
+    def load(self, path: str = SNAPSHOT_FILE) -> int:
+        """Warm from a snapshot written under the same version; returns entries loaded."""
+        if not os.path.exists(path):
+            return 0
+        try:
+            with open(path, "rb") as f:
+                data = pickle.load(f)
+        except Exception:
+            return 0
+        if data.get("version") != self.version:
+            return 0
+        now = time.time()
+        with self._lock:
+            # Oldest first, so the most recently used entries survive and rank as such
+            for query, answer, expires, vector in data.get("entries", [])[-self.capacity:]:
+                if expires >= now and (self._matrix is None or vector.shape[0] == self._matrix.shape[1]):
+                    self._store(vector, query, answer, expires, now)
+        return len(self)
+
+
+def create_semantic_cache(encode: Callable[[List[str]], np.ndarray], version: str,
+                          path: str = SNAPSHOT_FILE, **kwargs) -> SemanticCache:
+    """Cache warmed from `path`, snapshotted back to it when the process exits."""
+    cache = SemanticCache(encode, version=version, **kwargs)
+    cache.load(path)
+    atexit.register(cache.save, path)
+    return cache
+
+
+# --- Threshold tuning ---
+# (question, paraphrase or near-miss, same intent?)
+TUNING_PAIRS = [
+    ("careers for someone who loves drawing", "I like to draw, what job?", True),
+    ("what does a data scientist do", "data scientist job description", True),
+    ("how do I become a nurse", "steps to become a nurse", True),
+    ("best jobs for people who like maths", "careers for someone good at math", True),
+    ("what is machine learning", "explain machine learning", True),
+    ("how much does a pilot earn", "pilot salary", True),
+    ("what skills does a web developer need", "skills required for web development", True),
+    ("jobs that involve travelling", "careers where I can travel a lot", True),
+    ("what does a data scientist do", "what does a data engineer do", False),
+    ("how do I become a nurse", "how do I become a doctor", False),
+    ("careers for someone who loves drawing", "careers for someone who loves singing", False),
+    ("how much does a pilot earn", "how much does a teacher earn", False),
+    ("what is machine learning", "what is blockchain", False),
+    ("jobs that involve travelling", "jobs that involve working from home", False),
+]
+
+
+def evaluate_thresholds(encode: Callable[[List[str]], np.ndarray], pairs: Sequence = TUNING_PAIRS,
+                        thresholds: Sequence[float] = (0.75, 0.8, 0.85, 0.9, 0.95)):
+    """[(threshold, precision, recall)] over labelled pairs."""
+    left = np.asarray(encode([a for a, _, _ in pairs]), dtype=np.float32)
+    right = np.asarray(encode([b for _, b, _ in pairs]), dtype=np.float32)
+    left /= np.linalg.norm(left, axis=1, keepdims=True)
+    right /= np.linalg.norm(right, axis=1, keepdims=True)
+    sims = (left * right).sum(axis=1)
+    same = np.array([s for _, _, s in pairs])
+    rows = []
+    for t in thresholds:
+        predicted = sims >= t
+        tp = int((predicted & same).sum())
+        precision = tp / max(int(predicted.sum()), 1)
+        recall = tp / max(int(same.sum()), 1)
+        rows.append((t, precision, recall))
+    return rows
+
+
+if __name__ == "__main__":
+    from model_registry import get_registry
+
+    model = get_registry().get("embedding_model")
+    for t, precision, recall in evaluate_thresholds(model.encode):
+        print(f"threshold {t:.2f}: precision {precision:.2f} · recall {recall:.2f}")
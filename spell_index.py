@@ -0,0 +1,160 @@
+# spell_index.py
+# Symmetric-delete (SymSpell-style) spelling correction for individual tokens.
+import re
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """Optimal string alignment distance, or max_distance + 1 once it is exceeded."""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    prev2 = None
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        row_min = cur[0]
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if prev2 is not None and i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+            row_min = min(row_min, cur[j])
+        if row_min > max_distance:
+            return max_distance + 1
+        prev2, prev = prev, cur
+    return prev[-1] if prev[-1] <= max_distance else max_distance + 1
+
+
+class SymSpellIndex:
+    """
+    Every dictionary word is indexed under all of its variants with up to
+    `max_edit_distance` characters deleted (within the first `prefix_length`
+    characters). A misspelled token is looked up by generating its own deletes,
+    so candidates come from dict hits instead of a scan over the vocabulary.
+
+    The vocabulary is career-specific, so correct_text leaves alone any token
+    `is_known` accepts (a general English lexicon) and only replaces a token
+    when the best candidate beats every other one at the same distance by
+    `count_margin`x in frequency.
+    """
+
+    def __init__(self, max_edit_distance: int = 2, prefix_length: int = 7, cache_size: int = 50000,
+                 is_known: Optional[Callable[[str], bool]] = None, count_margin: float = 2.0):
+        self.max_edit_distance = max_edit_distance
+        self.prefix_length = prefix_length
+        self.is_known = is_known
+        self.count_margin = count_margin
+        self.words: Dict[str, int] = {}
+        self.deletes: Dict[str, List[str]] = {}
+        self.latencies = deque(maxlen=1000)
+        self._correct_word = lru_cache(maxsize=cache_size)(self._correct_word_uncached)
+
+    def _edits(self, word: str) -> set:
+        word = word[:self.prefix_length]
+        result = {word}
+        frontier = {word}
+        for _ in range(self.max_edit_distance):
+            next_frontier = set()
+            for w in frontier:
+                for i in range(len(w)):
+                    d = w[:i] + w[i + 1:]
+                    if d not in result:
+                        next_frontier.add(d)
+            result |= next_frontier
+            frontier = next_frontier
+        return result
+
+    def add_word(self, word: str, count: int = 1) -> None:
+        if word in self.words:
+            self.words[word] += count
+            return
+        self.words[word] = count
+        for d in self._edits(word):
+            self.deletes.setdefault(d, []).append(word)
+        self._correct_word.cache_clear()
+
+    def add_text(self, text: str, count: int = 1) -> None:
+        for token in tokenize(text):
+            self.add_word(token, count)
+
+    def lookup(self, word: str, max_distance: Optional[int] = None) -> Optional[Tuple[str, int, int]]:
+        """Best (term, distance, count): smallest distance first, then highest count."""
+        max_distance = self.max_edit_distance if max_distance is None else max_distance
+        if word in self.words:
+            return word, 0, self.words[word]
+        best = None
+        seen = set()
+        for d in self._edits(word):
+            for candidate in self.deletes.get(d, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                limit = max_distance if best is None else min(max_distance, best[1])
+                dist = edit_distance(word, candidate, limit)
+                if dist > limit:
+                    continue
+                if best is None or (dist, -self.words[candidate]) < (best[1], -best[2]):
+                    best = (candidate, dist, self.words[candidate])
+        return best
+
+    def candidates(self, word: str, max_distance: Optional[int] = None) -> List[Tuple[str, int, int]]:
+        """Every (term, distance, count) within max_distance, best first."""
+        max_distance = self.max_edit_distance if max_distance is None else max_distance
+        found = {}
+        for d in self._edits(word):
+            for candidate in self.deletes.get(d, ()):
+                if candidate not in found:
+                    found[candidate] = edit_distance(word, candidate, max_distance)
+        return sorted(((c, dist, self.words[c]) for c, dist in found.items() if dist <= max_distance),
+                      key=lambda t: (t[1], -t[2]))
+
+    def _correct_word_uncached(self, word: str) -> str:
+        # Short tokens and numbers are too ambiguous to correct; real words are not typos
+        if len(word) <= 4 or word.isdigit() or word in self.words:
+            return word
+        if self.is_known is not None and self.is_known(word):
+            return word
+        # Two edits turn too many valid words into career terms; allow them only on long tokens
+        max_distance = 1 if len(word) <= 7 else self.max_edit_distance
+        found = self.candidates(word, max_distance)
+        if not found:
+            return word
+        best = found[0]
+        if len(found) > 1 and found[1][1] == best[1] and best[2] < self.count_margin * found[1][2]:
+            return word
+        return best[0]
+
+    def correct_text(self, text: str) -> str:
+        """Correct each token independently; unknown but unfixable tokens are kept as typed."""
+        start = time.perf_counter()
+        corrected = " ".join(self._correct_word(t) for t in text.split())
+        self.latencies.append(time.perf_counter() - start)
+        return corrected
+
+    def latency_percentiles(self, percentiles=(50, 99)) -> Dict[int, float]:
+        """Per-query correction latency in microseconds over the recent window."""
+        if not self.latencies:
+            return {p: 0.0 for p in percentiles}
+        ordered = sorted(self.latencies)
+        return {p: ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))] * 1e6 for p in percentiles}
+
+
+def tokenize(text: str) -> List[str]:
+    return re.findall(r"[a-z0-9]+", text.lower())
+
+
+def build_spell_index(vocabulary: Iterable[str], career_names: Iterable[str],
+                      skill_names: Iterable[str],
+                      is_known: Optional[Callable[[str], bool]] = None) -> SymSpellIndex:
+    """Index from the classifier vocabulary plus career and skill names (weighted higher)."""
+    index = SymSpellIndex(is_known=is_known)
+    for term in vocabulary:
+        index.add_text(term)
+    for name in career_names:
+        index.add_text(name, count=5)
+    for name in skill_names:
+        index.add_text(name, count=2)
+    return index
@@ -0,0 +1,66 @@
+# test_compiled_classifier.py
+# The NumPy-only runtime must reproduce sklearn's TF-IDF + LogisticRegression probabilities.
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("sklearn")
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+
+from compiled_classifier import SAMPLE_TEXTS, CompiledClassifier, check_parity, export_compiled
+
+TRAIN = [
+    ("i love coding and building software", "Software Engineer"),
+    ("writing programs and fixing bugs all day", "Software Engineer"),
+    ("i enjoy painting sketching and drawing", "Graphic Designer"),
+    ("designing logos posters and brand colours", "Graphic Designer"),
+    ("analyzing data statistics and charts", "Data Analyst"),
+    ("dashboards sql queries and spreadsheets", "Data Analyst"),
+    ("helping patients recover in a hospital", "Nurse"),
+    ("caring for sick people on the ward", "Nurse"),
+]
+TEXTS = SAMPLE_TEXTS + ["coding coding coding", "unseen words only", "Painting AND data, twice: data!"]
+
+
+def _compile(tmp_path, vectorizer, model):
+    texts, labels = zip(*TRAIN)
+    model.fit(vectorizer.fit_transform(texts), labels)
+    path = str(tmp_path / "compiled.npz")
+    export_compiled(model, vectorizer, path)
+    return CompiledClassifier(path)
+
+
+@pytest.mark.parametrize("vectorizer_kwargs", [
+    {},
+    {"ngram_range": (1, 2), "sublinear_tf": True, "stop_words": "english"},
+    {"norm": "l1", "use_idf": False},
+    {"binary": True},
+])
+def test_softmax_parity(tmp_path, vectorizer_kwargs):
+    vectorizer = TfidfVectorizer(**vectorizer_kwargs)
+    model = LogisticRegression(max_iter=1000)
+    compiled = _compile(tmp_path, vectorizer, model)
+    assert check_parity(model, vectorizer, compiled, TEXTS) <= 1e-4
+
+
+def test_ovr_parity(tmp_path):
+    vectorizer = TfidfVectorizer()
+    model = LogisticRegression(solver="liblinear")
+    compiled = _compile(tmp_path, vectorizer, model)
+    assert compiled.link == "ovr"
+    assert check_parity(model, vectorizer, compiled, TEXTS) <= 1e-4
+
+
+def test_top_class_matches_sklearn(tmp_path):
+    vectorizer = TfidfVectorizer(ngram_range=(1, 2))
+    model = LogisticRegression(max_iter=1000)
+    compiled = _compile(tmp_path, vectorizer, model)
+    expected = model.predict(vectorizer.transform(TEXTS))
+    got = [compiled.classes_[int(np.argmax(compiled.predict_proba(t)))] for t in TEXTS]
+    assert got == [str(c) for c in expected]
+
+
+def test_custom_analyzer_is_rejected(tmp_path):
+    vectorizer = TfidfVectorizer(tokenizer=str.split)
+    with pytest.raises(ValueError):
+        _compile(tmp_path, vectorizer, LogisticRegression(max_iter=1000))
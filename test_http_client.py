@@ -0,0 +1,149 @@
+# test_http_client.py
+# Circuit breaker transitions: closed -> open -> half-open (one probe) -> closed or open again.
+import pytest
+
+requests = pytest.importorskip("requests")
+
+import http_client
+from http_client import HTTP_ERRORS, CircuitOpenError, HttpClient, SourceState, SourceUnavailable
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(http_client.time, "monotonic", clock)
+    return clock
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class FakeSession:
+    """Returns or raises the queued outcomes in order."""
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def get(self, url, params=None, timeout=None):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return FakeResponse(outcome)
+
+
+def test_opens_after_threshold_consecutive_failures(clock):
+    state = SourceState(failure_threshold=3, cooldown=30)
+    for _ in range(2):
+        assert state.allow()
+        state.record(False, 0.1)
+    assert state.state == "closed"
+    state.record(False, 0.1)
+    assert state.state == "open"
+    assert not state.allow()
+    assert state.short_circuited == 1
+
+
+def test_success_resets_the_failure_streak(clock):
+    state = SourceState(failure_threshold=3, cooldown=30)
+    state.record(False, 0.1)
+    state.record(False, 0.1)
+    state.record(True, 0.1)
+    state.record(False, 0.1)
+    assert state.state == "closed"
+
+
+def test_half_open_allows_a_single_probe(clock):
+    state = SourceState(failure_threshold=1, cooldown=30)
+    state.record(False, 0.1)
+    clock.now += 30
+    assert state.state == "half-open"
+    assert state.allow()
+    assert not state.allow()  # only one probe while it is in flight
+
+
+def test_successful_probe_closes(clock):
+    state = SourceState(failure_threshold=1, cooldown=30)
+    state.record(False, 0.1)
+    clock.now += 30
+    assert state.allow()
+    state.record(True, 0.1)
+    assert state.state == "closed"
+    assert state.allow() and state.allow()
+
+
+def test_failed_probe_reopens_for_a_full_cooldown(clock):
+    state = SourceState(failure_threshold=3, cooldown=30)
+    for _ in range(3):
+        state.record(False, 0.1)
+    clock.now += 30
+    assert state.allow()
+    state.record(False, 0.1)  # a single probe failure is enough
+    assert state.state == "open"
+    clock.now += 29
+    assert not state.allow()
+    clock.now += 1
+    assert state.allow()
+
+
+def test_get_json_short_circuits_while_open(clock):
+    client = HttpClient(failure_threshold=2, cooldown=30)
+    client.session = FakeSession([requests.Timeout(), requests.ConnectionError(), {"ok": 1}])
+    for _ in range(2):
+        with pytest.raises(requests.RequestException):
+            client.get_json("wiki", "http://example.invalid")
+    with pytest.raises(CircuitOpenError):
+        client.get_json("wiki", "http://example.invalid")
+    assert client.session.calls == 2
+
+    clock.now += 30
+    assert client.get_json("wiki", "http://example.invalid") == {"ok": 1}
+    metrics = client.metrics()["wiki"]
+    assert metrics["state"] == "closed"
+    assert (metrics["calls"], metrics["failures"], metrics["short_circuited"]) == (3, 2, 1)
+
+
+def test_unexpected_error_in_a_probe_reopens(clock):
+    client = HttpClient(failure_threshold=1, cooldown=30)
+    client.session = FakeSession([requests.Timeout(), RuntimeError("adapter bug"), {"ok": 1}])
+    with pytest.raises(requests.Timeout):
+        client.get_json("wiki", "http://example.invalid")
+    clock.now += 30
+    with pytest.raises(RuntimeError):
+        client.get_json("wiki", "http://example.invalid")
+    assert client.source("wiki").state == "open"
+    clock.now += 30
+    assert client.get_json("wiki", "http://example.invalid") == {"ok": 1}
+
+
+def test_breaker_errors_are_transient():
+    # Callers (and the answer cache) treat these as "unavailable", never as "no result"
+    assert issubclass(CircuitOpenError, SourceUnavailable)
+    for error in (CircuitOpenError("open"), requests.Timeout(), ValueError("bad json")):
+        assert isinstance(error, HTTP_ERRORS)
+
+
+def test_timeout_adapts_to_observed_latency(clock):
+    client = HttpClient(default_timeout=5, min_timeout=0.5, max_timeout=8, warm_samples=3)
+    assert client.timeout_for("ddg") == 5
+    for seconds in (0.2, 0.3, 0.4):
+        client.source("ddg").record(True, seconds)
+    assert client.timeout_for("ddg") == pytest.approx(1.2)
+    assert client.timeout_for("ddg", timeout=1.0) == 1.0
@@ -0,0 +1,143 @@
+# test_openai_guard.py
+# Single-flight coalescing and budget settlement for the OpenAI fallback, with a fake stream.
+import threading
+import time
+
+import pytest
+
+import openai_guard
+from openai_guard import OpenAIGuard, RateBudget, TokenBucket, estimate_tokens
+from openai_stream import StreamingAnswer
+
+
+class FakeOpen:
+    """open_fn stand-in: waits for `release`, then streams `chunks` (or fails with None)."""
+
+    def __init__(self, chunks=("a nurse ", "cares for ", "patients"), fail=False):
+        self.chunks = list(chunks)
+        self.fail = fail
+        self.calls = 0
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.finish = threading.Event()
+
+    def __call__(self, query, max_tokens=250, on_complete=None):
+        self.calls += 1
+        self.entered.set()
+        self.release.wait(5)
+        if self.fail:
+            return None
+
+        def rest():
+            self.finish.wait(5)
+            yield from self.chunks[1:]
+
+        return StreamingAnswer(rest(), self.chunks[0], time.perf_counter(), on_complete)
+
+
+@pytest.fixture
+def frozen(monkeypatch):
+    # No refill between reserve and settle, so bucket levels are exact
+    monkeypatch.setattr(openai_guard.time, "monotonic", lambda: 1000.0)
+
+
+def _ask(guard, query, results):
+    results.append(guard.answer(query))
+
+
+def test_identical_questions_share_one_call():
+    fake = FakeOpen()
+    guard = OpenAIGuard(open_fn=fake)
+    results = []
+    leader = threading.Thread(target=_ask, args=(guard, "What does a nurse do?", results))
+    leader.start()
+    assert fake.entered.wait(5)
+    # Same canonical question while the leader's call is in flight
+    followers = [threading.Thread(target=_ask, args=(guard, q, results))
+                 for q in ("what does a nurse do", "WHAT DOES A NURSE DO??")]
+    for t in followers:
+        t.start()
+    while guard.metrics()["coalesced"] < 2:
+        time.sleep(0.001)
+    fake.release.set()
+    fake.finish.set()
+    for t in [leader] + followers:
+        t.join(5)
+
+    assert fake.calls == 1
+    assert len(results) == 3 and results[0] is results[1] is results[2]
+    assert results[0].wait(5) == "a nurse cares for patients"
+    metrics = guard.metrics()
+    assert (metrics["calls"], metrics["coalesced"], metrics["in_flight"]) == (1, 2, 0)
+
+
+def test_flight_is_released_when_the_stream_ends():
+    fake = FakeOpen()
+    fake.release.set()
+    guard = OpenAIGuard(open_fn=fake)
+    first = guard.answer("what does a nurse do")
+    assert guard.metrics()["in_flight"] == 1
+    fake.finish.set()
+    first.wait(5)
+    assert guard.metrics()["in_flight"] == 0
+    second = guard.answer("what does a nurse do")
+    assert second is not first and fake.calls == 2
+
+
+def test_unkeyable_queries_are_not_coalesced():
+    fake = FakeOpen()
+    fake.release.set()
+    fake.finish.set()
+    guard = OpenAIGuard(open_fn=fake)
+    a, b = guard.answer("?!"), guard.answer("...")
+    assert a is not b and fake.calls == 2
+
+
+def test_reservation_is_settled_against_the_streamed_length(frozen):
+    fake = FakeOpen()
+    fake.release.set()
+    budget = RateBudget(requests_per_minute=10, tokens_per_minute=1000)
+    guard = OpenAIGuard(budget=budget, max_tokens=250, open_fn=fake)
+    query = "what does a nurse do"
+    answer = guard.answer(query)
+    reserved = estimate_tokens(query) + 20 + 250
+    assert budget.tokens.level == pytest.approx(1000 - reserved)
+    assert budget.requests.level == pytest.approx(9)
+
+    fake.finish.set()
+    answer.wait(5)
+    used = estimate_tokens(query) + 20 + estimate_tokens("a nurse cares for patients")
+    assert budget.tokens.level == pytest.approx(1000 - used)
+
+
+def test_failed_call_returns_the_whole_reservation(frozen):
+    fake = FakeOpen(fail=True)
+    fake.release.set()
+    budget = RateBudget(requests_per_minute=10, tokens_per_minute=1000)
+    guard = OpenAIGuard(budget=budget, open_fn=fake)
+    assert guard.answer("what does a nurse do") is None
+    assert budget.tokens.level == pytest.approx(1000)
+    metrics = guard.metrics()
+    assert (metrics["failed"], metrics["in_flight"]) == (1, 0)
+
+
+def test_over_budget_calls_are_rejected_without_calling(frozen):
+    fake = FakeOpen()
+    budget = RateBudget(requests_per_minute=10, tokens_per_minute=100)
+    guard = OpenAIGuard(budget=budget, max_tokens=250, open_fn=fake)
+    assert guard.answer("what does a nurse do") is None
+    assert fake.calls == 0
+    assert guard.metrics()["rejected"] == 1
+    assert budget.tokens.level == pytest.approx(100)
+
+
+def test_token_bucket_refills_and_caps(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(openai_guard.time, "monotonic", lambda: now[0])
+    bucket = TokenBucket(per_minute=60)
+    bucket.take(60)
+    assert not bucket.available(1)
+    now[0] += 30
+    assert bucket.available(30) and not bucket.available(31)
+    now[0] += 600
+    assert bucket.available(60) and not bucket.available(61)
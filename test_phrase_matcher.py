@@ -0,0 +1,74 @@
+# test_phrase_matcher.py
+# PhraseMatcher.best() must return exactly what the old `for phrase in phrases: if phrase in text` loop did.
+import random
+
+from phrase_matcher import PhraseMatcher
+
+PHRASES = {
+    "i love coding": "Software Engineer",
+    "coding": "Software Engineer",
+    "love drawing": "Graphic Designer",
+    "drawing": "Illustrator",
+    "data": "Data Analyst",
+    "big data": "Data Engineer",
+    "help people": "Social Worker",
+    "help": "Customer Support",
+    "he": "pronoun",
+    "she": "pronoun",
+    "hers": "pronoun",
+    "his": "pronoun",
+}
+
+
+def substring_loop(phrases, text):
+    for phrase, value in phrases.items():
+        if phrase in text:
+            return phrase, value
+    return None
+
+
+def test_matches_substring_loop_on_examples():
+    matcher = PhraseMatcher(PHRASES)
+    for text in ["i love coding every day", "i like big data", "love drawing and coding", "ushers",
+                 "nothing here", "", "help people with big data", "hishers"]:
+        assert matcher.best(text) == substring_loop(PHRASES, text), text
+
+
+def test_matches_substring_loop_on_random_text():
+    rng = random.Random(0)
+    phrases = {"".join(rng.choice("abc") for _ in range(rng.randint(1, 4))): i for i in range(40)}
+    matcher = PhraseMatcher(phrases)
+    for _ in range(500):
+        text = "".join(rng.choice("abcd ") for _ in range(rng.randint(0, 20)))
+        assert matcher.best(text) == substring_loop(phrases, text), text
+
+
+def test_find_all_returns_every_hit_in_priority_order():
+    matcher = PhraseMatcher(PHRASES)
+    hits = matcher.find_all("she helps with big data")
+    expected = [i for i, p in enumerate(PHRASES) if p in "she helps with big data"]
+    assert hits == expected
+
+
+def test_sync_adds_new_phrases_with_lowest_priority():
+    learned = {"painting": "Artist"}
+    matcher = PhraseMatcher(learned)
+    learned["paint"] = "Painter"
+    learned["cooking"] = "Chef"
+    matcher.sync(learned)
+    assert matcher.best("i like painting") == ("painting", "Artist")
+    assert matcher.best("i like cooking") == ("cooking", "Chef")
+    assert len(matcher) == 3
+
+
+def test_sync_rebuilds_when_a_phrase_is_removed():
+    matcher = PhraseMatcher({"chef": "Chef", "cook": "Cook"})
+    matcher.sync({"cook": "Cook"})
+    assert "chef" not in matcher
+    assert matcher.best("chef and cook") == ("cook", "Cook")
+
+
+def test_readding_updates_value_only():
+    matcher = PhraseMatcher({"data": "Data Analyst", "big data": "Data Engineer"})
+    matcher.add("data", "Data Scientist")
+    assert matcher.best("big data") == ("data", "Data Scientist")
@@ -0,0 +1,58 @@
+# test_semantic_cache.py
+# Paraphrase reuse with per-source expiry, LRU reuse of slots and versioned snapshots.
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import semantic_cache
+from semantic_cache import SemanticCache
+
+VECTORS = {
+    "what does a nurse do": [1.0, 0.0, 0.0],
+    "what is a nurse's job": [0.99, 0.1, 0.0],
+    "how much does a pilot earn": [0.0, 1.0, 0.0],
+    "what is machine learning": [0.0, 0.0, 1.0],
+}
+
+
+def encode(texts):
+    return np.array([VECTORS[t] for t in texts])
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(semantic_cache.time, "time", lambda: now[0])
+    return now
+
+
+def test_paraphrase_hits_until_the_source_ttl_expires(clock):
+    cache = SemanticCache(encode, ttls={"duckduckgo": 60})
+    cache.put("what does a nurse do", "cares for patients", source="duckduckgo")
+    assert cache.lookup("what is a nurse's job")[0] == "cares for patients"
+    clock[0] += 61
+    assert cache.lookup("what is a nurse's job")[0] is None
+    assert len(cache) == 0
+
+
+def test_expired_slots_are_reused_before_live_ones(clock):
+    cache = SemanticCache(encode, capacity=2, ttls={"duckduckgo": 60, "wikipedia": 3600})
+    cache.put("what does a nurse do", "short-lived", source="duckduckgo")
+    cache.put("how much does a pilot earn", "long-lived", source="wikipedia")
+    cache.lookup("what does a nurse do")  # most recently used, yet it is the slot reused
+    clock[0] += 61
+    cache.put("what is machine learning", "new", source="wikipedia")
+    assert cache.lookup("how much does a pilot earn")[0] == "long-lived"
+    assert cache.lookup("what is machine learning")[0] == "new"
+
+
+def test_snapshot_is_ignored_under_another_version(clock, tmp_path):
+    path = str(tmp_path / "semantic.pkl")
+    cache = SemanticCache(encode, version="v1")
+    cache.put("what does a nurse do", "cares for patients", source="wikipedia")
+    assert cache.save(path) == 1
+
+    same = SemanticCache(encode, version="v1")
+    assert same.load(path) == 1
+    assert same.lookup("what is a nurse's job")[0] == "cares for patients"
+    assert SemanticCache(encode, version="v2").load(path) == 0
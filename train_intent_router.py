@@ -0,0 +1,159 @@
+# train_intent_router.py
+# Trains the get_answer intent router (TF-IDF + LogisticRegression) and compiles it
+# to intent_router_compiled.npz for the NumPy-only runtime in intent_router.py.
+#
+#   python train_intent_router.py                        # templated queries from the KB
+#   python train_intent_router.py --labels queries.csv   # plus labelled real queries (query,route)
+#
+# Templated sentences are easy to fit, so the split accuracy says little about real
+# traffic. The router is scored on HELD_OUT (hand-written queries, never trained on)
+# and is only exported when it reaches MIN_HELDOUT_ACCURACY; a mis-route only costs
+# a cascade fallback, but a low score means the router would mostly add latency.
+import argparse
+import os
+import random
+import sys
+
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score, classification_report
+from sklearn.model_selection import train_test_split
+
+from compiled_classifier import export_compiled
+from intent_router import ROUTER_FILE, ROUTES
+from knowledge_base import get_kb
+
+TEMPLATES = {
+    "career": [
+        "what career suits someone who says {example}",
+        "suggest a job for me, {example}",
+        "{example}",
+        "which profession fits me if {example}",
+    ],
+    "skills": [
+        "what skills does a {career} need",
+        "skills required for {career}",
+        "how to become a {career}",
+        "what should i learn to be a {career}",
+        "next steps to get into {career}",
+    ],
+    "wiki": [
+        "what is {topic}",
+        "what does a {career} do",
+        "tell me about {career}",
+        "who is a {career}",
+        "define {topic}",
+        "history of {topic}",
+    ],
+    "web": [
+        "latest news about {topic}",
+        "{career} salary in 2025",
+        "current job market for {career}",
+        "{topic} trends this year",
+        "top companies hiring {career} now",
+    ],
+    "chat": [
+        "how do i prepare for a {career} interview",
+        "should i quit my job to become a {career}",
+        "help me choose between {career} and {other}",
+        "write a cover letter for a {career} position",
+        "i feel stuck in my career as a {career}, what should i do",
+        "give me advice on switching from {career} to {other}",
+    ],
+}
+
+
+# Real-style queries, phrased unlike the templates; never used for training
+HELD_OUT = [
+    ("i love drawing and painting what should i do with my life", "career"),
+    ("im good at maths and like computers, which job is right for me", "career"),
+    ("careers for someone who enjoys helping sick people", "career"),
+    ("i like travelling and meeting new people", "career"),
+    ("what jobs can i get with a biology degree", "career"),
+    ("skills needed to work as a data analyst", "skills"),
+    ("how can i become a pilot after 12th", "skills"),
+    ("what do i need to learn for web development", "skills"),
+    ("roadmap to become a chartered accountant", "skills"),
+    ("which certifications help a cloud engineer", "skills"),
+    ("what is machine learning", "wiki"),
+    ("what does an actuary do", "wiki"),
+    ("explain blockchain", "wiki"),
+    ("who is a radiologist", "wiki"),
+    ("meaning of ux design", "wiki"),
+    ("average software engineer salary in india", "web"),
+    ("is the tech job market recovering in 2025", "web"),
+    ("which companies are hiring nurses right now", "web"),
+    ("latest ai job trends", "web"),
+    ("demand for electricians this year", "web"),
+    ("should i do an mba or a masters in data science", "chat"),
+    ("how do i answer tell me about yourself in an interview", "chat"),
+    ("i hate my job as an accountant, how do i switch to design", "chat"),
+    ("can you help me write a resume summary for a teacher", "chat"),
+    ("is it too late to change careers at 35", "chat"),
+]
+MIN_HELDOUT_ACCURACY = 0.7
+
+
+def templated_queries(per_route: int = 600, seed: int = 42):
+    kb = get_kb()
+    rng = random.Random(seed)
+    careers = sorted({c.lower() for c in kb.career_info} | set(kb.skills))
+    examples = [text.lower() for text, _ in kb.examples]
+    topics = sorted({w for c in careers for w in c.split() if len(w) > 3}) + careers
+    rows = []
+    for route, templates in TEMPLATES.items():
+        for _ in range(per_route):
+            template = rng.choice(templates)
+            rows.append((template.format(example=rng.choice(examples), career=rng.choice(careers),
+                                         other=rng.choice(careers), topic=rng.choice(topics)), route))
+    return pd.DataFrame(rows, columns=["query", "route"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train and compile the get_answer intent router")
+    parser.add_argument("--labels", help="CSV of real queries with 'query' and 'route' columns")
+    parser.add_argument("--out", default=ROUTER_FILE)
+    parser.add_argument("--force", action="store_true",
+                        help=f"export even below {MIN_HELDOUT_ACCURACY:.0%} held-out accuracy")
+    args = parser.parse_args()
+
+    data = templated_queries()
+    if args.labels and os.path.exists(args.labels):
+        labelled = pd.read_csv(args.labels)[["query", "route"]].dropna()
+        labelled = labelled[labelled["route"].isin(ROUTES)]
+        labelled = labelled[~labelled["query"].str.lower().str.strip().isin({q for q, _ in HELD_OUT})]
+        # Real queries are scarcer than templates; weight them up by repetition
+        data = pd.concat([data] + [labelled] * 5, ignore_index=True)
+    data["query"] = data["query"].str.lower().str.strip()
+
+    X_train, X_test, y_train, y_test = train_test_split(
+        data["query"], data["route"], test_size=0.2, random_state=42, stratify=data["route"])
+
+    # Question words carry the intent, so no stop-word list here
+    vectorizer = TfidfVectorizer(ngram_range=(1, 2), sublinear_tf=True, min_df=2)
+    X_train_vec = vectorizer.fit_transform(X_train)
+    model = LogisticRegression(max_iter=1000, class_weight="balanced", random_state=42)
+    model.fit(X_train_vec, y_train)
+
+    y_pred = model.predict(vectorizer.transform(X_test))
+    print("\nIntent router accuracy (templated split):", accuracy_score(y_test, y_pred))
+    print(classification_report(y_test, y_pred, zero_division=0))
+
+    held_queries, held_routes = zip(*HELD_OUT)
+    held_pred = model.predict(vectorizer.transform(held_queries))
+    held_accuracy = accuracy_score(held_routes, held_pred)
+    print(f"Held-out real-query accuracy: {held_accuracy:.2f} (minimum {MIN_HELDOUT_ACCURACY})")
+    for query, route, pred in zip(held_queries, held_routes, held_pred):
+        if route != pred:
+            print(f"  ✗ {query!r}: {pred} (expected {route})")
+    if held_accuracy < MIN_HELDOUT_ACCURACY and not args.force:
+        print("❌ Not exported: add labelled real queries with --labels, or pass --force")
+        sys.exit(1)
+
+    export_compiled(model, vectorizer, args.out)
+    print(f"✅ Intent router compiled to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,21 @@
 import pandas as pd
 import re
 import pickle
-import nltk
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.linear_model import LogisticRegression
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import accuracy_score, classification_report
 from sklearn.model_selection import train_test_split, GridSearchCV
-
-# Download NLTK resources (only first time)
-nltk.download('stopwords')
-nltk.download('wordnet')
-nltk.download('omw-1.4')
+from nlp_resources import load_resources
 
 # --- Load dataset ---
 data = pd.read_csv('generated_dataset_fixed.csv')
 
 # --- Text preprocessing ---
-lemmatizer = WordNetLemmatizer()
-stop_words = set(stopwords.words('english'))
+nlp = load_resources()
 
 def preprocess_text(text):
-    text = text.lower()
-    text = re.sub(r'[^a-z\s]', '', text)
-    words = text.split()
-    words = [lemmatizer.lemmatize(word) for word in words if word not in stop_words]
-    return ' '.join(words)
+    return nlp.preprocess_text(text, strip_pattern=r'[^a-z\s]')
 
 data['Description'] = data['Description'].apply(preprocess_text)
 
@@ -0,0 +1,119 @@
+# trigram_index.py
+# Character-trigram shortlist in front of fuzzywuzzy scoring for career/skill name lookups.
+#
+#   python trigram_index.py   # p50/p99 latency vs a full extractOne scan, catalog up to 10k names
+import random
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+
+def _default_scorer():
+    from fuzzywuzzy import fuzz, utils
+    return fuzz.WRatio, utils.full_process
+
+
+def trigrams(text: str) -> set:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """
+    Inverted index from character trigrams to names. A query first collects the
+    names sharing the most trigrams with it (as a fraction of either side, so
+    a name contained in the query and a query contained in a name both rank
+    high), then only that shortlist is scored with the same scorer and
+    processor process.extractOne uses (WRatio on full_process'd strings).
+    """
+
+    def __init__(self, names: Sequence[str], shortlist: int = 25,
+                 scorer: Optional[Callable] = None, processor: Optional[Callable] = None):
+        if scorer is None or processor is None:
+            default_scorer, default_processor = _default_scorer()
+            scorer = scorer or default_scorer
+            processor = processor or default_processor
+        self.scorer = scorer
+        self.processor = processor
+        self.shortlist = shortlist
+        self.names: List[str] = list(names)
+        self._processed: List[str] = [processor(n) for n in self.names]
+        self._sizes: List[int] = []
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        for i, text in enumerate(self._processed):
+            grams = trigrams(text)
+            self._sizes.append(len(grams))
+            for g in grams:
+                self._postings[g].append(i)
+
+    def candidates(self, processed_query: str) -> List[int]:
+        q_grams = trigrams(processed_query)
+        shared: Dict[int, int] = defaultdict(int)
+        for g in q_grams:
+            for i in self._postings.get(g, ()):
+                shared[i] += 1
+        q_size = max(len(q_grams), 1)
+        ranked = sorted(shared, key=lambda i: (-max(shared[i] / self._sizes[i], shared[i] / q_size), i))
+        return ranked[:self.shortlist]
+
+    def extract_one(self, query: str) -> Optional[Tuple[str, int]]:
+        """Drop-in for process.extractOne(query, names): best (name, score), earliest on ties."""
+        processed = self.processor(query)
+        if not processed:
+            return None
+        best = None
+        for i in sorted(self.candidates(processed)):
+            score = self.scorer(processed, self._processed[i])
+            if best is None or score > best[1]:
+                best = (self.names[i], score)
+        return best
+
+    def match(self, query: str, threshold: int) -> Optional[Tuple[str, int]]:
+        best = self.extract_one(query)
+        return best if best is not None and best[1] >= threshold else None
+
+
+# --- Benchmark ---
+def _synthetic_catalog(base: Sequence[str], size: int, rng: random.Random) -> List[str]:
+    words = sorted({w for name in base for w in name.split()})
+    prefixes = ["senior", "junior", "lead", "associate", "principal", "assistant", "chief", "trainee"]
+    catalog = list(dict.fromkeys(base))
+    seen = set(catalog)
+    while len(catalog) < size:
+        name = f"{rng.choice(prefixes)} {' '.join(rng.sample(words, rng.randint(1, 3)))}"
+        if name not in seen:
+            seen.add(name)
+            catalog.append(name)
+    return catalog[:size]
+
+
+def _percentiles(samples: List[float]) -> Tuple[float, float]:
+    ordered = sorted(samples)
+    return ordered[len(ordered) // 2] * 1e3, ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1e3
+
+
+def benchmark(base_names: Sequence[str], sizes=(500, 1000, 5000, 10000), n_queries: int = 200, seed: int = 0):
+    from fuzzywuzzy import process
+
+    rng = random.Random(seed)
+    for size in sizes:
+        catalog = _synthetic_catalog(base_names, size, rng)
+        index = TrigramIndex(catalog)
+        queries = [f"what skills does a {rng.choice(catalog)} need" for _ in range(n_queries)]
+        scan, indexed, agree = [], [], 0
+        for q in queries:
+            start = time.perf_counter()
+            expected = process.extractOne(q, catalog)
+            scan.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            got = index.extract_one(q)
+            indexed.append(time.perf_counter() - start)
+            agree += got is not None and got[1] == expected[1]
+        (s50, s99), (i50, i99) = _percentiles(scan), _percentiles(indexed)
+        print(f"{size:>6} names | scan p50 {s50:7.2f} ms p99 {s99:7.2f} ms | "
+              f"trigram p50 {i50:6.2f} ms p99 {i99:6.2f} ms | same best score {agree / n_queries:.0%}")
+
+
+if __name__ == "__main__":
+    from knowledge_base import get_kb
+    benchmark(list(get_kb().skills.keys()))
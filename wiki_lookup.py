@@ -0,0 +1,227 @@
+# wiki_lookup.py
+# Deadline-bounded Wikipedia summary lookup against the MediaWiki API.
+#
+#   python wiki_lookup.py --selftest   # runs the lookup against a local stub HTTP server
+import os
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional
+
+from http_client import SourceUnavailable, get_http_client
+
+WIKI_API_URL = os.environ.get("WIKI_API_URL", "https://en.wikipedia.org/w/api.php")
+_STOP = frozenset("a an and are as at be by for from how i in is it of on or the to what which who why with".split())
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool(workers: int) -> ThreadPoolExecutor:
+    # Shared and bounded: concurrent chat sessions can't open unlimited connections
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wiki")
+    return _pool
+
+
+def pooled_get_json(url: str, params: Dict, timeout: float) -> Dict:
+    # Shared keep-alive session; skipped outright while the "wikipedia" breaker is open
+    return get_http_client().get_json("wikipedia", url, params, timeout)
+
+
+def tokens(text: str) -> set:
+    return {t for t in re.findall(r"[a-z0-9]+", text.lower()) if t not in _STOP}
+
+
+def overlap_score(query: str, summary: str) -> float:
+    """Fraction of the query's content words that appear in the summary."""
+    q = tokens(query)
+    return len(q & tokens(summary)) / len(q) if q else 0.0
+
+
+def first_sentences(summary: str, sentences: int) -> str:
+    parts = summary.strip().split(". ")
+    short = ". ".join(parts[:sentences])
+    return short if short.endswith(".") else short + "."
+
+
+class WikiLookup:
+    """
+    1. one list=search call for candidate titles,
+    2. one batched titles=A|B|C query to resolve redirects and drop missing
+       and disambiguation pages,
+    3. intro extracts fetched concurrently on a bounded pool,
+    all under one deadline; whatever has arrived by then is ranked by token overlap.
+    """
+
+    def __init__(self, api_url: str = WIKI_API_URL, max_candidates: int = 7, workers: int = 4,
+                 deadline: float = 3.0, min_score: float = 0.35,
+                 get_json: Callable[[str, Dict, float], Dict] = pooled_get_json):
+        self.api_url = api_url
+        self.max_candidates = max_candidates
+        self.workers = workers
+        self.deadline = deadline
+        self.min_score = min_score
+        self.get_json = get_json
+
+    def _remaining(self, start: float) -> float:
+        return self.deadline - (time.perf_counter() - start)
+
+    def search_titles(self, query: str, timeout: float) -> List[str]:
+        data = self.get_json(self.api_url, {
+            "action": "query", "list": "search", "srsearch": query,
+            "srlimit": self.max_candidates, "format": "json",
+        }, timeout)
+        return [hit["title"] for hit in data.get("query", {}).get("search", [])]
+
+    def resolve_titles(self, titles: List[str], timeout: float) -> List[str]:
+        data = self.get_json(self.api_url, {
+            "action": "query", "titles": "|".join(titles), "redirects": 1,
+            "prop": "pageprops", "ppprop": "disambiguation", "format": "json",
+        }, timeout)
+        pages = data.get("query", {}).get("pages", {})
+        resolved = [p["title"] for p in pages.values()
+                    if "missing" not in p and "disambiguation" not in p.get("pageprops", {})]
+        # Keep search ranking order
+        rank = {t: i for i, t in enumerate(titles)}
+        redirects = {r["to"]: r["from"] for r in data.get("query", {}).get("redirects", [])}
+        return sorted(resolved, key=lambda t: rank.get(redirects.get(t, t), len(rank)))
+
+    def fetch_summary(self, title: str, timeout: float) -> Optional[Dict]:
+        data = self.get_json(self.api_url, {
+            "action": "query", "prop": "extracts|info", "exintro": 1, "explaintext": 1,
+            "inprop": "url", "titles": title, "redirects": 1, "format": "json",
+        }, timeout)
+        for page in data.get("query", {}).get("pages", {}).values():
+            if page.get("extract"):
+                return {"title": page["title"], "summary": page["extract"],
+                        "url": page.get("fullurl", "")}
+        return None
+
+    def lookup(self, query: str, sentences: int = 5, rank: str = "overlap") -> Optional[Dict]:
+        """
+        Best {'title', 'summary', 'url'} for query, or None when Wikipedia has no good match.
+        Raises SourceUnavailable when it could not be asked (errors, or the deadline passed
+        before any page arrived), so callers don't mistake an outage for "no result".
+        rank="search" keeps the first page in search order instead of scoring overlap.
+        """
+        start = time.perf_counter()
+        try:
+            titles = self.search_titles(query, self._remaining(start))
+            if not titles:
+                return None
+            if self._remaining(start) <= 0:
+                raise SourceUnavailable("wikipedia: deadline passed after search")
+            titles = self.resolve_titles(titles, self._remaining(start))
+        except SourceUnavailable:
+            raise
+        except Exception as e:
+            raise SourceUnavailable(f"wikipedia: {e}") from e
+        if not titles:
+            return None
+
+        pool = _get_pool(self.workers)
+        pending = {pool.submit(self.fetch_summary, t, max(self._remaining(start), 0.1)) for t in titles}
+        pages, errors, answered = [], [], 0
+        while pending and self._remaining(start) > 0:
+            done, pending = wait(pending, timeout=self._remaining(start), return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    page = future.result()
+                except Exception as e:
+                    errors.append(e)
+                    continue
+                answered += 1
+                if page:
+                    pages.append(page)
+        for future in pending:
+            future.cancel()
+        if not answered:
+            raise SourceUnavailable(f"wikipedia: no page fetched ({errors[0] if errors else 'deadline'})")
+
+        if rank == "search":
+            order = {t: i for i, t in enumerate(titles)}
+            pages.sort(key=lambda p: order.get(p["title"], len(order)))
+            return {**pages[0], "summary": first_sentences(pages[0]["summary"], sentences)} if pages else None
+        best, best_score = None, 0.0
+        for page in pages:
+            score = overlap_score(query, page["summary"])
+            if score > best_score:
+                best, best_score = page, score
+        if best is None or best_score < self.min_score:
+            return None
+        return {**best, "summary": first_sentences(best["summary"], sentences)}
+
+
+_default_lookup: Optional[WikiLookup] = None
+
+
+def get_wiki_lookup() -> WikiLookup:
+    global _default_lookup
+    if _default_lookup is None:
+        _default_lookup = WikiLookup()
+    return _default_lookup
+
+
+# --- Local stub server ---
+def _stub_server():
+    """A MediaWiki-shaped stub on 127.0.0.1 answering search/resolve/extract queries."""
+    import json
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import parse_qs, urlparse
+
+    articles = {
+        "Nurse": "A nurse is a health care professional who cares for patients. Nurses work in hospitals.",
+        "Nursing": "Nursing is a profession within the health care sector focused on the care of patients.",
+        "Nurse (disambiguation)": "Nurse may refer to several things.",
+    }
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            q = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+            if q.get("list") == "search":
+                body = {"query": {"search": [{"title": t} for t in articles]}}
+            elif q.get("prop") == "pageprops":
+                pages = {}
+                for i, t in enumerate(q["titles"].split("|")):
+                    page = {"title": t}
+                    if "disambiguation" in t:
+                        page["pageprops"] = {"disambiguation": ""}
+                    pages[str(i)] = page
+                body = {"query": {"pages": pages}}
+            else:
+                t = q["titles"]
+                time.sleep(0.05)
+                body = {"query": {"pages": {"1": {"title": t, "extract": articles.get(t, ""),
+                                                   "fullurl": f"https://example.org/wiki/{t}"}}}}
+            payload = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    import sys
+
+    if "--selftest" in sys.argv:
+        server = _stub_server()
+        lookup = WikiLookup(api_url=f"http://127.0.0.1:{server.server_address[1]}/w/api.php")
+        start = time.perf_counter()
+        result = lookup.lookup("what does a nurse do in hospitals")
+        print(f"{(time.perf_counter() - start) * 1e3:.0f} ms ->", result)
+        server.shutdown()
+    else:
+        print(get_wiki_lookup().lookup(" ".join(sys.argv[1:]) or "data scientist"))
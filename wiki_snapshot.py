@@ -0,0 +1,76 @@
+# wiki_snapshot.py
+# Offline Wikipedia summaries for knowledge-base careers (built by build_wiki_snapshot.py).
+import gzip
+import os
+import pickle
+import re
+import threading
+from typing import Any, Dict, Optional
+
+from wiki_lookup import first_sentences
+
+SNAPSHOT_FILE = os.environ.get("WIKI_SNAPSHOT_PATH", "wiki_snapshot.pkl.gz")
+
+
+# "what is a X", "what does an X do", "tell me about the X", ...: the only queries a
+# career's intro actually answers (not "X salary in india")
+_DEFINITIONAL = re.compile(
+    r"^(?:(?:what|who)\s+(?:is|are|does|do)|tell me about|define|explain|describe|meaning of|definition of)"
+    r"\s+(?:an?\s+|the\s+)?(?P<subject>.+?)(?:\s+(?:do|does|mean|means))?$")
+
+
+def _key(text: str) -> str:
+    return " ".join(re.sub(r"[^\w\s]", " ", text.lower()).split())
+
+
+class WikiSnapshot:
+    """
+    articles: {title: {'title', 'summary', 'url'}}; aliases: {lowercase name: title}.
+    A query is answered only if it is exactly an alias or asks what one is
+    ("what is a data scientist?"); other questions that merely mention a
+    career go on to the remote sources. Punctuation is ignored. Everything is
+    in memory; a missing file gives an empty snapshot that never answers.
+    """
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None):
+        data = data or {}
+        self.version: str = data.get("version", "empty")
+        self.articles: Dict[str, Dict[str, str]] = data.get("articles", {})
+        self.aliases: Dict[str, str] = {_key(a): t for a, t in data.get("aliases", {}).items()}
+
+    def __len__(self):
+        return len(self.articles)
+
+    def lookup(self, query: str, sentences: int = 5) -> Optional[Dict[str, str]]:
+        key = _key(query)
+        title = self.aliases.get(key)
+        match = _DEFINITIONAL.match(key) if title is None else None
+        if match:
+            subject = match.group("subject")
+            # "what do nurses do" -> nurse
+            title = self.aliases.get(subject) or self.aliases.get(subject[:-1] if subject.endswith("s") else "")
+        if title is None or title not in self.articles:
+            return None
+        page = self.articles[title]
+        return {**page, "summary": first_sentences(page["summary"], sentences)}
+
+
+def load_snapshot(path: str = SNAPSHOT_FILE) -> WikiSnapshot:
+    if not os.path.exists(path):
+        return WikiSnapshot()
+    with gzip.open(path, "rb") as f:
+        return WikiSnapshot(pickle.load(f))
+
+
+_snapshot: Optional[WikiSnapshot] = None
+_lock = threading.Lock()
+
+
+def get_wiki_snapshot() -> WikiSnapshot:
+    """Load the snapshot once per process."""
+    global _snapshot
+    if _snapshot is None:
+        with _lock:
+            if _snapshot is None:
+                _snapshot = load_snapshot()
+    return _snapshot